@@ -1,12 +1,19 @@
 
 import streamlit as st
 from utils.network_builder import NetworkBuilder
-from utils.pressure_temp_converter import PressureTemperatureConverter
 from utils.system_pressure_checker import system_pressure_check, system_pressure_check_double_riser
+from utils.shared_props import PROPS, PROPS_SUP, DENS, VISC, CONV, ENTROPIES, ENTHALPIES
+from utils.friction_calculations import pipe_roughness
+from utils.oil_return_checker import (
+    R23_LIKE, check_oil_return, compute_mass_flows, compute_mor_factors, compute_oil_return,
+    get_velocity1_prop, mor_final,
+)
 import pandas as pd
 import math
 import bisect
 import numpy as np
+from functools import lru_cache, partial
+from dataclasses import dataclass
 
 def material_to_pipe_index(material: str) -> int:
     m = (material or "").strip().lower()
@@ -91,9 +98,7 @@ def render_pressure_result(result: dict):
                 st.error("FAIL")
 
 def get_dimensions_for_row(material_df, size_inch: str, gauge: int | None):
-    rows = material_df[
-        material_df["Nominal Size (inch)"].astype(str).str.strip() == str(size_inch)
-    ]
+    rows = material_df[material_df["Nominal Size (inch)"] == str(size_inch)]
 
     if rows.empty:
         raise ValueError(f"No pipe data for size {size_inch}")
@@ -134,7 +139,7 @@ def pressure_checker_inputs(
     if refrigerant == "R744":
         default_high_dt = 25.0
         default_low_dt = 25.0
-    elif refrigerant in ("R23", "R508B"):
+    elif refrigerant in R23_LIKE:
         default_high_dt = 10.0
         default_low_dt = 10.0
     elif dp_standard == "BS EN 378":
@@ -148,7 +153,7 @@ def pressure_checker_inputs(
     if refrigerant == "R744":
         range_min_low, range_max_low = -20.0, 25.0
         range_min_high, range_max_high = 0.0, 25.0
-    elif refrigerant in ("R23", "R508B"):
+    elif refrigerant in R23_LIKE:
         range_min_low, range_max_low = -60.0, 10.0
         range_min_high, range_max_high = -30.0, 10.0
     else:
@@ -166,8 +171,464 @@ def pressure_checker_inputs(
         "range_max_high": range_max_high,
     }
 
+REFRIGERANTS = (
+    "R404A", "R134a", "R407F", "R744", "R744 TC", "R410A",
+    "R407C", "R507A", "R448A", "R449A", "R22", "R32", "R454A", "R454C", "R455A", "R407A",
+    "R290", "R1270", "R600a", "R717", "R1234ze", "R1234yf", "R12", "R11", "R454B", "R450A", "R513A", "R23", "R508B", "R502",
+)
+# Converters work on saturation tables only, so the transcritical option is excluded
+SATURATED_REFRIGERANTS = tuple(r for r in REFRIGERANTS if r != "R744 TC")
+
+# Copper and aluminium are not compatible with ammonia
+R717_EXCLUDED_MATERIALS = frozenset({"Copper ASTM", " Copper EN12735", "K65 Copper", "Reflok Aluminium"})
+
+# Pipe-table columns used by the vectorised size sweep, in column order of the sweep array
+SWEEP_COLS = ["ID_mm", "SRB", "LRB", "BALL", "GLOBE"]
+
+# (min, max, default) for evaporating, max liquid and min liquid temperatures
+OIL_RETURN_RANGES = {
+    "R23": ((-100.0, -20.0, -80.0), (-100.0, 10.0, -30.0), (-100.0, 10.0, -40.0)),
+    "R508B": ((-100.0, -20.0, -80.0), (-100.0, 10.0, -30.0), (-100.0, 10.0, -40.0)),
+    "R744": ((-50.0, 20.0, -10.0), (-50.0, 30.0, 15.0), (-50.0, 30.0, 10.0)),
+    "_default": ((-50.0, 30.0, -10.0), (-50.0, 60.0, 40.0), (-50.0, 60.0, 20.0)),
+}
+
+# (min, max, default) for evaporating, condensing and max liquid temperatures
+SYSTEM_TEMP_RANGES = {
+    "R23": ((-100.0, -20.0, -80.0), (-100.0, 10.0, -30.0), (-100.0, 10.0, -40.0)),
+    "R508B": ((-100.0, -20.0, -80.0), (-100.0, 10.0, -30.0), (-100.0, 10.0, -40.0)),
+    "R744": ((-50.0, 20.0, -10.0), (-23.0, 30.0, 15.0), (-50.0, 30.0, 10.0)),
+    "_default": ((-50.0, 30.0, -10.0), (-23.0, 60.0, 43.0), (-50.0, 60.0, 40.0)),
+}
+
+# (high side, low side) default design temperatures for the System Pressure Checker.
+# Refrigerant entries take precedence over the design pressure standard.
+DESIGN_TEMP_DEFAULTS = {
+    "R744": (25.0, 25.0),
+    "R23": (10.0, 10.0),
+    "R508B": (10.0, 10.0),
+    "BS EN 378": (55.0, 32.0),
+    "ASME B31.5 - 2006": (50.0, 27.0),
+}
+
+# ((low min, low max), (high min, high max)) design temperature ranges
+DESIGN_TEMP_RANGES = {
+    "R744": ((-20.0, 25.0), (0.0, 25.0)),
+    "R23": ((-60.0, 10.0), (-30.0, 10.0)),
+    "R508B": ((-60.0, 10.0), (-30.0, 10.0)),
+    "_default": ((20.0, 50.0), (25.0, 60.0)),
+}
+
+def _nps_series_to_mm(nps: pd.Series) -> pd.Series:
+    # Nominal pipe size strings ("1-1/8", '1"', "3/8") to mm, column-wise:
+    # whole inches plus an optional trailing fraction
+    s = nps.astype(str).str.replace('"', '', regex=False).str.strip()
+    whole = s.str.extract(r'^(\d+)(?:-|$)')[0].astype(float)
+    frac = s.str.extract(r'(\d+)/(\d+)$').astype(float)
+    frac_in = frac[0] / frac[1]
+    mm = (whole.fillna(0.0) + frac_in.fillna(0.0)) * 25.4
+    return mm.where(whole.notna() | frac_in.notna())
+
+def _closest_size_index(target_mm: float, mm_arr: np.ndarray) -> int:
+    # Position of the nominal size nearest target_mm (first one on ties)
+    return int(np.abs(mm_arr - target_mm).argmin()) if mm_arr.size else 0
+
+def _smallest_passing(passing: np.ndarray, mm_arr: np.ndarray) -> int | None:
+    # Position of the smallest nominal size flagged in `passing` (first one on ties), or None
+    idx = np.flatnonzero(passing)
+    return int(idx[np.argmin(mm_arr[idx])]) if idx.size else None
+
+@lru_cache(maxsize=None)
+def _pipe_geom(ID_mm: float) -> tuple[float, float]:
+    # Internal diameter (m) and flow area (m²) for a pipe ID given in mm
+    ID_m = ID_mm / 1000.0
+    return ID_m, math.pi * (ID_m / 2) ** 2
+
+def _serghides(reynolds: float, eps: float, ID_m: float) -> float:
+    # Explicit Serghides solution of Colebrook for turbulent flow (within ~0.003%)
+    # Works elementwise on NumPy arrays as well as on scalars
+    rr = eps / (3.7 * ID_m)
+    A = -2.0 * np.log10(rr + 12.0 / reynolds)
+    B = -2.0 * np.log10(rr + 2.51 * A / reynolds)
+    C = -2.0 * np.log10(rr + 2.51 * B / reynolds)
+    d = B - A
+    return (A - d * d / (C - 2.0 * B + A)) ** -2
+
+def _reclamp_temps():
+    # Keep min liquid ≤ max liquid and evaporating ≤ min liquid (widget-backed state)
+    ss = st.session_state
+    ss.minliq_temp = min(ss.minliq_temp, ss.maxliq_temp)
+    ss.evap_temp = min(ss.evap_temp, ss.minliq_temp)
+
+def _clamp_cond_temps(cond_max):
+    # Keep evaporating ≤ condensing ≤ cond_max against values carried over from
+    # other modes; state is only written back when a clamp actually moves it.
+    ss = st.session_state
+    cond = min(max(ss.cond_temp, ss.maxliq_temp, ss.evap_temp), cond_max)
+    if cond != ss.cond_temp:
+        ss.cond_temp = cond
+    evap = min(ss.maxliq_temp, ss.cond_temp, ss.evap_temp)
+    if evap != ss.evap_temp:
+        ss.evap_temp = evap
+
+@st.cache_data(show_spinner=False)
+def _load_pipe_data():
+    # Parsed once per process; callers must .copy() before mutating slices.
+    # Material/Gauge are categorical so their sorted option lists come straight
+    # from the categories instead of a unique() scan of every row. Nominal sizes
+    # are stripped here once, so equality filters are plain category compares.
+    df = pd.read_csv("data/pipe_pressure_ratings_full.csv")
+    df["Material"] = df["Material"].astype("category")
+    df["Nominal Size (inch)"] = df["Nominal Size (inch)"].str.strip().astype("category")
+    if "Gauge" in df.columns:
+        df["Gauge"] = df["Gauge"].astype("category")
+    # Numeric pipe columns are coerced once here rather than per row access
+    numeric_cols = [c for c in SWEEP_COLS if c in df.columns]
+    df[numeric_cols] = df[numeric_cols].astype("float64")
+    return df
+
+@st.cache_data(show_spinner=False)
+def _oil_return_results(*args):
+    return compute_oil_return(*args)
+
+@st.cache_resource(show_spinner=False)
+def _pipe_index():
+    # Per-material lookups derived from the static pipe table, built once so
+    # widget reruns only index dicts instead of re-filtering the DataFrame.
+    # Held as a shared resource (no per-call unpickling); callers treat it as read-only.
+    pipe_data = _load_pipe_data()
+
+    materials_sorted = sorted(pipe_data["Material"].cat.categories)
+    by_material = {}
+    sizes_by_material = {}
+    mm_by_material = {}
+    mm_arr_by_material = {}
+    gauges_by_material_size = {}
+    rows_by_material_size = {}
+    first_row_by_material_size = {}
+    row_by_material_size_gauge = {}
+    sweep_arr_by_material = {}
+    size_pos_by_material = {}
+    sweep_arr_by_material_gauge = {}
+
+    for material in materials_sorted:
+        # Boolean-mask selection already yields a new frame, and nothing below
+        # writes into it, so no defensive copy is needed.
+        material_df = pipe_data[pipe_data["Material"] == material]
+
+        sizes_df = (
+            material_df[["Nominal Size (inch)", "Nominal Size (mm)"]]
+            .dropna(subset=["Nominal Size (inch)"])
+            .drop_duplicates(subset=["Nominal Size (inch)"], keep="first")
+        )
+
+        # make sure we have a numeric mm per nominal (fallback: parse the inch string)
+        sizes_df["mm_num"] = pd.to_numeric(sizes_df.get("Nominal Size (mm)"), errors="coerce")
+        sizes_df["mm_num"] = sizes_df["mm_num"].fillna(_nps_series_to_mm(sizes_df["Nominal Size (inch)"]))
+
+        pipe_sizes = sizes_df["Nominal Size (inch)"].tolist()
+
+        size_keys = material_df["Nominal Size (inch)"]
+        for size in pipe_sizes:
+            rows = material_df[size_keys == size]
+            rows_by_material_size[(material, size)] = rows
+            first_row_by_material_size[(material, size)] = rows.iloc[0]
+            if "Gauge" in rows.columns and rows["Gauge"].notna().any():
+                gauges_by_material_size[(material, size)] = sorted(rows["Gauge"].dropna().unique())
+                # first row per gauge, matching rows[rows["Gauge"] == g].iloc[0]
+                for _, row in rows.iterrows():
+                    if pd.notna(row["Gauge"]):
+                        row_by_material_size_gauge.setdefault((material, size, row["Gauge"]), row)
+            else:
+                gauges_by_material_size[(material, size)] = []
+
+        by_material[material] = material_df
+        sizes_by_material[material] = pipe_sizes
+        mm_by_material[material] = dict(zip(sizes_df["Nominal Size (inch)"], sizes_df["mm_num"]))
+        mm_arr_by_material[material] = sizes_df["mm_num"].to_numpy(dtype=float)
+
+        # ID and K-factors of the first row per size, aligned with pipe_sizes,
+        # so size sweeps gather plain float rows instead of pandas Series
+        sweep_arr_by_material[material] = (
+            material_df.loc[sizes_df.index]
+            .reindex(columns=SWEEP_COLS)
+            .to_numpy(dtype=float)
+        )
+        size_pos_by_material[material] = {size: i for i, size in enumerate(pipe_sizes)}
+
+        # Same array with each gauge's row swapped in where a size offers that gauge
+        for gauge in sorted({g for size in pipe_sizes for g in gauges_by_material_size[(material, size)]}):
+            gauge_arr = sweep_arr_by_material[material].copy()
+            for i, size in enumerate(pipe_sizes):
+                row = row_by_material_size_gauge.get((material, size, gauge))
+                if row is not None:
+                    gauge_arr[i] = row.reindex(SWEEP_COLS).to_numpy(dtype=float)
+            sweep_arr_by_material_gauge[(material, gauge)] = gauge_arr
+
+    return {
+        "materials_sorted": materials_sorted,
+        "by_material": by_material,
+        "sizes_by_material": sizes_by_material,
+        "mm_by_material": mm_by_material,
+        "mm_arr_by_material": mm_arr_by_material,
+        "gauges_by_material_size": gauges_by_material_size,
+        "rows_by_material_size": rows_by_material_size,
+        "first_row_by_material_size": first_row_by_material_size,
+        "row_by_material_size_gauge": row_by_material_size_gauge,
+        "sweep_arr_by_material": sweep_arr_by_material,
+        "size_pos_by_material": size_pos_by_material,
+        "sweep_arr_by_material_gauge": sweep_arr_by_material_gauge,
+    }
+
+def _sweep_rows(pipe_lookup, material, sizes, gauge=None):
+    # [ID_mm, SRB, LRB, BALL, GLOBE] per size, gathered from the load-time sweep
+    # arrays; a selected gauge uses its own rows where the size offers it
+    sweep_arr = pipe_lookup["sweep_arr_by_material"][material]
+    if gauge is not None:
+        sweep_arr = pipe_lookup["sweep_arr_by_material_gauge"].get((material, gauge), sweep_arr)
+    size_pos = pipe_lookup["size_pos_by_material"][material]
+    return sweep_arr[[size_pos[str(ps)] for ps in sizes]]
+
+def _pipe_row_for_size(pipe_lookup, material, size_inch, gauge=None):
+    # CSV row for a nominal size, the given gauge's row when the size offers it;
+    # None when the size is not in the material's table
+    key = (material, str(size_inch))
+    if gauge is not None:
+        row = pipe_lookup["row_by_material_size_gauge"].get(key + (gauge,))
+        if row is not None:
+            return row
+    return pipe_lookup["first_row_by_material_size"].get(key)
+
+@dataclass(frozen=True)
+class PipeSelection:
+    material: str
+    size: str
+    gauge: object  # None when the material has no gauges
+    row: pd.Series
+    sizes: list
+    mm_map: dict
+    material_df: pd.DataFrame
+
+def _pipe_selector(pipe_lookup, refrigerant, size_col, material_col, disabled=False, size_override=None,
+                   default_size="1-1/8", material_disabled=False, size_label="Nominal Pipe Size (inch)",
+                   gauge_label="Copper Gauge", next_gauge_key="_next_gauge"):
+    # Material → nominal size → gauge widgets shared by the pipe-sizing screens.
+    # Reads the page's _pipe_index() lookup, so a rerun only touches dicts.
+    # default_size is the first-load size for  Copper EN12735 (None for no preference).
+    ss = st.session_state
+
+    # 1) Pipe material
+    with material_col:
+        if refrigerant == "R717":
+            pipe_materials = [m for m in pipe_lookup["materials_sorted"]
+                              if m not in R717_EXCLUDED_MATERIALS]
+        else:
+            pipe_materials = pipe_lookup["materials_sorted"]
+
+        selected_material = st.selectbox("Pipe Material", pipe_materials, key="material", disabled=material_disabled)
+
+    # detect material change
+    material_changed = ss.get("last_material") is not None and ss.last_material != selected_material
+    ss.last_material = selected_material
+
+    # 2) Sizes for selected material (de-duped, precomputed at load)
+    pipe_sizes = pipe_lookup["sizes_by_material"][selected_material]
+    mm_map = pipe_lookup["mm_by_material"][selected_material]
+
+    # consume any deferred selection from an Auto-select button
+    next_size = ss.pop("_next_selected_size", None)
+    if next_size in pipe_sizes:
+        ss.selected_size = next_size
+
+    # choose default index
+    default_index = 0
+    default_variants = (default_size, f'{default_size}"') if default_size else ()
+    if size_override and size_override in pipe_sizes:
+        default_index = pipe_sizes.index(size_override)
+    elif material_changed and "prev_pipe_mm" in ss:
+        default_index = _closest_size_index(ss.prev_pipe_mm, pipe_lookup["mm_arr_by_material"][selected_material])
+    elif selected_material == " Copper EN12735" and any(v in pipe_sizes for v in default_variants):
+        # first load or no previous selection → page's preferred size for  Copper EN12735
+        want = next(v for v in default_variants if v in pipe_sizes)
+        default_index = pipe_sizes.index(want)
+    elif "selected_size" in ss and ss.selected_size in pipe_sizes:
+        # if Streamlit kept the selection, use it
+        default_index = pipe_sizes.index(ss.selected_size)
+
+    with size_col:
+        selected_size = st.selectbox(
+            size_label,
+            pipe_sizes,
+            index=default_index,
+            key="selected_size",
+            disabled=disabled,
+        )
+
+    # remember the selected size in mm for next material change
+    ss.prev_pipe_mm = float(mm_map.get(selected_size, math.nan))
+
+    # 3) Gauge (if applicable)
+    selected_gauge = None
+    gauges = pipe_lookup["gauges_by_material_size"][(selected_material, selected_size)]
+    next_gauge = ss.pop(next_gauge_key, None)
+    if next_gauge is not None and next_gauge in gauges:
+        ss.gauge = next_gauge
+    if gauges:
+        with material_col:
+            selected_gauge = st.selectbox(gauge_label, gauges, key="gauge", disabled=disabled)
+        selected_pipe_row = pipe_lookup["row_by_material_size_gauge"][(selected_material, selected_size, selected_gauge)]
+    else:
+        selected_pipe_row = pipe_lookup["first_row_by_material_size"][(selected_material, selected_size)]
+
+    return PipeSelection(
+        material=selected_material,
+        size=selected_size,
+        gauge=selected_gauge,
+        row=selected_pipe_row,
+        sizes=pipe_sizes,
+        mm_map=mm_map,
+        material_df=pipe_lookup["by_material"][selected_material],
+    )
+
+@dataclass(frozen=True)
+class SuctionState:
+    # Suction-line quantities that do not depend on the pipe bore
+    h_in: float
+    h_inmin: float
+    mass_flow_kg_s: float
+    mass_flow_kg_smin: float
+    mass_flow_foroil: float
+    mass_flow_foroilmin: float
+    density: float
+    density_super2: float
+    density_foroil: float
+    velocity1_prop: float
+    viscosity_final: float
+    evappres: float
+    mor_factors: dict
+
+def _suction_state(refrigerant, T_evap, T_cond, minliq_temp, superheat_K, max_penalty,
+                   evap_capacity_kw, gc_max_pres=None, gc_min_pres=None):
+    # Computed once and shared by every candidate size in a pipe sweep
+    flows = compute_mass_flows(
+        refrigerant, T_evap, T_cond, minliq_temp, superheat_K, evap_capacity_kw,
+        gc_max_pres, gc_min_pres,
+    )
+
+    # Transcritical CO2 uses the subcritical R744 tables on the suction side
+    ref = "R744" if refrigerant == "R744 TC" else refrigerant
+    T_evap_K = T_evap + 273.15
+    T_evap_pen_K = T_evap - max_penalty + 273.15
+    sh_mid = (superheat_K + 5) / 2
+
+    density_super, density_super2a, density_super2b, density_super_foroil, density_5K = DENS.get_densities(
+        ref,
+        [T_evap_pen_K, T_evap_K, T_evap_pen_K, T_evap_K, T_evap_K],
+        [superheat_K, sh_mid, sh_mid, min(max(superheat_K, 5), 30), 5],
+    )
+    density_sat = PROPS.get_properties(ref, T_evap)["density_vapor"]
+
+    visc = VISC
+    viscosity = (visc.get_viscosity(ref, T_evap_pen_K, superheat_K) + visc.get_viscosity(ref, T_evap_K, 5)) / 2
+    viscosity_super2 = (visc.get_viscosity(ref, T_evap_K, sh_mid) + visc.get_viscosity(ref, T_evap_pen_K, sh_mid)) / 2
+
+    velocity1_prop = get_velocity1_prop(refrigerant, superheat_K)
+
+    return SuctionState(
+        h_in=flows["h_in"],
+        h_inmin=flows["h_inmin"],
+        mass_flow_kg_s=flows["mass_flow_kg_s"],
+        mass_flow_kg_smin=flows["mass_flow_kg_smin"],
+        mass_flow_foroil=flows["mass_flow_foroil"],
+        mass_flow_foroilmin=flows["mass_flow_foroilmin"],
+        density=(density_super + density_5K) / 2,
+        density_super2=(density_super2a + density_super2b) / 2,
+        density_foroil=(density_super_foroil + density_sat) / 2,
+        velocity1_prop=velocity1_prop,
+        viscosity_final=(viscosity * velocity1_prop) + (viscosity_super2 * (1 - velocity1_prop)),
+        evappres=CONV.temp_to_pressure(ref, T_evap),
+        mor_factors=compute_mor_factors(
+            refrigerant, T_evap, T_cond, minliq_temp, superheat_K, flows["h_in"], flows["h_inmin"],
+        ),
+    )
+
+def _suction_sweep(state, ID_m, area_m2, K, fitting_counts, eps, L, PLF):
+    # Numeric core of the dry-suction size sweep: plain NumPy over an array of bores,
+    # with every refrigerant-dependent quantity already resolved into `state`.
+    # K is (n_sizes, 4) [SRB, LRB, BALL, GLOBE]; fitting_counts is the matching
+    # [B_SRB, B_LRB, ball, globe] vector. Returns (MORfinal, dp_total_kPa) arrays.
+    velocity1_prop = state.velocity1_prop
+
+    v1 = state.mass_flow_kg_s / (area_m2 * state.density)
+    v2 = state.mass_flow_kg_s / (area_m2 * state.density_super2)
+    v1min = state.mass_flow_kg_smin / (area_m2 * state.density)
+    v2min = state.mass_flow_kg_smin / (area_m2 * state.density_super2)
+
+    velocity_m_s = (v1 * velocity1_prop) + (v2 * (1 - velocity1_prop))
+    velocity_m_smin = (v1min * velocity1_prop) + (v2min * (1 - velocity1_prop))
+    velocity_m_sfinal = np.maximum(velocity_m_s, velocity_m_smin)
+
+    MORfinal = mor_final(
+        state.mor_factors, ID_m, area_m2,
+        state.density_foroil, state.mass_flow_foroil, state.mass_flow_foroilmin,
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # density for Reynolds uses velocity_m_s, not the final velocity
+        density_recalc = np.where(
+            velocity_m_s > 0, state.mass_flow_kg_s / (velocity_m_s * area_m2), state.density
+        )
+        reynolds = (density_recalc * velocity_m_sfinal * ID_m) / (state.viscosity_final / 1_000_000)
+        f = np.where(reynolds < 2000.0, 64.0 / np.maximum(reynolds, 1e-9), _serghides(reynolds, eps, ID_m))
+
+    q_kPa = 0.5 * density_recalc * (velocity_m_sfinal ** 2) / 1000.0
+
+    # pipe friction + PLF + fittings/valves share the dynamic pressure factor
+    dp_total_kPa = q_kPa * (f * (L / ID_m) + PLF + K @ fitting_counts)
+
+    return MORfinal, dp_total_kPa
+
+def _liquid_line_dp(mass_flow_kg_s, density, viscosity, ID_m, area_m2, K, fitting_counts, eps, L, PLF):
+    # Single-phase line pressure drops for one bore or an array of bores, shared by
+    # the Liquid page and the Liquid/Discharge/Pumped auto-select sweeps. K is
+    # [SRB, LRB, BALL, GLOBE] per bore; fitting_counts is the matching
+    # [B_SRB, B_LRB, ball, globe] vector.
+    # Returns (dp_pipe, dp_fittings, dp_valves, dp_plf) in kPa.
+    velocity_m_s = mass_flow_kg_s / (area_m2 * density)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        reynolds = (density * velocity_m_s * ID_m) / (viscosity / 1_000_000)
+        # laminar vs explicit Colebrook
+        f = np.where(reynolds < 2000.0, 64.0 / reynolds, _serghides(reynolds, eps, ID_m))
+
+    # dynamic (velocity) pressure, kPa
+    q_kPa = 0.5 * density * (velocity_m_s ** 2) / 1000.0
+
+    return (
+        f * (L / ID_m) * q_kPa,
+        q_kPa * (K[..., :2] @ fitting_counts[:2]),
+        q_kPa * (K[..., 2:] @ fitting_counts[2:]),
+        q_kPa * PLF,
+    )
+
+def _liquid_dp_for_sizes(pipe_lookup, material, gauge, sizes, mass_flow_kg_s, density, viscosity,
+                         fitting_counts, eps, L, PLF):
+    # Total single-phase line dp (kPa) per size for the Liquid, Discharge and
+    # Pumped Liquid auto-selects. Properties, mass flow and fitting counts are
+    # size-independent, so only the bore and K-factors vary and the sweep is one
+    # array pass. NaN where a size has no usable row.
+    rows = _sweep_rows(pipe_lookup, material, sizes, gauge)
+
+    ID_m_arr = rows[:, 0] / 1000.0
+    area_arr = math.pi * (ID_m_arr / 2) ** 2
+
+    dp_pipe_arr, dp_fit_arr, dp_valves_arr, dp_plf_arr = _liquid_line_dp(
+        mass_flow_kg_s, density, viscosity, ID_m_arr, area_arr, rows[:, 1:], fitting_counts, eps, L, PLF,
+    )
+    return dp_pipe_arr + dp_fit_arr + dp_valves_arr + dp_plf_arr
+
 # Make metric numbers & labels smaller
-st.markdown("""
+_CSS_BLOCK = """
 <style>
 /* number */
 div[data-testid="stMetricValue"] > div {
@@ -184,7 +645,15 @@ div[data-testid="stMetricDelta"] > div {
     height: 14px; width: 14px; font-size: 14px;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource(show_spinner=False)
+def _inject_css():
+    # Streamlit replays the cached markdown element on later reruns
+    st.markdown(_CSS_BLOCK, unsafe_allow_html=True)
+    return True
+
+_inject_css()
 
 st.set_page_config(page_title="Micropipe - Refrigeration Pipe Sizing", layout="wide")
 st.title("MicroPipe")
@@ -210,7 +679,8 @@ st.sidebar.image("assets/logo.png", use_container_width=True)
 
 def system_pressure_checker_ui():
 
-    pipe_data = pd.read_csv("data/pipe_pressure_ratings_full.csv")
+    pipe_data = _load_pipe_data()
+    pipe_lookup = _pipe_index()
 
     required_cols = {"Material", "Nominal Size (inch)", "Nominal Size (mm)", "ID_mm"}
     missing = required_cols - set(pipe_data.columns)
@@ -226,11 +696,7 @@ def system_pressure_checker_ui():
 
         st.markdown("### System Pressure Checker")
     
-        refrigerant = st.selectbox("Refrigerant", [
-            "R404A", "R134a", "R407F", "R744", "R744 TC", "R410A",
-            "R407C", "R507A", "R448A", "R449A", "R22", "R32", "R454A", "R454C", "R455A", "R407A",
-            "R290", "R1270", "R600a", "R717", "R1234ze", "R1234yf", "R12", "R11", "R454B", "R450A", "R513A", "R23", "R508B", "R502"
-        ])
+        refrigerant = st.selectbox("Refrigerant", REFRIGERANTS)
 
         circuit = st.selectbox(
             "Circuit Type",
@@ -261,34 +727,13 @@ def system_pressure_checker_ui():
                 index=0,
             )
 
-        if refrigerant == "R744":
-            default_high_dt = 25.0
-            default_low_dt = 25.0
-        elif refrigerant in ("R23", "R508B"):
-            default_high_dt = 10.0
-            default_low_dt = 10.0
-        elif dp_standard == "BS EN 378":
-            default_high_dt = 55.0
-            default_low_dt = 32.0
-        else:
-            default_high_dt = 50.0
-            default_low_dt = 27.0
-
-        if refrigerant == "R744":
-            range_min_low = -20.0
-            range_max_low = 25.0
-            range_min_high = 0.0
-            range_max_high = 25.0
-        elif refrigerant in ("R23", "R508B"):
-            range_min_low = -60.0
-            range_max_low = 10.0
-            range_min_high = -30.0
-            range_max_high = 10.0
-        else:
-            range_min_low = 20.0
-            range_max_low = 50.0
-            range_min_high = 25.0
-            range_max_high = 60.0
+        default_high_dt, default_low_dt = DESIGN_TEMP_DEFAULTS.get(
+            refrigerant, DESIGN_TEMP_DEFAULTS[dp_standard]
+        )
+        (
+            (range_min_low, range_max_low),
+            (range_min_high, range_max_high),
+        ) = DESIGN_TEMP_RANGES.get(refrigerant, DESIGN_TEMP_RANGES["_default"])
         
         r744_tc_pressure_bar_g = None
         if refrigerant == "R744 TC":
@@ -345,7 +790,7 @@ def system_pressure_checker_ui():
             disabled=True
         )
     
-        pipe_materials = sorted(pipe_data["Material"].dropna().unique())
+        pipe_materials = pipe_lookup["materials_sorted"]
         selected_material = st.selectbox("Pipe Material", pipe_materials)
     
         def material_to_pipe_index(material: str) -> int:
@@ -381,18 +826,15 @@ def system_pressure_checker_ui():
         
             raise ValueError(f"Unmapped Material value: {material!r}")
 
-        def pipe_params_from_selection(material_df, size_inch: str, gauge: int | None):
-            rows = material_df[
-                material_df["Nominal Size (inch)"].astype(str).str.strip() == str(size_inch)
-            ]
-        
-            if rows.empty:
+        def pipe_params_from_selection(size_inch: str, gauge: int | None):
+            key = (selected_material, str(size_inch))
+            if key not in pipe_lookup["first_row_by_material_size"]:
                 raise ValueError(f"No pipe data for size {size_inch}")
         
-            if "Gauge" in rows.columns and gauge is not None:
-                row = rows[rows["Gauge"] == gauge].iloc[0]
+            if gauge is not None:
+                row = pipe_lookup["row_by_material_size_gauge"][key + (gauge,)]
             else:
-                row = rows.iloc[0]
+                row = pipe_lookup["first_row_by_material_size"][key]
         
             od_mm = float(row["Nominal Size (mm)"])
             id_mm = float(row["ID_mm"]) if pd.notna(row["ID_mm"]) else None
@@ -409,30 +851,28 @@ def system_pressure_checker_ui():
             )
             return
     
-        material_df = pipe_data[pipe_data["Material"] == selected_material].copy()
-        
-        material_df["Nominal Size (inch)"] = material_df["Nominal Size (inch)"].astype(str)
-        pipe_sizes = sorted(material_df["Nominal Size (inch)"].dropna().unique())
+        # sizes, gauges and rows per material come from the cached pipe index
+        pipe_sizes = sorted(pipe_lookup["sizes_by_material"][selected_material])
         
         if not double_trouble:
             selected_size = st.selectbox("Nominal Pipe Size (inch)", pipe_sizes, key="single_size")
         
-            size_df = material_df[material_df["Nominal Size (inch)"] == str(selected_size)].copy()
-            if size_df.empty:
+            size_key = (selected_material, str(selected_size))
+            if size_key not in pipe_lookup["first_row_by_material_size"]:
                 st.error("No rows found for the selected material + nominal size.")
                 return
         
             gauge = None
-            if "Gauge" in size_df.columns and size_df["Gauge"].notna().any():
-                gauges = sorted(size_df["Gauge"].dropna().unique())
+            gauges = pipe_lookup["gauges_by_material_size"][size_key]
+            if gauges:
                 if len(gauges) > 1:
                     gauge = st.selectbox("Gauge", gauges, key="single_gauge")
-                    selected_row = size_df[size_df["Gauge"] == gauge].iloc[0]
+                    selected_row = pipe_lookup["row_by_material_size_gauge"][size_key + (gauge,)]
                 else:
                     gauge = gauges[0]
-                    selected_row = size_df.iloc[0]
+                    selected_row = pipe_lookup["first_row_by_material_size"][size_key]
             else:
-                selected_row = size_df.iloc[0]
+                selected_row = pipe_lookup["first_row_by_material_size"][size_key]
         
             try:
                 od_mm = float(selected_row["Nominal Size (mm)"])
@@ -474,9 +914,8 @@ def system_pressure_checker_ui():
                 )
         
                 gauge_large = None
-                large_df = material_df[material_df["Nominal Size (inch)"] == str(large_size)]
-                if "Gauge" in large_df.columns and large_df["Gauge"].notna().any():
-                    gauges_large = sorted(large_df["Gauge"].dropna().unique())
+                gauges_large = pipe_lookup["gauges_by_material_size"].get((selected_material, str(large_size)), [])
+                if gauges_large:
                     if len(gauges_large) > 1:
                         gauge_large = st.selectbox("Large Riser Gauge", gauges_large, key="large_riser_gauge")
                     else:
@@ -491,9 +930,8 @@ def system_pressure_checker_ui():
                 )
         
                 gauge_small = None
-                small_df = material_df[material_df["Nominal Size (inch)"] == str(small_size)]
-                if "Gauge" in small_df.columns and small_df["Gauge"].notna().any():
-                    gauges_small = sorted(small_df["Gauge"].dropna().unique())
+                gauges_small = pipe_lookup["gauges_by_material_size"].get((selected_material, str(small_size)), [])
+                if gauges_small:
                     if len(gauges_small) > 1:
                         gauge_small = st.selectbox("Small Riser Gauge", gauges_small, key="small_riser_gauge")
                     else:
@@ -502,12 +940,12 @@ def system_pressure_checker_ui():
             pipe_index_large = pipe_index
             pipe_index_small = pipe_index
         
-            od_mm_large, id_mm_large = pipe_params_from_selection(material_df, large_size, gauge_large)
-            od_mm_small, id_mm_small = pipe_params_from_selection(material_df, small_size, gauge_small)
+            od_mm_large, id_mm_large = pipe_params_from_selection(large_size, gauge_large)
+            od_mm_small, id_mm_small = pipe_params_from_selection(small_size, gauge_small)
 
     from utils.system_pressure_checker import system_pressure_check
     from utils.system_pressure_checker import system_pressure_check_double_riser
-    converter = PressureTemperatureConverter()
+    converter = CONV
 
     if double_trouble:
         result = system_pressure_check_double_riser(
@@ -594,7 +1032,7 @@ def system_pressure_checker_ui():
                 st.metric("30°C", f"{design_55:.2f} bar(g)")
                 st.metric("30°C", f"{design_43:.2f} bar(g)")
                 st.metric("30°C", f"{design_43:.2f} bar(g)")
-            elif refrigerant in ("R23", "R508B"):
+            elif refrigerant in R23_LIKE:
                 st.metric("10°C", f"{design_55:.2f} bar(g)")
                 st.metric("10°C", f"{design_43:.2f} bar(g)")
                 st.metric("10°C", f"{design_43:.2f} bar(g)")
@@ -667,13 +1105,9 @@ if tool_selection == "Pipe Network Builder":
 
 elif tool_selection == "Pressure ↔ Temperature Converter":
     st.subheader("Saturation Pressure ↔ Temperature Tool")
-    converter = PressureTemperatureConverter()
+    converter = CONV
 
-    refrigerant = st.selectbox("Refrigerant", [
-        "R404A", "R134a", "R407F", "R744", "R410A",
-        "R407C", "R507A", "R448A", "R449A", "R22", "R32", "R454A", "R454C", "R455A", "R407A",
-        "R290", "R1270", "R600a", "R717", "R1234ze", "R1234yf", "R12", "R11", "R454B", "R450A", "R513A", "R23", "R508B", "R502"
-    ])
+    refrigerant = st.selectbox("Refrigerant", SATURATED_REFRIGERANTS)
     
     col1, col2, col3 = st.columns(3)
 
@@ -721,13 +1155,9 @@ elif tool_selection == "Pressure ↔ Temperature Converter":
 
 elif tool_selection == "Pressure Drop ↔ Temperature Penalty":
     st.subheader("Pressure Drop ⇄ Temperature Penalty Tool")
-    converter = PressureTemperatureConverter()
+    converter = CONV
 
-    refrigerant = st.selectbox("Refrigerant", [
-        "R404A", "R134a", "R407F", "R744", "R410A",
-        "R407C", "R507A", "R448A", "R449A", "R22", "R32", "R454A", "R454C", "R455A", "R407A",
-        "R290", "R1270", "R600a", "R717", "R1234ze", "R1234yf", "R12", "R11", "R454B", "R450A", "R513A", "R23", "R508B", "R502"
-    ])
+    refrigerant = st.selectbox("Refrigerant", SATURATED_REFRIGERANTS)
     T_sat = st.number_input("Saturation Temperature (°C)", value=-10.0)
     
     col1, col2 = st.columns(2)
@@ -764,135 +1194,39 @@ elif tool_selection == "Oil Return Checker":
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        refrigerant = st.selectbox("Refrigerant", [
-            "R404A", "R134a", "R407F", "R744", "R744 TC", "R410A",
-            "R407C", "R507A", "R448A", "R449A", "R22", "R32", "R454A", "R454C", "R455A", "R407A",
-            "R290", "R1270", "R600a", "R717", "R1234ze", "R1234yf", "R12", "R11", "R454B", "R450A", "R513A", "R23", "R508B", "R502"
-        ])
+        refrigerant = st.selectbox("Refrigerant", REFRIGERANTS)
 
     # Load pipe data
-    pipe_data = pd.read_csv("data/pipe_pressure_ratings_full.csv")
-
-    # --- helpers ---
-    def _nps_inch_to_mm(nps_str: str) -> float:
-        # e.g. "1-1/8", '1"', "3/8"
-        s = str(nps_str).replace('"', '').strip()
-        if not s:
-            return float('nan')
-        parts = s.split('-')
-        tot_in = 0.0
-        for p in parts:
-            p = p.strip()
-            if not p:
-                continue
-            if '/' in p:
-                num, den = p.split('/')
-                tot_in += float(num) / float(den)
-            else:
-                tot_in += float(p)
-        return tot_in * 25.4  # mm
+    pipe_lookup = _pipe_index()
 
     ss = st.session_state
 
-    # 1) Pipe material
-    with col2:
-        if refrigerant == "R717":
-            excluded_materials = ["Copper ASTM", " Copper EN12735", "K65 Copper", "Reflok Aluminium"]
-            pipe_materials = sorted(m for m in pipe_data["Material"].dropna().unique()
-                                    if m not in excluded_materials)
-        else:
-            pipe_materials = sorted(pipe_data["Material"].dropna().unique())
-
-        selected_material = st.selectbox("Pipe Material", pipe_materials, key="material")
-    
-    # detect material change
-    material_changed = ss.get("last_material") is not None and ss.last_material != selected_material
-    ss.last_material = selected_material
-
-    # 2) Sizes for selected material (de-duped)
-    material_df = pipe_data[pipe_data["Material"] == selected_material].copy()
-
-    sizes_df = (
-        material_df[["Nominal Size (inch)", "Nominal Size (mm)"]]
-        .dropna(subset=["Nominal Size (inch)"])
-        .assign(**{
-            "Nominal Size (inch)": lambda d: d["Nominal Size (inch)"].astype(str).str.strip(),
-        })
-        .drop_duplicates(subset=["Nominal Size (inch)"], keep="first")
+    pipe_sel = _pipe_selector(
+        pipe_lookup, refrigerant, col1, col2,
+        disabled=st.session_state.get("double_trouble", False),
     )
-
-    # make sure we have a numeric mm per nominal (fallback: parse the inch string)
-    sizes_df["mm_num"] = pd.to_numeric(sizes_df.get("Nominal Size (mm)"), errors="coerce")
-    sizes_df.loc[sizes_df["mm_num"].isna(), "mm_num"] = sizes_df.loc[sizes_df["mm_num"].isna(), "Nominal Size (inch)"].apply(_nps_inch_to_mm)
-
-    pipe_sizes = sizes_df["Nominal Size (inch)"].tolist()
-    mm_map = dict(zip(sizes_df["Nominal Size (inch)"], sizes_df["mm_num"]))
-
-    # choose default index
-    def _closest_index(target_mm: float) -> int:
-        mm_list = [mm_map[s] for s in pipe_sizes]
-        return min(range(len(mm_list)), key=lambda i: abs(mm_list[i] - target_mm)) if mm_list else 0
-
-    default_index = 0
-    if material_changed and "prev_pipe_mm" in ss:
-        default_index = _closest_index(ss.prev_pipe_mm)
-    elif selected_material == " Copper EN12735" and ("1-1/8" in pipe_sizes or '1-1/8"' in pipe_sizes):
-        # first load or no previous selection → prefer 1-1/8" for  Copper EN12735
-        want = "1-1/8" if "1-1/8" in pipe_sizes else '1-1/8"'
-        default_index = pipe_sizes.index(want)
-    elif "selected_size" in ss and ss.selected_size in pipe_sizes:
-        # if Streamlit kept the selection, use it
-        default_index = pipe_sizes.index(ss.selected_size)
-
-    disable_valves = st.session_state.get("double_trouble", False)
-    
-    with col1:
-        selected_size = st.selectbox(
-            "Nominal Pipe Size (inch)",
-            pipe_sizes,
-            index=default_index,
-            key="selected_size",
-            disabled=disable_valves,
-        )
-
-    ss.prev_pipe_mm = float(mm_map.get(selected_size, float("nan")))
-
-    # 3) Gauge (if applicable)
-    gauge_options = material_df[material_df["Nominal Size (inch)"].astype(str).str.strip() == selected_size]
-    if "Gauge" in gauge_options.columns and gauge_options["Gauge"].notna().any():
-        gauges = sorted(gauge_options["Gauge"].dropna().unique())
-        with col2:
-            selected_gauge = st.selectbox("Copper Gauge", gauges, key="gauge", disabled=disable_valves)
-        selected_pipe_row = gauge_options[gauge_options["Gauge"] == selected_gauge].iloc[0]
-    else:
-        selected_pipe_row = gauge_options.iloc[0]
+    selected_material = pipe_sel.material
+    selected_size = pipe_sel.size
+    selected_pipe_row = pipe_sel.row
+    pipe_sizes = pipe_sel.sizes
+    mm_map = pipe_sel.mm_map
 
     # Pipe parameters
     pipe_size_inch = selected_pipe_row["Nominal Size (inch)"]
     ID_mm = selected_pipe_row["ID_mm"]
 
     def gauges_for_size(size_inch: str):
-        rows = material_df[material_df["Nominal Size (inch)"].astype(str).str.strip() == str(size_inch)]
-        if "Gauge" in rows.columns and rows["Gauge"].notna().any():
-            return sorted(rows["Gauge"].dropna().unique())
-        return []
+        return pipe_lookup["gauges_by_material_size"].get((selected_material, str(size_inch)), [])
 
     with col1:
         evap_capacity_kw = st.number_input("Evaporator Capacity (kW)", min_value=0.03, max_value=20000.0, value=10.0, step=1.0)
 
         # --- Base ranges per refrigerant ---
-        if refrigerant in ("R23", "R508B"):
-            evap_min, evap_max, evap_default = -100.0, -20.0, -80.0
-            maxliq_min, maxliq_max, maxliq_default = -100.0, 10.0, -30.0
-            minliq_min, minliq_max, minliq_default = -100.0, 10.0, -40.0
-        elif refrigerant == "R744":
-            evap_min, evap_max, evap_default = -50.0, 20.0, -10.0
-            maxliq_min, maxliq_max, maxliq_default = -50.0, 30.0, 15.0
-            minliq_min, minliq_max, minliq_default = -50.0, 30.0, 10.0
-        else:
-            evap_min, evap_max, evap_default = -50.0, 30.0, -10.0
-            maxliq_min, maxliq_max, maxliq_default = -50.0, 60.0, 40.0
-            minliq_min, minliq_max, minliq_default = -50.0, 60.0, 20.0
+        (
+            (evap_min, evap_max, evap_default),
+            (maxliq_min, maxliq_max, maxliq_default),
+            (minliq_min, minliq_max, minliq_default),
+        ) = OIL_RETURN_RANGES.get(refrigerant, OIL_RETURN_RANGES["_default"])
     
         # --- Init state (widget-backed) ---
         ss = st.session_state
@@ -907,26 +1241,8 @@ elif tool_selection == "Oil Return Checker":
         ss.setdefault("minliq_temp", minliq_default)
         ss.setdefault("evap_temp",   evap_default)
     
-        if "minliq_temp" in ss and "maxliq_temp" in ss:
-            ss.minliq_temp = min(ss.maxliq_temp, ss.minliq_temp)
-    
-        if "minliq_temp" in ss and "maxliq_temp" in ss and "evap_temp" in ss:
-            ss.evap_temp = min(ss.maxliq_temp, ss.minliq_temp, ss.evap_temp)
-    
-        # --- Callbacks implementing your downstream clamping logic ---
-        def on_change_maxliq():
-            # When cond changes: clamp minliq down to cond, then evap down to minliq
-            ss.minliq_temp = min(ss.minliq_temp, ss.maxliq_temp)
-            ss.evap_temp   = min(ss.evap_temp,   ss.minliq_temp)
-    
-        def on_change_minliq():
-            # When minliq changes: clamp minliq down to cond, then evap down to minliq
-            ss.minliq_temp = min(ss.minliq_temp, ss.maxliq_temp)
-            ss.evap_temp   = min(ss.evap_temp,   ss.minliq_temp)
-    
-        def on_change_evap():
-            # When evap changes: clamp evap down to minliq
-            ss.evap_temp   = min(ss.evap_temp,   ss.minliq_temp)
+        # Stale values can survive a mode/tool switch, so clamp before the widgets too
+        _reclamp_temps()
     
         # --- Inputs with inclusive caps (≤), same order as your code ---
         if refrigerant == "R744 TC":
@@ -980,27 +1296,35 @@ elif tool_selection == "Oil Return Checker":
                 "Max Liquid Temperature (°C)",
                 min_value=maxliq_min, max_value=maxliq_max,
                 value=ss.maxliq_temp, step=1.0, key="maxliq_temp",
-                on_change=on_change_maxliq,
+                on_change=_reclamp_temps,
             )
         
             minliq_temp = st.number_input(
                 "Min Liquid Temperature (°C)",
                 min_value=minliq_min, max_value=min(maxliq_temp, minliq_max),
                 value=ss.minliq_temp, step=1.0, key="minliq_temp",
-                on_change=on_change_minliq,
+                on_change=_reclamp_temps,
             )
     
         evaporating_temp = st.number_input(
             "Evaporating Temperature (°C)",
             min_value=evap_min, max_value=min(minliq_temp, evap_max),
             value=ss.evap_temp, step=1.0, key="evap_temp",
-            on_change=on_change_evap,
+            on_change=_reclamp_temps,
         )
 
+    # Inputs without clamping callbacks are batched in a form so editing several
+    # of them costs one recalculation; the temperature/pipe widgets above stay
+    # live because forms don't allow on_change callbacks or dependent options.
     with col2:
-        superheat_K = st.number_input("Superheat (K)", min_value=0.0, max_value=60.0, value=5.0, step=1.0)
-        max_penalty = st.number_input("Max Penalty (K)", min_value=0.0, max_value=6.0, value=1.0, step=0.1)
-        required_oil_duty_pct = st.number_input("Required Oil Return Duty (%)", min_value=0.0, max_value=100.0, value=100.0, step=5.0)
+        with st.form("oil_return_inputs"):
+            superheat_K = st.number_input("Superheat (K)", min_value=0.0, max_value=60.0, value=5.0, step=1.0)
+            max_penalty = st.number_input("Max Penalty (K)", min_value=0.0, max_value=6.0, value=1.0, step=0.1)
+            required_oil_duty_pct = st.number_input("Required Oil Return Duty (%)", min_value=0.0, max_value=100.0, value=100.0, step=5.0)
+            # Double riser balancing reads max_penalty, so the mode switch commits
+            # with the limits instead of rerunning against stale ones.
+            double_trouble = st.checkbox("Double Riser Mode", key="double_trouble")
+            st.form_submit_button("Calculate")
 
     with col3:
         L = st.number_input("Pipe Length (m)", min_value=0.1, max_value=300.0, value=10.0, step=1.0, key="L", disabled=True)
@@ -1064,334 +1388,31 @@ elif tool_selection == "Oil Return Checker":
         if g_small_opts:
             gauge_small = st.selectbox("Small Riser Gauge", g_small_opts, key="gauge_small", disabled=disable_pipes)
 
-    from utils.refrigerant_properties import RefrigerantProperties
-    from utils.refrigerant_densities import RefrigerantDensities
-    from utils.refrigerant_viscosities import RefrigerantViscosities
-    from utils.supercompliq_co2 import RefrigerantProps
-    from utils.oil_return_checker import check_oil_return
-
     T_evap = evaporating_temp
     T_cond = maxliq_temp
 
-    props_sup = RefrigerantProps()
-    props = RefrigerantProperties()
-
-    if refrigerant == "R744 TC":
-        
-        h_in = props_sup.get_enthalpy_sup(gc_max_pres, maxliq_temp)
-        if gc_min_pres >= 73.8: 
-            h_inmin = props_sup.get_enthalpy_sup(gc_min_pres, minliq_temp)
-        elif gc_min_pres <= 72.13:
-            h_inmin = props.get_properties("R744", minliq_temp)["enthalpy_liquid2"]
-        else:
-            st.error("This pressure range (72.13–73.8 bar) is not allowed. Please choose another value.")
-            st.stop()
-        h_inlet = h_in
-        h_inletmin = h_inmin
-        h_evap = props.get_properties("R744", T_evap)["enthalpy_vapor"]
-        h_10K = props.get_properties("R744", T_evap)["enthalpy_super"]
-
-    else:
-        h_in = props.get_properties(refrigerant, T_cond)["enthalpy_liquid2"]
-        #st.write("h_in:", h_in)
-        # for velocity
-        h_inmin = props.get_properties(refrigerant, minliq_temp)["enthalpy_liquid2"]
-        #st.write("h_inmin:", h_inmin)
-        h_inlet = props.get_properties(refrigerant, T_cond)["enthalpy_liquid"]
-        #st.write("h_inlet:", h_inlet)
-        h_inletmin = props.get_properties(refrigerant, minliq_temp)["enthalpy_liquid"]
-        #st.write("h_inletmin:", h_inletmin)
-        h_evap = props.get_properties(refrigerant, T_evap)["enthalpy_vapor"]
-        #st.write("h_evap:", h_evap)
-        h_10K = props.get_properties(refrigerant, T_evap)["enthalpy_super"]
-        #st.write("h_10K:", h_10K)
-    
-    hdiff_10K = h_10K - h_evap
-    #st.write("hdiff_10K:", hdiff_10K)
-    hdiff_custom = hdiff_10K * min(max(superheat_K, 5), 30) / 10
-    #st.write("hdiff_custom:", hdiff_custom)
-    h_super = h_evap + hdiff_custom
-    #st.write("h_super:", h_super)
-    h_foroil = (h_evap + h_super) / 2
-    #st.write("h_foroil:", h_foroil)
-    
-    delta_h = h_evap - h_in
-    #st.write("delta_h:", delta_h)
-    delta_hmin = h_evap - h_inmin
-    #st.write("delta_hmin:", delta_hmin)
-    
-    delta_h_foroil = h_foroil - h_inlet
-    #st.write("delta_h_foroil:", delta_h_foroil)
-    delta_h_foroilmin = h_foroil - h_inletmin
-    #st.write("delta_h_foroilmin:", delta_h_foroilmin)
-
-    mass_flow_kg_s = evap_capacity_kw / delta_h if delta_h > 0 else 0.01
-    #st.write("mass_flow_kg_s:", mass_flow_kg_s)
-    mass_flow_kg_smin = evap_capacity_kw / delta_hmin if delta_hmin > 0 else 0.01
-    #st.write("mass_flow_kg_smin:", mass_flow_kg_smin)
-    M_total = max(mass_flow_kg_s, mass_flow_kg_smin)
-
-    mass_flow_foroil = evap_capacity_kw / delta_h_foroil if delta_h_foroil > 0 else 0.01
-    #st.write("mass_flow_foroil:", mass_flow_foroil)
-    mass_flow_foroilmin = evap_capacity_kw / delta_h_foroilmin if delta_h_foroilmin > 0 else 0.01
-    #st.write("mass_flow_foroilmin:", mass_flow_foroilmin)
-
-    # Calculate velocity for transparency
-    if ID_mm is not None:
-        ID_m = ID_mm / 1000.0
-        #st.write("ID_mm:", ID_mm)
-        #st.write("ID_m:", ID_m)
-        area_m2 = math.pi * (ID_m / 2) ** 2
-        #st.write("area_m2:", area_m2)
-
-        if refrigerant == "R744 TC":
-            density_super = RefrigerantDensities().get_density("R744", T_evap - max_penalty + 273.15, superheat_K)
-            density_super2a = RefrigerantDensities().get_density("R744", T_evap + 273.15, ((superheat_K + 5) / 2))
-            density_super2b = RefrigerantDensities().get_density("R744", T_evap - max_penalty + 273.15, ((superheat_K + 5) / 2))
-            density_super2 = (density_super2a + density_super2b) / 2
-            density_super_foroil = RefrigerantDensities().get_density("R744", T_evap + 273.15, min(max(superheat_K, 5), 30))
-            density_sat = RefrigerantProperties().get_properties("R744", T_evap)["density_vapor"]
-            density_5K = RefrigerantDensities().get_density("R744", T_evap + 273.15, 5)    
-    
-        else:
-            density_super = RefrigerantDensities().get_density(refrigerant, T_evap - max_penalty + 273.15, superheat_K)
-            #st.write("density_super:", density_super)
-            density_super2a = RefrigerantDensities().get_density(refrigerant, T_evap + 273.15, ((superheat_K + 5) / 2))
-            #st.write("density_super2a:", density_super2a)
-            density_super2b = RefrigerantDensities().get_density(refrigerant, T_evap - max_penalty + 273.15, ((superheat_K + 5) / 2))
-            #st.write("density_super2b:", density_super2b)
-            density_super2 = (density_super2a + density_super2b) / 2
-            #st.write("density_super2:", density_super2)
-            density_super_foroil = RefrigerantDensities().get_density(refrigerant, T_evap + 273.15, min(max(superheat_K, 5), 30))
-            #st.write("density_super_foroil:", density_super_foroil)
-            density_sat = RefrigerantProperties().get_properties(refrigerant, T_evap)["density_vapor"]
-            #st.write("density_sat:", density_sat)
-            density_5K = RefrigerantDensities().get_density(refrigerant, T_evap + 273.15, 5)
-            #st.write("density_5K:", density_5K)
-        
-        density = (density_super + density_5K) / 2
-        #st.write("density:", density)
-        density_foroil = (density_super_foroil + density_sat) / 2
-        #st.write("density_foroil:", density_foroil)
-        velocity_m_s1 = mass_flow_kg_s / (area_m2 * density)
-        #st.write("velocity_m_s1:", velocity_m_s1)
-        velocity_m_s1min = mass_flow_kg_smin / (area_m2 * density)
-        #st.write("velocity_m_s1min:", velocity_m_s1min)
-        velocity_m_s2 = mass_flow_kg_s / (area_m2 * density_super2)
-        #st.write("velocity_m_s2:", velocity_m_s2)
-        velocity_m_s2min = mass_flow_kg_smin / (area_m2 * density_super2)
-        #st.write("velocity_m_s2min:", velocity_m_s2min)
-        if refrigerant == "R744": velocity1_prop = 1
-        elif refrigerant == "R744 TC": velocity1_prop = 1
-        elif refrigerant == "R404A":
-            if superheat_K > 45: velocity1_prop = (0.0328330590542629 * superheat_K) - 1.47748765744183
-            else: velocity1_prop = 0
-        elif refrigerant == "R134a":
-            if superheat_K > 30: velocity1_prop = (-0.000566085879684639 * (superheat_K ** 2)) + (0.075049554857083 * superheat_K) - 1.74200935399632
-            else: velocity1_prop = 0
-        elif refrigerant == "R407F": velocity1_prop = 1
-        elif refrigerant == "R407A": velocity1_prop = 1
-        elif refrigerant == "R410A": velocity1_prop = 1
-        elif refrigerant == "R407C": velocity1_prop = 0
-        elif refrigerant == "R22": velocity1_prop = 1
-        elif refrigerant == "R502": velocity1_prop = 1
-        elif refrigerant == "R507A": velocity1_prop = 1
-        elif refrigerant == "R448A": velocity1_prop = 1
-        elif refrigerant == "R449A": velocity1_prop = 1
-        elif refrigerant == "R717": velocity1_prop = 1
-        else:
-            if superheat_K > 30: velocity1_prop = (0.0000406422632403154 * (superheat_K ** 2)) - (0.000541007136813307 * superheat_K) + 0.748882946418884
-            else: velocity1_prop = 0.769230769230769
-        # if refrigerant == "R744": velocity1_prop = (-0.0142814388381874 * max(superheat_K, 5)) + 1.07140719419094
-        # else: velocity1_prop = (-0.00280805561137312 * max(superheat_K, 5)) + 1.01404027805687
-        #st.write("velocity1_prop:", velocity1_prop)
-        velocity_m_s = (velocity_m_s1 * velocity1_prop) + (velocity_m_s2 * (1 - velocity1_prop))
-        #st.write("velocity_m_s:", velocity_m_s)
-        velocity_m_smin = (velocity_m_s1min * velocity1_prop) + (velocity_m_s2min * (1 - velocity1_prop))
-        #st.write("velocity_m_smin:", velocity_m_smin)
-        if refrigerant in ["R23", "R508B"]:
-            oil_density_sat = (-0.853841209044878 * T_evap) + 999.190772536527
-            oil_density_super = (-0.853841209044878 * (T_evap + min(max(superheat_K, 5), 30))) + 999.190772536527
-        else:
-            oil_density_sat = (-0.00356060606060549 * (T_evap ** 2)) - (0.957878787878808 * T_evap) + 963.595454545455
-            oil_density_super = (-0.00356060606060549 * ((T_evap + min(max(superheat_K, 5), 30)) ** 2)) - (0.957878787878808 * (T_evap + min(max(superheat_K, 5), 30))) + 963.595454545455
-        #st.write("oil_density_sat:", oil_density_sat)
-        #st.write("oil_density_super:", oil_density_super)
-        oil_density = (oil_density_sat + oil_density_super) / 2
-        #st.write("oil_density:", oil_density)
-        
-        if refrigerant == "R404A": jg_half = 0.860772464072673
-        elif refrigerant == "R134a": jg_half = 0.869986729796935
-        elif refrigerant == "R407F": jg_half = 0.869042493641944
-        elif refrigerant == "R744": jg_half = 0.877950613678719
-        elif refrigerant == "R744 TC": jg_half = 0.877950613678719
-        elif refrigerant == "R407A": jg_half = 0.867374311574041
-        elif refrigerant == "R410A": jg_half = 0.8904423325365
-        elif refrigerant == "R407C": jg_half = 0.858592104849471
-        elif refrigerant == "R22": jg_half = 0.860563058394146
-        elif refrigerant == "R502": jg_half = 0.858236706656266
-        elif refrigerant == "R507A": jg_half = 0.887709710291009
-        elif refrigerant == "R449A": jg_half = 0.867980496631757
-        elif refrigerant == "R448A": jg_half = 0.86578818145833
-        elif refrigerant == "R717": jg_half = 0.854957410951708
-        elif refrigerant == "R290": jg_half = 0.844975139695726
-        elif refrigerant == "R1270": jg_half = 0.849089717732815
-        elif refrigerant == "R600a": jg_half = 0.84339338979887
-        elif refrigerant == "R1234ze": jg_half = 0.867821375349728
-        elif refrigerant == "R1234yf": jg_half = 0.860767472602571
-        elif refrigerant == "R12": jg_half = 0.8735441986466
-        elif refrigerant == "R11": jg_half = 0.864493203834913
-        elif refrigerant == "R454B": jg_half = 0.869102255850291
-        elif refrigerant == "R450A": jg_half = 0.865387140496035
-        elif refrigerant == "R513A": jg_half = 0.861251244627232
-        elif refrigerant == "R454A": jg_half = 0.868161104592492
-        elif refrigerant == "R455A": jg_half = 0.865687329727713
-        elif refrigerant == "R454C": jg_half = 0.866423016875524
-        elif refrigerant == "R32": jg_half = 0.875213309852597
-        elif refrigerant == "R23": jg_half = 0.865673418568001
-        elif refrigerant == "R508B": jg_half = 0.864305626845382
-        #st.write("jg_half:", jg_half)
-        
-        MinMassFlux = (jg_half ** 2) * ((density_foroil * 9.81 * ID_m * (oil_density - density_foroil)) ** 0.5)
-        #st.write("MinMassFluxy:", MinMassFlux)
-        MinMassFlow = MinMassFlux * area_m2
-        #st.write("MinMassFlow:", MinMassFlow)
-        MOR_pre = (MinMassFlow / mass_flow_foroil) * 100
-        #st.write("MOR_pre:", MOR_pre)
-        MOR_premin = (MinMassFlow / mass_flow_foroilmin) * 100
-        #st.write("MOR_premin:", MOR_premin)
-
-        if refrigerant in ["R23", "R508B"]:
-            MOR_correctliq = T_cond + 47.03
-        else:
-            MOR_correctliq = T_cond
-        if refrigerant in ["R23", "R508B"]:
-            MOR_correctliqmin = minliq_temp + 47.03
-        else:
-            MOR_correctliqmin = minliq_temp
-        if refrigerant in ["R23", "R508B"]:
-            evapoil = T_evap + 46.14
-        else:
-            evapoil = T_evap
-        #st.write("MOR_correctliq:", MOR_correctliq)
-        #st.write("evapoil:", evapoil)
-        if refrigerant == "R744": MOR_correction = (0.000225755013421421 * MOR_correctliq) - 0.00280879370374927
-        elif refrigerant == "R744 TC": MOR_correction = (0.0000603336117708171 * h_in) - 0.0142318718120024
-        elif refrigerant == "R407A": MOR_correction = (0.00000414431651323856 * (MOR_correctliq ** 2)) + (0.000381908525139781 * MOR_correctliq) - 0.0163450053041212
-        elif refrigerant == "R449A": MOR_correction = (0.00000414431651323856 * (MOR_correctliq ** 2)) + (0.000381908525139781 * MOR_correctliq) - 0.0163450053041212
-        elif refrigerant == "R448A": MOR_correction = (0.00000414431651323856 * (MOR_correctliq ** 2)) + (0.000381908525139781 * MOR_correctliq) - 0.0163450053041212
-        elif refrigerant == "R502": MOR_correction = (0.00000414431651323856 * (MOR_correctliq ** 2)) + (0.000381908525139781 * MOR_correctliq) - 0.0163450053041212
-        elif refrigerant == "R507A": MOR_correction = (0.000302619054048837 * MOR_correctliq) - 0.00930188913363997
-        elif refrigerant == "R22": MOR_correction = (0.000108153843367715 * MOR_correctliq) - 0.00329248681202757
-        elif refrigerant == "R407C": MOR_correction = (0.00000420322918839302 * (max(MOR_correctliq, -32.0716410083429) ** 2)) + (0.000269608915211859 * max(MOR_correctliq, -32.0716410083429)) - 0.0134546663857195
-        elif refrigerant == "R410A": MOR_correction = 0
-        elif refrigerant == "R407F": MOR_correction = (0.00000347332380289385 * (max(MOR_correctliq, -34.4346433150568) ** 2)) + (0.000239205332540693 * max(MOR_correctliq, -34.4346433150568)) - 0.0121545316131988
-        elif refrigerant == "R134a": MOR_correction = (0.000195224660107459 * MOR_correctliq) - 0.00591757011487048
-        elif refrigerant == "R404A": MOR_correction = (0.0000156507169104918 * (max(MOR_correctliq, -22.031637377024) ** 2)) + (0.000689621839324826 * max(MOR_correctliq, -22.031637377024)) - 0.0392
-        else: MOR_correction = (0.00000461020482461793 * (max(MOR_correctliq, -23.6334996273983) ** 2)) + (0.000217910548009675 * max(MOR_correctliq, -23.6334996273983)) - 0.012074621594626
-        #st.write("MOR_correction:", MOR_correction)
-
-        if refrigerant == "R744": MOR_correctionmin = (0.000225755013421421 * MOR_correctliqmin) - 0.00280879370374927
-        elif refrigerant == "R744 TC": MOR_correctionmin = (0.0000603336117708171 * h_inmin) - 0.0142318718120024
-        elif refrigerant == "R407A": MOR_correctionmin = (0.00000414431651323856 * (MOR_correctliqmin ** 2)) + (0.000381908525139781 * MOR_correctliqmin) - 0.0163450053041212
-        elif refrigerant == "R449A": MOR_correctionmin = (0.00000414431651323856 * (MOR_correctliqmin ** 2)) + (0.000381908525139781 * MOR_correctliqmin) - 0.0163450053041212
-        elif refrigerant == "R448A": MOR_correctionmin = (0.00000414431651323856 * (MOR_correctliqmin ** 2)) + (0.000381908525139781 * MOR_correctliqmin) - 0.0163450053041212
-        elif refrigerant == "R502": MOR_correctionmin = (0.00000414431651323856 * (MOR_correctliqmin ** 2)) + (0.000381908525139781 * MOR_correctliqmin) - 0.0163450053041212
-        elif refrigerant == "R507A": MOR_correctionmin = (0.000302619054048837 * MOR_correctliqmin) - 0.00930188913363997
-        elif refrigerant == "R22": MOR_correctionmin = (0.000108153843367715 * MOR_correctliqmin) - 0.00329248681202757
-        elif refrigerant == "R407C": MOR_correctionmin = (0.00000420322918839302 * (max(MOR_correctliqmin, -32.0716410083429) ** 2)) + (0.000269608915211859 * max(MOR_correctliqmin, -32.0716410083429)) - 0.0134546663857195
-        elif refrigerant == "R410A": MOR_correctionmin = 0
-        elif refrigerant == "R407F": MOR_correctionmin = (0.00000347332380289385 * (max(MOR_correctliqmin, -34.4346433150568) ** 2)) + (0.000239205332540693 * max(MOR_correctliqmin, -34.4346433150568)) - 0.0121545316131988
-        elif refrigerant == "R134a": MOR_correctionmin = (0.000195224660107459 * MOR_correctliqmin) - 0.00591757011487048
-        elif refrigerant == "R404A": MOR_correctionmin = (0.0000156507169104918 * (max(MOR_correctliqmin, -22.031637377024) ** 2)) + (0.000689621839324826 * max(MOR_correctliqmin, -22.031637377024)) - 0.0392
-        else: MOR_correctionmin = (0.00000461020482461793 * (max(MOR_correctliqmin, -23.6334996273983) ** 2)) + (0.000217910548009675 * max(MOR_correctliqmin, -23.6334996273983)) - 0.012074621594626
-        #st.write("MOR_correctionmin:", MOR_correctionmin)
-
-        if refrigerant == "R744": MOR_correction2 = (-0.0000176412848988908 * (evapoil ** 2)) - (0.00164308248808803 * evapoil) - 0.0184308798286039
-        elif refrigerant == "R744 TC": MOR_correction2 = (-0.0000176412848988908 * (evapoil ** 2)) - (0.00164308248808803 * evapoil) - 0.0184308798286039
-        elif refrigerant == "R407A": MOR_correction2 = (-0.000864076433837511 * evapoil) - 0.0145018190416687
-        elif refrigerant == "R449A": MOR_correction2 = (-0.000835375233693285 * evapoil) - 0.0138846063856621
-        elif refrigerant == "R448A": MOR_correction2 = (0.00000171366802431428 * (evapoil ** 2)) - (0.000865528727278154 * evapoil) - 0.0152961902042161
-        elif refrigerant == "R502": MOR_correction2 = (0.00000484734071020993 * (evapoil ** 2)) - (0.000624822304716683 * evapoil) - 0.0128725684240106
-        elif refrigerant == "R507A": MOR_correction2 = (-0.000701333343440148 * evapoil) - 0.0114900933623056
-        elif refrigerant == "R22": MOR_correction2 = (0.00000636798209134899 * (evapoil ** 2)) - (0.000157783204337396 * evapoil) - 0.00575251626397381
-        elif refrigerant == "R407C": MOR_correction2 = (-0.00000665735727676349 * (evapoil ** 2)) - (0.000894860288947537 * evapoil) - 0.0116054361757929
-        elif refrigerant == "R410A": MOR_correction2 = (-0.000672268853990701 * evapoil) - 0.0111802230098585
-        elif refrigerant == "R407F": MOR_correction2 = (0.00000263731418614519 * (evapoil ** 2)) - (0.000683997257738699 * evapoil) - 0.0126005968942147
-        elif refrigerant == "R134a": MOR_correction2 = (-0.00000823045532174214 * (evapoil ** 2)) - (0.00108063672211041 * evapoil) - 0.0217411206961643
-        elif refrigerant == "R404A": MOR_correction2 = (0.00000342378568620316 * (evapoil ** 2)) - (0.000329572335134041 * evapoil) - 0.00706087606597149
-        else: MOR_correction2 = (-0.000711441807827186 * evapoil) - 0.0118194116436425
-        #st.write("MOR_correction2:", MOR_correction2)
-        
-        if refrigerant in ["R23", "R508B"]:
-            if T_evap < -86:
-                MOR = ""
-                MORmin = ""
-                MORfinal = ""
-            elif T_evap > -42:
-                MOR = ""
-                MORmin = ""
-                MORfinal = ""
-            else:
-                MOR = (1 - MOR_correction) * (1 - MOR_correction2) * MOR_pre
-                MORmin = (1 - MOR_correctionmin) * (1 - MOR_correction2) * MOR_premin
-                MORfinal = max(MOR, MORmin)
-        else:    
-            if T_evap < -40:
-                MOR = ""
-                MORmin = ""
-                MORfinal = ""
-            elif T_evap > 4:
-                MOR = ""
-                MORmin = ""
-                MORfinal = ""
-            else:
-                MOR = (1 - MOR_correction) * (1 - MOR_correction2) * MOR_pre
-                MORmin = (1 - MOR_correctionmin) * (1 - MOR_correction2) * MOR_premin
-                MORfinal = max(MOR, MORmin)
-        #st.write("MOR:", MOR)
-        #st.write("MORmin:", MORmin)
-        #st.write("MORfinal:", MORfinal)
-        velocity_m_sfinal = max(velocity_m_s, velocity_m_smin)
-        #st.write("velocity_m_sfinal:", velocity_m_sfinal)
-    else:
-        velocity_m_s = None
-        velocity_m_smin = None
-        velocity_m_sfinal = None
-
-    # Oil return check
-    adjusted_duty_kw = evap_capacity_kw * (required_oil_duty_pct / 100.0)
-    #st.write("adjusted_duty_kw:", adjusted_duty_kw)
+    # Only meaningful for R744 TC
+    gc_max = gc_max_pres if refrigerant == "R744 TC" else None
+    gc_min = gc_min_pres if refrigerant == "R744 TC" else None
 
-    density_recalc = mass_flow_kg_s / (velocity_m_s * area_m2)
-    #st.write("density_recalc:", density_recalc)
-    
-    if MORfinal == "":
-        MinCap = ""
-    else:
-        MinCap = MORfinal * evap_capacity_kw / 100
+    try:
+        oil = _oil_return_results(
+            refrigerant, T_evap, T_cond, minliq_temp, superheat_K, max_penalty,
+            evap_capacity_kw, ID_mm, gc_max, gc_min,
+        )
+    except ValueError as e:
+        st.error(str(e))
+        st.stop()
 
-    def _pipe_row_for_size(size_inch: str, gauge: str | None = None):
-        rows = material_df[
-            material_df["Nominal Size (inch)"].astype(str).str.strip() == str(size_inch)
-        ]
-    
-        if "Gauge" in rows.columns and rows["Gauge"].notna().any():
-            if gauge is not None:
-                rows_g = rows[rows["Gauge"] == gauge]
-                if not rows_g.empty:
-                    return rows_g.iloc[0]
-            # fallback if gauge is None or invalid
-            return rows.iloc[0]
-    
-        return rows.iloc[0]
+    M_total = oil["M_total"]
+    mass_flow_foroil = oil["mass_flow_foroil"]
+    mass_flow_foroilmin = oil["mass_flow_foroilmin"]
+    velocity_m_sfinal = oil["velocity_m_sfinal"]
+    MORfinal = oil["MORfinal"]
+    MinCap = oil["MinCap"]
 
     from utils.double_riser import RiserContext, balance_double_riser
     
-    # Only meaningful for R744 TC
-    gc_max = gc_max_pres if refrigerant == "R744 TC" else None
-    gc_min = gc_min_pres if refrigerant == "R744 TC" else None
-    
     ctx = RiserContext(
         refrigerant=refrigerant,
         T_evap=T_evap,
@@ -1412,14 +1433,12 @@ elif tool_selection == "Oil Return Checker":
         PLF=PLF,
     
         selected_material=selected_material,
-        pipe_row_for_size=_pipe_row_for_size,
+        pipe_row_for_size=partial(_pipe_row_for_size, pipe_lookup, selected_material),
     
         gc_max_pres=gc_max,
         gc_min_pres=gc_min,
     )
     
-    double_trouble = st.checkbox("Double Riser Mode", key="double_trouble")
-
     if double_trouble:
         dr = balance_double_riser(
             manual_small,
@@ -1439,14 +1458,14 @@ elif tool_selection == "Oil Return Checker":
             dr=dr,
             refrigerant=refrigerant,
             T_evap=T_evap,
-            density_foroil=density_foroil,
-            oil_density=oil_density,
-            jg_half=jg_half,
+            density_foroil=oil["density_foroil"],
+            oil_density=oil["oil_density"],
+            jg_half=oil["jg_half"],
             mass_flow_foroil=mass_flow_foroil,
             mass_flow_foroilmin=mass_flow_foroilmin,
-            MOR_correction=MOR_correction,
-            MOR_correctionmin=MOR_correctionmin,
-            MOR_correction2=MOR_correction2,
+            MOR_correction=oil["MOR_correction"],
+            MOR_correctionmin=oil["MOR_correctionmin"],
+            MOR_correction2=oil["MOR_correction2"],
         )
 
         if MOR_full_flow is None:
@@ -1470,7 +1489,7 @@ elif tool_selection == "Oil Return Checker":
                 else:
                     st.metric("Minimum Capacity (Secondary)", f"{MinCaps:.4f}kW")
             else:
-                if MORfinal == "":
+                if math.isnan(MORfinal):
                     st.metric("Minimum Capacity", "")
                 else:                
                     st.metric("Minimum Capacity", f"{MinCap:.4f}kW")
@@ -1482,7 +1501,7 @@ elif tool_selection == "Oil Return Checker":
                 else:
                     st.metric("Minimum Oil Return", f"{MOR_full_flow:.1f}%")
             else:
-                if MORfinal == "":
+                if math.isnan(MORfinal):
                     st.metric("Minimum Oil Return", "")
                 else:
                     st.metric("Minimum Oil Return", f"{MORfinal:.1f}%")
@@ -1501,7 +1520,7 @@ elif tool_selection == "Oil Return Checker":
                 else:
                     st.metric("Maximum Oil Return", f"{MOR_large:.1f}%")
 
-    if isinstance(MORfinal, (int, float)):
+    if not math.isnan(MORfinal):
         is_ok, message = (True, "✅ OK") if required_oil_duty_pct >= MORfinal else (False, "❌ Insufficient flow")
     else:
         is_ok, message = (False, "")
@@ -1530,11 +1549,7 @@ elif tool_selection == "Manual Calculation":
     colx, cola, colb, colc = st.columns(4)
 
     with colx:
-        refrigerant = st.selectbox("Refrigerant", [
-            "R404A", "R134a", "R407F", "R744", "R744 TC", "R410A",
-            "R407C", "R507A", "R448A", "R449A", "R22", "R32", "R454A", "R454C", "R455A", "R407A",
-            "R290", "R1270", "R600a", "R717", "R1234ze", "R1234yf", "R12", "R11", "R454B", "R450A", "R513A", "R23", "R508B", "R502"
-        ])
+        refrigerant = st.selectbox("Refrigerant", REFRIGERANTS)
 
     with cola:
         dp_standard = st.selectbox(
@@ -1596,77 +1611,9 @@ elif tool_selection == "Manual Calculation":
     if mode == "Dry Suction":
         
         # Load pipe data
-        pipe_data = pd.read_csv("data/pipe_pressure_ratings_full.csv")
-    
-        # --- helpers ---
-        def _nps_inch_to_mm(nps_str: str) -> float:
-            # e.g. "1-1/8", '1"', "3/8"
-            s = str(nps_str).replace('"', '').strip()
-            if not s:
-                return float('nan')
-            parts = s.split('-')
-            tot_in = 0.0
-            for p in parts:
-                p = p.strip()
-                if not p:
-                    continue
-                if '/' in p:
-                    num, den = p.split('/')
-                    tot_in += float(num) / float(den)
-                else:
-                    tot_in += float(p)
-            return tot_in * 25.4  # mm
-    
-        ss = st.session_state
-    
-        # 1) Pipe material
-
-        col1, col2, col3, col4 = st.columns(4)
-        with col2:
-            if refrigerant == "R717":
-                excluded_materials = ["Copper ASTM", " Copper EN12735", "K65 Copper", "Reflok Aluminium"]
-                pipe_materials = sorted(m for m in pipe_data["Material"].dropna().unique()
-                                        if m not in excluded_materials)
-            else:
-                pipe_materials = sorted(pipe_data["Material"].dropna().unique())
-    
-            selected_material = st.selectbox("Pipe Material", pipe_materials, key="material")
-        
-        # detect material change
-        material_changed = ss.get("last_material") is not None and ss.last_material != selected_material
-        ss.last_material = selected_material
-    
-        # 2) Sizes for selected material (de-duped)
-        material_df = pipe_data[pipe_data["Material"] == selected_material].copy()
-    
-        sizes_df = (
-            material_df[["Nominal Size (inch)", "Nominal Size (mm)"]]
-            .dropna(subset=["Nominal Size (inch)"])
-            .assign(**{
-                "Nominal Size (inch)": lambda d: d["Nominal Size (inch)"].astype(str).str.strip(),
-            })
-            .drop_duplicates(subset=["Nominal Size (inch)"], keep="first")
-        )
-    
-        # make sure we have a numeric mm per nominal (fallback: parse the inch string)
-        sizes_df["mm_num"] = pd.to_numeric(sizes_df.get("Nominal Size (mm)"), errors="coerce")
-        sizes_df.loc[sizes_df["mm_num"].isna(), "mm_num"] = sizes_df.loc[sizes_df["mm_num"].isna(), "Nominal Size (inch)"].apply(_nps_inch_to_mm)
-    
-        pipe_sizes = sizes_df["Nominal Size (inch)"].tolist()
-        mm_map = dict(zip(sizes_df["Nominal Size (inch)"], sizes_df["mm_num"]))
-    
-        # choose default index
-        def _closest_index(target_mm: float) -> int:
-            mm_list = [mm_map[s] for s in pipe_sizes]
-            return min(range(len(mm_list)), key=lambda i: abs(mm_list[i] - target_mm)) if mm_list else 0
+        pipe_lookup = _pipe_index()
 
-        # --- Handle deferred pipe selection (from "Select Optimal Pipe Size" button) ---
-        if "_next_selected_size" in st.session_state:
-            new_val = st.session_state["_next_selected_size"]
-            # ✅ directly set the selectbox value itself
-            st.session_state["selected_size"] = new_val
-            # clean up the temporary flag
-            del st.session_state["_next_selected_size"]
+        ss = st.session_state
 
         if "_next_double_riser" in st.session_state:
             st.session_state["double_trouble"] = True
@@ -1677,40 +1624,20 @@ elif tool_selection == "Manual Calculation":
             del st.session_state["_next_manual_small"]
             del st.session_state["_next_manual_large"]
 
-        default_index = 0
-        override_val = st.session_state.get("selected_size_override")
-        if override_val and override_val in pipe_sizes:
-            default_index = pipe_sizes.index(override_val)
-        elif material_changed and "prev_pipe_mm" in ss:
-            default_index = _closest_index(ss.prev_pipe_mm)
-        elif selected_material == " Copper EN12735" and ("1-1/8" in pipe_sizes or '1-1/8"' in pipe_sizes):
-            want = "1-1/8" if "1-1/8" in pipe_sizes else '1-1/8"'
-            default_index = pipe_sizes.index(want)
-        elif "selected_size" in ss and ss.selected_size in pipe_sizes:
-            default_index = pipe_sizes.index(ss.selected_size)
-
         disable_valves = st.session_state.get("double_trouble", False)
-        
-        with col1:
-            selected_size = st.selectbox(
-                "Nominal Pipe Size (inch)",
-                pipe_sizes,
-                index=default_index,
-                key="selected_size",
-                disabled=disable_valves,
-            )
 
-        ss.prev_pipe_mm = float(mm_map.get(selected_size, float("nan")))
-    
-        # 3) Gauge (if applicable)
-        gauge_options = material_df[material_df["Nominal Size (inch)"].astype(str).str.strip() == selected_size]
-        if "Gauge" in gauge_options.columns and gauge_options["Gauge"].notna().any():
-            gauges = sorted(gauge_options["Gauge"].dropna().unique())
-            with col2:
-                selected_gauge = st.selectbox("Copper Gauge", gauges, key="gauge", disabled=disable_valves)
-            selected_pipe_row = gauge_options[gauge_options["Gauge"] == selected_gauge].iloc[0]
-        else:
-            selected_pipe_row = gauge_options.iloc[0]
+        col1, col2, col3, col4 = st.columns(4)
+        pipe_sel = _pipe_selector(
+            pipe_lookup, refrigerant, col1, col2,
+            disabled=disable_valves,
+            size_override=st.session_state.get("selected_size_override"),
+        )
+        selected_material = pipe_sel.material
+        selected_size = pipe_sel.size
+        selected_pipe_row = pipe_sel.row
+        pipe_sizes = pipe_sel.sizes
+        mm_map = pipe_sel.mm_map
+        material_df = pipe_sel.material_df
 
         pipe_index = material_to_pipe_index(selected_material)
         
@@ -1723,27 +1650,17 @@ elif tool_selection == "Manual Calculation":
         ID_mm = selected_pipe_row["ID_mm"]
 
         def gauges_for_size(size_inch: str):
-            rows = material_df[material_df["Nominal Size (inch)"].astype(str).str.strip() == str(size_inch)]
-            if "Gauge" in rows.columns and rows["Gauge"].notna().any():
-                return sorted(rows["Gauge"].dropna().unique())
-            return []
-    
+            return pipe_lookup["gauges_by_material_size"].get((selected_material, str(size_inch)), [])
+
         with col1:
             evap_capacity_kw = st.number_input("Evaporator Capacity (kW)", min_value=0.03, max_value=20000.0, value=10.0, step=1.0)
     
             # --- Base ranges per refrigerant ---
-            if refrigerant in ("R23", "R508B"):
-                evap_min, evap_max, evap_default = -100.0, -20.0, -80.0
-                maxliq_min, maxliq_max, maxliq_default = -100.0, 10.0, -30.0
-                minliq_min, minliq_max, minliq_default = -100.0, 10.0, -40.0
-            elif refrigerant == "R744":
-                evap_min, evap_max, evap_default = -50.0, 20.0, -10.0
-                maxliq_min, maxliq_max, maxliq_default = -50.0, 30.0, 15.0
-                minliq_min, minliq_max, minliq_default = -50.0, 30.0, 10.0
-            else:
-                evap_min, evap_max, evap_default = -50.0, 30.0, -10.0
-                maxliq_min, maxliq_max, maxliq_default = -50.0, 60.0, 40.0
-                minliq_min, minliq_max, minliq_default = -50.0, 60.0, 20.0
+            (
+                (evap_min, evap_max, evap_default),
+                (maxliq_min, maxliq_max, maxliq_default),
+                (minliq_min, minliq_max, minliq_default),
+            ) = OIL_RETURN_RANGES.get(refrigerant, OIL_RETURN_RANGES["_default"])
     
             # --- Init state (widget-backed) ---
             ss = st.session_state
@@ -1758,26 +1675,8 @@ elif tool_selection == "Manual Calculation":
             ss.setdefault("minliq_temp", minliq_default)
             ss.setdefault("evap_temp",   evap_default)
 
-            if "minliq_temp" in ss and "maxliq_temp" in ss:
-                ss.minliq_temp = min(ss.maxliq_temp, ss.minliq_temp)
-
-            if "minliq_temp" in ss and "maxliq_temp" in ss and "evap_temp" in ss:
-                ss.evap_temp = min(ss.maxliq_temp, ss.minliq_temp, ss.evap_temp)
-    
-            # --- Callbacks implementing your downstream clamping logic ---
-            def on_change_maxliq():
-                # When cond changes: clamp minliq down to cond, then evap down to minliq
-                ss.minliq_temp = min(ss.minliq_temp, ss.maxliq_temp)
-                ss.evap_temp   = min(ss.evap_temp,   ss.minliq_temp)
-    
-            def on_change_minliq():
-                # When minliq changes: clamp minliq down to cond, then evap down to minliq
-                ss.minliq_temp = min(ss.minliq_temp, ss.maxliq_temp)
-                ss.evap_temp   = min(ss.evap_temp,   ss.minliq_temp)
-    
-            def on_change_evap():
-                # When evap changes: clamp evap down to minliq
-                ss.evap_temp   = min(ss.evap_temp,   ss.minliq_temp)
+            # Stale values can survive a mode/tool switch, so clamp before the widgets too
+            _reclamp_temps()
     
             # --- Inputs with inclusive caps (≤), same order as your code ---
             if refrigerant == "R744 TC":
@@ -1831,27 +1730,31 @@ elif tool_selection == "Manual Calculation":
                     "Max Liquid Temperature (°C)",
                     min_value=maxliq_min, max_value=maxliq_max,
                     value=ss.maxliq_temp, step=1.0, key="maxliq_temp",
-                    on_change=on_change_maxliq,
+                    on_change=_reclamp_temps,
                 )
             
                 minliq_temp = st.number_input(
                     "Min Liquid Temperature (°C)",
                     min_value=minliq_min, max_value=min(maxliq_temp, minliq_max),
                     value=ss.minliq_temp, step=1.0, key="minliq_temp",
-                    on_change=on_change_minliq,
+                    on_change=_reclamp_temps,
                 )
 
             evaporating_temp = st.number_input(
                 "Evaporating Temperature (°C)",
                 min_value=evap_min, max_value=min(minliq_temp, evap_max),
                 value=ss.evap_temp, step=1.0, key="evap_temp",
-                on_change=on_change_evap,
+                on_change=_reclamp_temps,
             )
     
+        # Same split as the Oil Return Checker: the callback-clamped temperatures
+        # stay live, the plain operating inputs commit together on submit.
         with col2:
-            superheat_K = st.number_input("Superheat (K)", min_value=0.0, max_value=60.0, value=5.0, step=1.0)
-            max_penalty = st.number_input("Max Penalty (K)", min_value=0.0, max_value=6.0, value=1.0, step=0.1)
-            required_oil_duty_pct = st.number_input("Required Oil Return Duty (%)", min_value=0.0, max_value=100.0, value=100.0, step=5.0)
+            with st.form("dry_suction_inputs"):
+                superheat_K = st.number_input("Superheat (K)", min_value=0.0, max_value=60.0, value=5.0, step=1.0)
+                max_penalty = st.number_input("Max Penalty (K)", min_value=0.0, max_value=6.0, value=1.0, step=0.1)
+                required_oil_duty_pct = st.number_input("Required Oil Return Duty (%)", min_value=0.0, max_value=100.0, value=100.0, step=5.0)
+                st.form_submit_button("Calculate")
     
         with col3:
             L = st.number_input("Pipe Length (m)", min_value=0.1, max_value=300.0, value=10.0, step=1.0, key="L")
@@ -1916,19 +1819,17 @@ elif tool_selection == "Manual Calculation":
                 gauge_small = st.selectbox("Small Riser Gauge", g_small_opts, key="gauge_small", disabled=disable_pipes)
 
         # build selected_pipe_row_large
-        rows_large = material_df[material_df["Nominal Size (inch)"].astype(str).str.strip() == str(manual_large)]
-        if "Gauge" in rows_large.columns and rows_large["Gauge"].notna().any():
-            row_large = rows_large[rows_large["Gauge"] == gauge_large].iloc[0]
+        if g_large_opts:
+            row_large = pipe_lookup["row_by_material_size_gauge"][(selected_material, manual_large, gauge_large)]
         else:
-            row_large = rows_large.iloc[0]
-        
+            row_large = pipe_lookup["first_row_by_material_size"][(selected_material, manual_large)]
+
         # build selected_pipe_row_small
-        rows_small = material_df[material_df["Nominal Size (inch)"].astype(str).str.strip() == str(manual_small)]
-        if "Gauge" in rows_small.columns and rows_small["Gauge"].notna().any():
-            row_small = rows_small[rows_small["Gauge"] == gauge_small].iloc[0]
+        if g_small_opts:
+            row_small = pipe_lookup["row_by_material_size_gauge"][(selected_material, manual_small, gauge_small)]
         else:
-            row_small = rows_small.iloc[0]
-        
+            row_small = pipe_lookup["first_row_by_material_size"][(selected_material, manual_small)]
+
         pipe_index_large = material_to_pipe_index(selected_material)
         pipe_index_small = pipe_index_large  # same material
         
@@ -1972,295 +1873,60 @@ elif tool_selection == "Manual Calculation":
             )
         render_pressure_result(result)
         
-        from utils.refrigerant_properties import RefrigerantProperties
-        from utils.refrigerant_densities import RefrigerantDensities
-        from utils.refrigerant_viscosities import RefrigerantViscosities
-        from utils.supercompliq_co2 import RefrigerantProps
-        from utils.oil_return_checker import check_oil_return
-    
         T_evap = evaporating_temp
         T_cond = maxliq_temp
 
-        props_sup = RefrigerantProps()
-        props = RefrigerantProperties()
-        
-        if refrigerant == "R744 TC":
-            
-            h_in = props_sup.get_enthalpy_sup(gc_max_pres, maxliq_temp)
-            if gc_min_pres >= 73.8: 
-                h_inmin = props_sup.get_enthalpy_sup(gc_min_pres, minliq_temp)
-            elif gc_min_pres <= 72.13:
-                h_inmin = props.get_properties("R744", minliq_temp)["enthalpy_liquid2"]
-            else:
-                st.error("This pressure range (72.13–73.8 bar) is not allowed. Please choose another value.")
-                st.stop()
-            h_inlet = h_in
-            h_inletmin = h_inmin
-            h_evap = props.get_properties("R744", T_evap)["enthalpy_vapor"]
-            h_10K = props.get_properties("R744", T_evap)["enthalpy_super"]
-    
-        else:
-            
-            h_in = props.get_properties(refrigerant, T_cond)["enthalpy_liquid2"]
-            #st.write("h_in:", h_in)
-            # for velocity
-            h_inmin = props.get_properties(refrigerant, minliq_temp)["enthalpy_liquid2"]
-            #st.write("h_inmin:", h_inmin)
-            h_inlet = props.get_properties(refrigerant, T_cond)["enthalpy_liquid"]
-            #st.write("h_inlet:", h_inlet)
-            h_inletmin = props.get_properties(refrigerant, minliq_temp)["enthalpy_liquid"]
-            #st.write("h_inletmin:", h_inletmin)
-            h_evap = props.get_properties(refrigerant, T_evap)["enthalpy_vapor"]
-            #st.write("h_evap:", h_evap)
-            h_10K = props.get_properties(refrigerant, T_evap)["enthalpy_super"]
-            #st.write("h_10K:", h_10K)
-        
-        hdiff_10K = h_10K - h_evap
-        #st.write("hdiff_10K:", hdiff_10K)
-        hdiff_custom = hdiff_10K * min(max(superheat_K, 5), 30) / 10
-        #st.write("hdiff_custom:", hdiff_custom)
-        h_super = h_evap + hdiff_custom
-        #st.write("h_super:", h_super)
-        h_foroil = (h_evap + h_super) / 2
-        #st.write("h_foroil:", h_foroil)
-        
-        delta_h = h_evap - h_in
-        #st.write("delta_h:", delta_h)
-        delta_hmin = h_evap - h_inmin
-        #st.write("delta_hmin:", delta_hmin)
-        
-        delta_h_foroil = h_foroil - h_inlet
-        #st.write("delta_h_foroil:", delta_h_foroil)
-        delta_h_foroilmin = h_foroil - h_inletmin
-        #st.write("delta_h_foroilmin:", delta_h_foroilmin)
-    
-        mass_flow_kg_s = evap_capacity_kw / delta_h if delta_h > 0 else 0.01
-        #st.write("mass_flow_kg_s:", mass_flow_kg_s)
-        mass_flow_kg_smin = evap_capacity_kw / delta_hmin if delta_hmin > 0 else 0.01
-        #st.write("mass_flow_kg_smin:", mass_flow_kg_smin)
-        M_total = max(mass_flow_kg_s, mass_flow_kg_smin)
-    
-        mass_flow_foroil = evap_capacity_kw / delta_h_foroil if delta_h_foroil > 0 else 0.01
-        #st.write("mass_flow_foroil:", mass_flow_foroil)
-        mass_flow_foroilmin = evap_capacity_kw / delta_h_foroilmin if delta_h_foroilmin > 0 else 0.01
-        #st.write("mass_flow_foroilmin:", mass_flow_foroilmin)
+        # Only meaningful for R744 TC
+        gc_max = gc_max_pres if refrigerant == "R744 TC" else None
+        gc_min = gc_min_pres if refrigerant == "R744 TC" else None
+
+        # Bore-independent suction state, shared with the auto-select sweep below
+        try:
+            suction = _suction_state(
+                refrigerant, T_evap, T_cond, minliq_temp, superheat_K, max_penalty,
+                evap_capacity_kw, gc_max, gc_min,
+            )
+        except ValueError as e:
+            st.error(str(e))
+            st.stop()
+
+        mass_flow_kg_s = suction.mass_flow_kg_s
+        mass_flow_kg_smin = suction.mass_flow_kg_smin
+        M_total = max(mass_flow_kg_s, mass_flow_kg_smin)
+        mass_flow_foroil = suction.mass_flow_foroil
+        mass_flow_foroilmin = suction.mass_flow_foroilmin
+        density_foroil = suction.density_foroil
     
         # Calculate velocity for transparency
         if ID_mm is not None:
-            ID_m = ID_mm / 1000.0
+            ID_m, area_m2 = _pipe_geom(ID_mm)
             #st.write("ID_mm:", ID_mm)
             #st.write("ID_m:", ID_m)
-            area_m2 = math.pi * (ID_m / 2) ** 2
             #st.write("area_m2:", area_m2)
             
-            if refrigerant == "R744 TC":
-                density_super = RefrigerantDensities().get_density("R744", T_evap - max_penalty + 273.15, superheat_K)
-                density_super2a = RefrigerantDensities().get_density("R744", T_evap + 273.15, ((superheat_K + 5) / 2))
-                density_super2b = RefrigerantDensities().get_density("R744", T_evap - max_penalty + 273.15, ((superheat_K + 5) / 2))
-                density_super2 = (density_super2a + density_super2b) / 2
-                density_super_foroil = RefrigerantDensities().get_density("R744", T_evap + 273.15, min(max(superheat_K, 5), 30))
-                density_sat = RefrigerantProperties().get_properties("R744", T_evap)["density_vapor"]
-                density_5K = RefrigerantDensities().get_density("R744", T_evap + 273.15, 5)    
-        
-            else:
-            
-                density_super = RefrigerantDensities().get_density(refrigerant, T_evap - max_penalty + 273.15, superheat_K)
-                #st.write("density_super:", density_super)
-                density_super2a = RefrigerantDensities().get_density(refrigerant, T_evap + 273.15, ((superheat_K + 5) / 2))
-                #st.write("density_super2a:", density_super2a)
-                density_super2b = RefrigerantDensities().get_density(refrigerant, T_evap - max_penalty + 273.15, ((superheat_K + 5) / 2))
-                #st.write("density_super2b:", density_super2b)
-                density_super2 = (density_super2a + density_super2b) / 2
-                #st.write("density_super2:", density_super2)
-                density_super_foroil = RefrigerantDensities().get_density(refrigerant, T_evap + 273.15, min(max(superheat_K, 5), 30))
-                #st.write("density_super_foroil:", density_super_foroil)
-                density_sat = RefrigerantProperties().get_properties(refrigerant, T_evap)["density_vapor"]
-                #st.write("density_sat:", density_sat)
-                density_5K = RefrigerantDensities().get_density(refrigerant, T_evap + 273.15, 5)
-                #st.write("density_5K:", density_5K)
-            
-            density = (density_super + density_5K) / 2
-            #st.write("density:", density)
-            density_foroil = (density_super_foroil + density_sat) / 2
-            #st.write("density_foroil:", density_foroil)
-            velocity_m_s1 = mass_flow_kg_s / (area_m2 * density)
+            # [max liquid temp, min liquid temp] pairs are evaluated together
+            mass_flows = np.array([mass_flow_kg_s, mass_flow_kg_smin])
+            velocity_m_s1 = mass_flows / (area_m2 * suction.density)
             #st.write("velocity_m_s1:", velocity_m_s1)
-            velocity_m_s1min = mass_flow_kg_smin / (area_m2 * density)
-            #st.write("velocity_m_s1min:", velocity_m_s1min)
-            velocity_m_s2 = mass_flow_kg_s / (area_m2 * density_super2)
+            velocity_m_s2 = mass_flows / (area_m2 * suction.density_super2)
             #st.write("velocity_m_s2:", velocity_m_s2)
-            velocity_m_s2min = mass_flow_kg_smin / (area_m2 * density_super2)
-            #st.write("velocity_m_s2min:", velocity_m_s2min)
-            if refrigerant == "R744": velocity1_prop = 1
-            elif refrigerant == "R744 TC": velocity1_prop = 1
-            elif refrigerant == "R404A":
-                if superheat_K > 45: velocity1_prop = (0.0328330590542629 * superheat_K) - 1.47748765744183
-                else: velocity1_prop = 0
-            elif refrigerant == "R134a":
-                if superheat_K > 30: velocity1_prop = (-0.000566085879684639 * (superheat_K ** 2)) + (0.075049554857083 * superheat_K) - 1.74200935399632
-                else: velocity1_prop = 0
-            elif refrigerant == "R407F": velocity1_prop = 1
-            elif refrigerant == "R407A": velocity1_prop = 1
-            elif refrigerant == "R410A": velocity1_prop = 1
-            elif refrigerant == "R407C": velocity1_prop = 0
-            elif refrigerant == "R22": velocity1_prop = 1
-            elif refrigerant == "R502": velocity1_prop = 1
-            elif refrigerant == "R507A": velocity1_prop = 1
-            elif refrigerant == "R448A": velocity1_prop = 1
-            elif refrigerant == "R449A": velocity1_prop = 1
-            elif refrigerant == "R717": velocity1_prop = 1
-            else:
-                if superheat_K > 30: velocity1_prop = (0.0000406422632403154 * (superheat_K ** 2)) - (0.000541007136813307 * superheat_K) + 0.748882946418884
-                else: velocity1_prop = 0.769230769230769
-            # if refrigerant == "R744": velocity1_prop = (-0.0142814388381874 * max(superheat_K, 5)) + 1.07140719419094
-            # else: velocity1_prop = (-0.00280805561137312 * max(superheat_K, 5)) + 1.01404027805687
+            velocity1_prop = suction.velocity1_prop
             #st.write("velocity1_prop:", velocity1_prop)
-            velocity_m_s = (velocity_m_s1 * velocity1_prop) + (velocity_m_s2 * (1 - velocity1_prop))
+            velocity_m_s, velocity_m_smin = (
+                (velocity_m_s1 * velocity1_prop) + (velocity_m_s2 * (1 - velocity1_prop))
+            ).tolist()
             #st.write("velocity_m_s:", velocity_m_s)
-            velocity_m_smin = (velocity_m_s1min * velocity1_prop) + (velocity_m_s2min * (1 - velocity1_prop))
             #st.write("velocity_m_smin:", velocity_m_smin)
-            if refrigerant in ["R23", "R508B"]:
-                oil_density_sat = (-0.853841209044878 * T_evap) + 999.190772536527
-                oil_density_super = (-0.853841209044878 * (T_evap + min(max(superheat_K, 5), 30))) + 999.190772536527
-            else:
-                oil_density_sat = (-0.00356060606060549 * (T_evap ** 2)) - (0.957878787878808 * T_evap) + 963.595454545455
-                oil_density_super = (-0.00356060606060549 * ((T_evap + min(max(superheat_K, 5), 30)) ** 2)) - (0.957878787878808 * (T_evap + min(max(superheat_K, 5), 30))) + 963.595454545455
-            #st.write("oil_density_sat:", oil_density_sat)
-            #st.write("oil_density_super:", oil_density_super)
-            oil_density = (oil_density_sat + oil_density_super) / 2
+            mor = suction.mor_factors
+            oil_density = mor["oil_density"]
             #st.write("oil_density:", oil_density)
-            
-            if refrigerant == "R404A": jg_half = 0.860772464072673
-            elif refrigerant == "R134a": jg_half = 0.869986729796935
-            elif refrigerant == "R407F": jg_half = 0.869042493641944
-            elif refrigerant == "R744": jg_half = 0.877950613678719
-            elif refrigerant == "R744 TC": jg_half = 0.877950613678719
-            elif refrigerant == "R407A": jg_half = 0.867374311574041
-            elif refrigerant == "R410A": jg_half = 0.8904423325365
-            elif refrigerant == "R407C": jg_half = 0.858592104849471
-            elif refrigerant == "R22": jg_half = 0.860563058394146
-            elif refrigerant == "R502": jg_half = 0.858236706656266
-            elif refrigerant == "R507A": jg_half = 0.887709710291009
-            elif refrigerant == "R449A": jg_half = 0.867980496631757
-            elif refrigerant == "R448A": jg_half = 0.86578818145833
-            elif refrigerant == "R717": jg_half = 0.854957410951708
-            elif refrigerant == "R290": jg_half = 0.844975139695726
-            elif refrigerant == "R1270": jg_half = 0.849089717732815
-            elif refrigerant == "R600a": jg_half = 0.84339338979887
-            elif refrigerant == "R1234ze": jg_half = 0.867821375349728
-            elif refrigerant == "R1234yf": jg_half = 0.860767472602571
-            elif refrigerant == "R12": jg_half = 0.8735441986466
-            elif refrigerant == "R11": jg_half = 0.864493203834913
-            elif refrigerant == "R454B": jg_half = 0.869102255850291
-            elif refrigerant == "R450A": jg_half = 0.865387140496035
-            elif refrigerant == "R513A": jg_half = 0.861251244627232
-            elif refrigerant == "R454A": jg_half = 0.868161104592492
-            elif refrigerant == "R455A": jg_half = 0.865687329727713
-            elif refrigerant == "R454C": jg_half = 0.866423016875524
-            elif refrigerant == "R32": jg_half = 0.875213309852597
-            elif refrigerant == "R23": jg_half = 0.865673418568001
-            elif refrigerant == "R508B": jg_half = 0.864305626845382
+            jg_half = mor["jg_half"]
             #st.write("jg_half:", jg_half)
-            
-            MinMassFlux = (jg_half ** 2) * ((density_foroil * 9.81 * ID_m * (oil_density - density_foroil)) ** 0.5)
-            #st.write("MinMassFluxy:", MinMassFlux)
-            MinMassFlow = MinMassFlux * area_m2
-            #st.write("MinMassFlow:", MinMassFlow)
-            MOR_pre = (MinMassFlow / mass_flow_foroil) * 100
-            #st.write("MOR_pre:", MOR_pre)
-            MOR_premin = (MinMassFlow / mass_flow_foroilmin) * 100
-            #st.write("MOR_premin:", MOR_premin)
-    
-            if refrigerant in ["R23", "R508B"]:
-                MOR_correctliq = T_cond + 47.03
-            else:
-                MOR_correctliq = T_cond
-            if refrigerant in ["R23", "R508B"]:
-                MOR_correctliqmin = minliq_temp + 47.03
-            else:
-                MOR_correctliqmin = minliq_temp
-            if refrigerant in ["R23", "R508B"]:
-                evapoil = T_evap + 46.14
-            else:
-                evapoil = T_evap
-            #st.write("MOR_correctliq:", MOR_correctliq)
-            #st.write("evapoil:", evapoil)
-            if refrigerant == "R744": MOR_correction = (0.000225755013421421 * MOR_correctliq) - 0.00280879370374927
-            elif refrigerant == "R744 TC": MOR_correction = (0.0000603336117708171 * h_in) - 0.0142318718120024
-            elif refrigerant == "R407A": MOR_correction = (0.00000414431651323856 * (MOR_correctliq ** 2)) + (0.000381908525139781 * MOR_correctliq) - 0.0163450053041212
-            elif refrigerant == "R449A": MOR_correction = (0.00000414431651323856 * (MOR_correctliq ** 2)) + (0.000381908525139781 * MOR_correctliq) - 0.0163450053041212
-            elif refrigerant == "R448A": MOR_correction = (0.00000414431651323856 * (MOR_correctliq ** 2)) + (0.000381908525139781 * MOR_correctliq) - 0.0163450053041212
-            elif refrigerant == "R502": MOR_correction = (0.00000414431651323856 * (MOR_correctliq ** 2)) + (0.000381908525139781 * MOR_correctliq) - 0.0163450053041212
-            elif refrigerant == "R507A": MOR_correction = (0.000302619054048837 * MOR_correctliq) - 0.00930188913363997
-            elif refrigerant == "R22": MOR_correction = (0.000108153843367715 * MOR_correctliq) - 0.00329248681202757
-            elif refrigerant == "R407C": MOR_correction = (0.00000420322918839302 * (max(MOR_correctliq, -32.0716410083429) ** 2)) + (0.000269608915211859 * max(MOR_correctliq, -32.0716410083429)) - 0.0134546663857195
-            elif refrigerant == "R410A": MOR_correction = 0
-            elif refrigerant == "R407F": MOR_correction = (0.00000347332380289385 * (max(MOR_correctliq, -34.4346433150568) ** 2)) + (0.000239205332540693 * max(MOR_correctliq, -34.4346433150568)) - 0.0121545316131988
-            elif refrigerant == "R134a": MOR_correction = (0.000195224660107459 * MOR_correctliq) - 0.00591757011487048
-            elif refrigerant == "R404A": MOR_correction = (0.0000156507169104918 * (max(MOR_correctliq, -22.031637377024) ** 2)) + (0.000689621839324826 * max(MOR_correctliq, -22.031637377024)) - 0.0392
-            else: MOR_correction = (0.00000461020482461793 * (max(MOR_correctliq, -23.6334996273983) ** 2)) + (0.000217910548009675 * max(MOR_correctliq, -23.6334996273983)) - 0.012074621594626
-            #st.write("MOR_correction:", MOR_correction)
-    
-            if refrigerant == "R744": MOR_correctionmin = (0.000225755013421421 * MOR_correctliqmin) - 0.00280879370374927
-            elif refrigerant == "R744 TC": MOR_correctionmin = (0.0000603336117708171 * h_inmin) - 0.0142318718120024
-            elif refrigerant == "R407A": MOR_correctionmin = (0.00000414431651323856 * (MOR_correctliqmin ** 2)) + (0.000381908525139781 * MOR_correctliqmin) - 0.0163450053041212
-            elif refrigerant == "R449A": MOR_correctionmin = (0.00000414431651323856 * (MOR_correctliqmin ** 2)) + (0.000381908525139781 * MOR_correctliqmin) - 0.0163450053041212
-            elif refrigerant == "R448A": MOR_correctionmin = (0.00000414431651323856 * (MOR_correctliqmin ** 2)) + (0.000381908525139781 * MOR_correctliqmin) - 0.0163450053041212
-            elif refrigerant == "R502": MOR_correctionmin = (0.00000414431651323856 * (MOR_correctliqmin ** 2)) + (0.000381908525139781 * MOR_correctliqmin) - 0.0163450053041212
-            elif refrigerant == "R507A": MOR_correctionmin = (0.000302619054048837 * MOR_correctliqmin) - 0.00930188913363997
-            elif refrigerant == "R22": MOR_correctionmin = (0.000108153843367715 * MOR_correctliqmin) - 0.00329248681202757
-            elif refrigerant == "R407C": MOR_correctionmin = (0.00000420322918839302 * (max(MOR_correctliqmin, -32.0716410083429) ** 2)) + (0.000269608915211859 * max(MOR_correctliqmin, -32.0716410083429)) - 0.0134546663857195
-            elif refrigerant == "R410A": MOR_correctionmin = 0
-            elif refrigerant == "R407F": MOR_correctionmin = (0.00000347332380289385 * (max(MOR_correctliqmin, -34.4346433150568) ** 2)) + (0.000239205332540693 * max(MOR_correctliqmin, -34.4346433150568)) - 0.0121545316131988
-            elif refrigerant == "R134a": MOR_correctionmin = (0.000195224660107459 * MOR_correctliqmin) - 0.00591757011487048
-            elif refrigerant == "R404A": MOR_correctionmin = (0.0000156507169104918 * (max(MOR_correctliqmin, -22.031637377024) ** 2)) + (0.000689621839324826 * max(MOR_correctliqmin, -22.031637377024)) - 0.0392
-            else: MOR_correctionmin = (0.00000461020482461793 * (max(MOR_correctliqmin, -23.6334996273983) ** 2)) + (0.000217910548009675 * max(MOR_correctliqmin, -23.6334996273983)) - 0.012074621594626
-            #st.write("MOR_correctionmin:", MOR_correctionmin)
-    
-            if refrigerant == "R744": MOR_correction2 = (-0.0000176412848988908 * (evapoil ** 2)) - (0.00164308248808803 * evapoil) - 0.0184308798286039
-            elif refrigerant == "R744 TC": MOR_correction2 = (-0.0000176412848988908 * (evapoil ** 2)) - (0.00164308248808803 * evapoil) - 0.0184308798286039
-            elif refrigerant == "R407A": MOR_correction2 = (-0.000864076433837511 * evapoil) - 0.0145018190416687
-            elif refrigerant == "R449A": MOR_correction2 = (-0.000835375233693285 * evapoil) - 0.0138846063856621
-            elif refrigerant == "R448A": MOR_correction2 = (0.00000171366802431428 * (evapoil ** 2)) - (0.000865528727278154 * evapoil) - 0.0152961902042161
-            elif refrigerant == "R502": MOR_correction2 = (0.00000484734071020993 * (evapoil ** 2)) - (0.000624822304716683 * evapoil) - 0.0128725684240106
-            elif refrigerant == "R507A": MOR_correction2 = (-0.000701333343440148 * evapoil) - 0.0114900933623056
-            elif refrigerant == "R22": MOR_correction2 = (0.00000636798209134899 * (evapoil ** 2)) - (0.000157783204337396 * evapoil) - 0.00575251626397381
-            elif refrigerant == "R407C": MOR_correction2 = (-0.00000665735727676349 * (evapoil ** 2)) - (0.000894860288947537 * evapoil) - 0.0116054361757929
-            elif refrigerant == "R410A": MOR_correction2 = (-0.000672268853990701 * evapoil) - 0.0111802230098585
-            elif refrigerant == "R407F": MOR_correction2 = (0.00000263731418614519 * (evapoil ** 2)) - (0.000683997257738699 * evapoil) - 0.0126005968942147
-            elif refrigerant == "R134a": MOR_correction2 = (-0.00000823045532174214 * (evapoil ** 2)) - (0.00108063672211041 * evapoil) - 0.0217411206961643
-            elif refrigerant == "R404A": MOR_correction2 = (0.00000342378568620316 * (evapoil ** 2)) - (0.000329572335134041 * evapoil) - 0.00706087606597149
-            else: MOR_correction2 = (-0.000711441807827186 * evapoil) - 0.0118194116436425
-            #st.write("MOR_correction2:", MOR_correction2)
-            
-            if refrigerant in ["R23", "R508B"]:
-                if T_evap < -86:
-                    MOR = ""
-                    MORmin = ""
-                    MORfinal = ""
-                elif T_evap > -42:
-                    MOR = ""
-                    MORmin = ""
-                    MORfinal = ""
-                else:
-                    MOR = (1 - MOR_correction) * (1 - MOR_correction2) * MOR_pre
-                    MORmin = (1 - MOR_correctionmin) * (1 - MOR_correction2) * MOR_premin
-                    MORfinal = max(MOR, MORmin)
-            else:    
-                if T_evap < -40:
-                    MOR = ""
-                    MORmin = ""
-                    MORfinal = ""
-                elif T_evap > 4:
-                    MOR = ""
-                    MORmin = ""
-                    MORfinal = ""
-                else:
-                    MOR = (1 - MOR_correction) * (1 - MOR_correction2) * MOR_pre
-                    MORmin = (1 - MOR_correctionmin) * (1 - MOR_correction2) * MOR_premin
-                    MORfinal = max(MOR, MORmin)
-            #st.write("MOR:", MOR)
-            #st.write("MORmin:", MORmin)
+            MOR_correction = mor["MOR_correction"]
+            MOR_correctionmin = mor["MOR_correctionmin"]
+            MOR_correction2 = mor["MOR_correction2"]
+            # NaN marks an evaporating temperature outside the correlation range
+            MORfinal = float(mor_final(mor, ID_m, area_m2, density_foroil, mass_flow_foroil, mass_flow_foroilmin))
             #st.write("MORfinal:", MORfinal)
             velocity_m_sfinal = max(velocity_m_s, velocity_m_smin)
             #st.write("velocity_m_sfinal:", velocity_m_sfinal)
@@ -2276,68 +1942,18 @@ elif tool_selection == "Manual Calculation":
         density_recalc = mass_flow_kg_s / (velocity_m_s * area_m2)
         #st.write("density_recalc:", density_recalc)
     
-        if refrigerant == "R744 TC":
-            
-            viscosity_super = RefrigerantViscosities().get_viscosity("R744", T_evap - max_penalty + 273.15, superheat_K)
-            viscosity_super2a = RefrigerantViscosities().get_viscosity("R744", T_evap + 273.15, ((superheat_K + 5) / 2))
-            viscosity_super2b = RefrigerantViscosities().get_viscosity("R744", T_evap - max_penalty + 273.15, ((superheat_K + 5) / 2))
-            viscosity_super2 = (viscosity_super2a + viscosity_super2b) / 2
-            viscosity_sat = RefrigerantViscosities().get_viscosity("R744", T_evap + 273.15, 0)
-            viscosity_5K = RefrigerantViscosities().get_viscosity("R744", T_evap + 273.15, 5)
-
-        else:
-
-            viscosity_super = RefrigerantViscosities().get_viscosity(refrigerant, T_evap - max_penalty + 273.15, superheat_K)
-            #st.write("viscosity_super:", viscosity_super)
-            viscosity_super2a = RefrigerantViscosities().get_viscosity(refrigerant, T_evap + 273.15, ((superheat_K + 5) / 2))
-            #st.write("viscosity_super2a:", viscosity_super2a)
-            viscosity_super2b = RefrigerantViscosities().get_viscosity(refrigerant, T_evap - max_penalty + 273.15, ((superheat_K + 5) / 2))
-            #st.write("viscosity_super2b:", viscosity_super2b)
-            viscosity_super2 = (viscosity_super2a + viscosity_super2b) / 2
-            #st.write("viscosity_super2:", viscosity_super2)
-            viscosity_sat = RefrigerantViscosities().get_viscosity(refrigerant, T_evap + 273.15, 0)
-            #st.write("viscosity_sat:", viscosity_sat)
-            viscosity_5K = RefrigerantViscosities().get_viscosity(refrigerant, T_evap + 273.15, 5)
-            #st.write("viscosity_5K:", viscosity_5K)
-        
-        viscosity = (viscosity_super + viscosity_5K) / 2
-        #st.write("viscosity:", viscosity)
-        viscosity_final = (viscosity * velocity1_prop) + (viscosity_super2 * (1 - velocity1_prop))
-        #st.write("viscosity_final:", viscosity_final)
+        viscosity_final = suction.viscosity_final
     
         # density for reynolds and col2 display needs density_super2 factoring in!
         reynolds = (density_recalc * velocity_m_sfinal * ID_m) / (viscosity_final / 1000000)
         #st.write("reynolds:", reynolds)
     
-        if selected_material in ["Steel SCH40", "Steel SCH80"]:
-            eps = 0.00004572 #0.00015
-        else:
-            eps = 0.000001524 #0.000005
-        
-        tol = 1e-5
-        max_iter = 60
+        eps = pipe_roughness(selected_material)
         
         if reynolds < 2000.0:
             f = 64.0 / reynolds
         else:
-            flo, fhi = 1e-5, 0.1
-            def balance(gg):
-                s = math.sqrt(gg)
-                lhs = 1.0 / s
-                rhs = -2.0 * math.log10((eps / (3.7 * ID_m)) + 2.51 / (reynolds * s))
-                return lhs, rhs
-    
-            f = 0.5 * (flo + fhi)
-            for _ in range(max_iter):
-                f = 0.5 * (flo + fhi)
-                lhs, rhs = balance(f)
-                if abs(1.0 - lhs/rhs) < tol:
-                    break
-                # decide side using sign of (lhs - rhs)
-                if (lhs - rhs) > 0.0:
-                    flo = f
-                else:
-                    fhi = f
+            f = _serghides(reynolds, eps, ID_m)
         
         # dynamic (velocity) pressure, kPa
         q_kPa = 0.5 * density_recalc * (velocity_m_sfinal ** 2) / 1000.0
@@ -2353,22 +1969,17 @@ elif tool_selection == "Manual Calculation":
             st.error(f"CSV missing required K columns: {missing}")
             st.stop()
     
-        # Convert to floats and check NaNs
-        try:
-            K_SRB  = float(selected_pipe_row["SRB"])
-            K_LRB  = float(selected_pipe_row["LRB"])
-            K_BALL = float(selected_pipe_row["BALL"])
-            K_GLOBE= float(selected_pipe_row["GLOBE"])
-        except Exception as e:
-            st.error(f"Failed to parse K-factors as numbers: {e}")
-            st.stop()
-    
-        if any(pd.isna([K_SRB, K_LRB, K_BALL, K_GLOBE])):
+        # K columns are float64 from load, so one array read replaces per-column coercion
+        K_row = selected_pipe_row[required_cols].to_numpy(dtype=float)
+        if np.isnan(K_row).any():
             st.error("One or more K-factors are NaN in the CSV row.")
             st.stop()
+        K_SRB, K_LRB, K_BALL, K_GLOBE = K_row.tolist()
         
         B_SRB = SRB + 0.5 * _45 + 2.0 * ubend + 3.0 * ptrap
         B_LRB = LRB + MAC
+        # same counts weight every size in the auto-select sweep
+        fitting_counts = np.array([B_SRB, B_LRB, ball, globe], dtype=float)
     
         dp_fittings_kPa = q_kPa * (
         K_SRB   * B_SRB +
@@ -2382,13 +1993,8 @@ elif tool_selection == "Manual Calculation":
         
         dp_total_kPa = dp_pipe_kPa + dp_fittings_kPa + dp_valves_kPa + dp_plf_kPa
 
-        converter = PressureTemperatureConverter()
-
-        if refrigerant == "R744 TC":
-            evappres = converter.temp_to_pressure("R744", T_evap)
-
-        else:
-            evappres = converter.temp_to_pressure(refrigerant, T_evap)
+        converter = CONV
+        evappres = suction.evappres
 
         postcirc = evappres - (dp_total_kPa / 100)
         
@@ -2405,32 +2011,10 @@ elif tool_selection == "Manual Calculation":
 
         volflow = maxmass / density_recalc
 
-        if MORfinal == "":
-            MinCap = ""
-        else:
-            MinCap = MORfinal * evap_capacity_kw / 100
-        
-        def _pipe_row_for_size(size_inch: str, gauge: str | None = None):
-            rows = material_df[
-                material_df["Nominal Size (inch)"].astype(str).str.strip() == str(size_inch)
-            ]
-        
-            if "Gauge" in rows.columns and rows["Gauge"].notna().any():
-                if gauge is not None:
-                    rows_g = rows[rows["Gauge"] == gauge]
-                    if not rows_g.empty:
-                        return rows_g.iloc[0]
-                # fallback if gauge is None or invalid
-                return rows.iloc[0]
+        MinCap = MORfinal * evap_capacity_kw / 100
         
-            return rows.iloc[0]
-
         from utils.double_riser import RiserContext, balance_double_riser
         
-        # Only meaningful for R744 TC
-        gc_max = gc_max_pres if refrigerant == "R744 TC" else None
-        gc_min = gc_min_pres if refrigerant == "R744 TC" else None
-        
         ctx = RiserContext(
             refrigerant=refrigerant,
             T_evap=T_evap,
@@ -2451,347 +2035,38 @@ elif tool_selection == "Manual Calculation":
             PLF=PLF,
         
             selected_material=selected_material,
-            pipe_row_for_size=_pipe_row_for_size,
+            pipe_row_for_size=partial(_pipe_row_for_size, pipe_lookup, selected_material),
         
             gc_max_pres=gc_max,
             gc_min_pres=gc_min,
         )
 
-        def get_pipe_results(size_inch):
+        def get_pipe_results(sizes, state):
             """
-            Reproduce MORfinal and dt for a given pipe size (exact same logic path as your main block).
-            Returns (MORfinal_value or NaN, dt_value) as floats.
+            Reproduce MORfinal and dt for a list of pipe sizes (same logic path as your main block).
+            Only the bore and K-factors change per size, so everything else comes from `state`
+            and the sweep runs as array arithmetic over all sizes at once.
+            Returns (MORfinal, dt) as float arrays aligned with `sizes`; NaN where a size has no usable row.
             """
-            # ---- Pipe geometry for this size ----
-            pipe_row = _pipe_row_for_size(size_inch)
-            try:
-                ID_mm_local = float(pipe_row["ID_mm"])
-            except Exception:
-                return float("nan"), float("nan")
-        
-            ID_m_local = ID_mm_local / 1000.0
-            area_m2_local = math.pi * (ID_m_local / 2) ** 2
-        
-            # ---- Densities (same as page) ----
-            dens = RefrigerantDensities()
-            props = RefrigerantProperties()
-            props_sup = RefrigerantProps()
-        
-            if refrigerant == "R744 TC":
-                density_super = dens.get_density("R744", T_evap - max_penalty + 273.15, superheat_K)
-                density_super2a = dens.get_density("R744", T_evap + 273.15, ((superheat_K + 5) / 2))
-                density_super2b = dens.get_density("R744", T_evap - max_penalty + 273.15, ((superheat_K + 5) / 2))
-                density_super2 = (density_super2a + density_super2b) / 2
-                density_super_foroil = dens.get_density("R744", T_evap + 273.15, min(max(superheat_K, 5), 30))
-                density_sat = props.get_properties("R744", T_evap)["density_vapor"]
-                density_5K = dens.get_density("R744", T_evap + 273.15, 5)
-                
-            else:
-                density_super = dens.get_density(refrigerant, T_evap - max_penalty + 273.15, superheat_K)
-                density_super2a = dens.get_density(refrigerant, T_evap + 273.15, ((superheat_K + 5) / 2))
-                density_super2b = dens.get_density(refrigerant, T_evap - max_penalty + 273.15, ((superheat_K + 5) / 2))
-                density_super2 = (density_super2a + density_super2b) / 2
-                density_super_foroil = dens.get_density(refrigerant, T_evap + 273.15, min(max(superheat_K, 5), 30))
-                density_sat = props.get_properties(refrigerant, T_evap)["density_vapor"]
-                density_5K = dens.get_density(refrigerant, T_evap + 273.15, 5)
-                    
-            density = (density_super + density_5K) / 2
-            density_foroil = (density_super_foroil + density_sat) / 2
-        
-            # ---- Mass flows (reuse from page; they’re size-independent) ----
-            # These should already be defined in your main code before calling the button:
-            # mass_flow_kg_s, mass_flow_kg_smin, mass_flow_foroil, mass_flow_foroilmin
-            # If not, we recompute them here exactly as you did:
-            try:
-                _ = mass_flow_kg_s  # noqa: F401
-            except NameError:
-                if refrigerant == "R744 TC":
-                    h_in = props_sup.get_enthalpy_sup(gc_max_pres, maxliq_temp)
-                    if gc_min_pres >= 73.8: 
-                        h_inmin = props_sup.get_enthalpy_sup(gc_min_pres, minliq_temp)
-                    elif gc_min_pres <= 72.13:
-                        h_inmin = props.get_properties("R744", minliq_temp)["enthalpy_liquid2"]
-                    else:
-                        st.error("This pressure range (72.13–73.8 bar) is not allowed. Please choose another value.")
-                        st.stop()
-                    h_inlet = h_in
-                    h_inletmin = h_inmin
-                    h_evap = props.get_properties("R744", T_evap)["enthalpy_vapor"]
-                    h_10K = props.get_properties("R744", T_evap)["enthalpy_super"]
-                else:
-                    h_in = props.get_properties(refrigerant, T_cond)["enthalpy_liquid2"]
-                    h_inmin = props.get_properties(refrigerant, minliq_temp)["enthalpy_liquid2"]
-                    h_inlet = props.get_properties(refrigerant, T_cond)["enthalpy_liquid"]
-                    h_inletmin = props.get_properties(refrigerant, minliq_temp)["enthalpy_liquid"]
-                    h_evap = props.get_properties(refrigerant, T_evap)["enthalpy_vapor"]
-                    h_10K = props.get_properties(refrigerant, T_evap)["enthalpy_super"]
-                hdiff_10K = h_10K - h_evap
-                hdiff_custom = hdiff_10K * min(max(superheat_K, 5), 30) / 10
-                h_super = h_evap + hdiff_custom
-                
-                delta_h = h_evap - h_in
-                delta_hmin = h_evap - h_inmin
-                h_foroil = (h_evap + h_super) / 2
-                delta_h_foroil = h_foroil - h_inlet
-                delta_h_foroilmin = h_foroil - h_inletmin
-        
-                mass_flow_kg_s = evap_capacity_kw / delta_h if delta_h > 0 else 0.01
-                mass_flow_kg_smin = evap_capacity_kw / delta_hmin if delta_hmin > 0 else 0.01
-                mass_flow_foroil = evap_capacity_kw / delta_h_foroil if delta_h_foroil > 0 else 0.01
-                mass_flow_foroilmin = evap_capacity_kw / delta_h_foroilmin if delta_h_foroilmin > 0 else 0.01
-        
-            # ---- Velocities (same mixing and refrigerant-dependent velocity1_prop) ----
-            v1 = mass_flow_kg_s / (area_m2_local * density)
-            v1min = mass_flow_kg_smin / (area_m2_local * density)
-            v2 = mass_flow_kg_s / (area_m2_local * density_super2)
-            v2min = mass_flow_kg_smin / (area_m2_local * density_super2)
-        
-            if refrigerant == "R744":
-                velocity1_prop = 1
-            elif refrigerant == "R744 TC":
-                velocity1_prop = 1
-            elif refrigerant == "R404A":
-                velocity1_prop = (0.0328330590542629 * superheat_K) - 1.47748765744183 if superheat_K > 45 else 0
-            elif refrigerant == "R134a":
-                velocity1_prop = (-0.000566085879684639 * (superheat_K ** 2)) + (0.075049554857083 * superheat_K) - 1.74200935399632 if superheat_K > 30 else 0
-            elif refrigerant in ["R407F", "R407A", "R410A", "R22", "R502", "R507A", "R448A", "R449A", "R717"]:
-                velocity1_prop = 1
-            elif refrigerant == "R407C":
-                velocity1_prop = 0
-            else:
-                velocity1_prop = (0.0000406422632403154 * (superheat_K ** 2)) - (0.000541007136813307 * superheat_K) + 0.748882946418884 if superheat_K > 30 else 0.769230769230769
-        
-            velocity_m_s = (v1 * velocity1_prop) + (v2 * (1 - velocity1_prop))
-            velocity_m_smin = (v1min * velocity1_prop) + (v2min * (1 - velocity1_prop))
-            velocity_m_sfinal = max(velocity_m_s, velocity_m_smin)
-        
-            # ---- Oil density (same branches) ----
-            if refrigerant in ["R23", "R508B"]:
-                oil_density_sat = (-0.853841209044878 * T_evap) + 999.190772536527
-                oil_density_super = (-0.853841209044878 * (T_evap + min(max(superheat_K, 5), 30))) + 999.190772536527
-            else:
-                oil_density_sat = (-0.00356060606060549 * (T_evap ** 2)) - (0.957878787878808 * T_evap) + 963.595454545455
-                oil_density_super = (-0.00356060606060549 * ((T_evap + min(max(superheat_K, 5), 30)) ** 2)) - (0.957878787878808 * (T_evap + min(max(superheat_K, 5), 30))) + 963.595454545455
-            oil_density = (oil_density_sat + oil_density_super) / 2
-        
-            # ---- jg_half (per refrigerant) ----
-            jg_map = {
-                "R404A": 0.860772464072673, "R134a": 0.869986729796935, "R407F": 0.869042493641944,
-                "R744": 0.877950613678719, "R407A": 0.867374311574041, "R410A": 0.8904423325365,
-                "R407C": 0.858592104849471, "R22": 0.860563058394146, "R502": 0.858236706656266,
-                "R507A": 0.887709710291009, "R449A": 0.867980496631757, "R448A": 0.86578818145833,
-                "R717": 0.854957410951708, "R290": 0.844975139695726, "R1270": 0.849089717732815,
-                "R600a": 0.84339338979887, "R1234ze": 0.867821375349728, "R1234yf": 0.860767472602571,
-                "R12": 0.8735441986466, "R11": 0.864493203834913, "R454B": 0.869102255850291,
-                "R450A": 0.865387140496035, "R513A": 0.861251244627232, "R454A": 0.868161104592492,
-                "R455A": 0.865687329727713, "R454C": 0.866423016875524, "R32": 0.875213309852597,
-                "R23": 0.865673418568001, "R508B": 0.864305626845382, "R744 TC": 0.877950613678719,
-            }
-            jg_half = jg_map.get(refrigerant, 0.865)
-        
-            # ---- MOR (same as page) ----
-            MinMassFlux = (jg_half ** 2) * ((density_foroil * 9.81 * ID_m_local * (oil_density - density_foroil)) ** 0.5)
-            MinMassFlow = MinMassFlux * area_m2_local
-            MOR_pre = (MinMassFlow / mass_flow_foroil) * 100
-            MOR_premin = (MinMassFlow / mass_flow_foroilmin) * 100
-        
-            # Special corrections
-            if refrigerant in ["R23", "R508B"]:
-                MOR_correctliq = T_cond + 47.03
-                MOR_correctliqmin = minliq_temp + 47.03
-                evapoil = T_evap + 46.14
-            else:
-                MOR_correctliq = T_cond
-                MOR_correctliqmin = minliq_temp
-                evapoil = T_evap
+            # ---- Pipe geometry and K-factors for every size (precomputed per material) ----
+            rows = _sweep_rows(pipe_lookup, selected_material, sizes)
+            K = rows[:, 1:]
         
-            # First correction vs liquid temp
-            if refrigerant == "R744":
-                MOR_correction = (0.000225755013421421 * MOR_correctliq) - 0.00280879370374927
-            elif refrigerant == "R744 TC":
-                MOR_correction = (0.0000603336117708171 * h_in) - 0.0142318718120024
-            elif refrigerant in ["R407A", "R449A", "R448A", "R502"]:
-                MOR_correction = (0.00000414431651323856 * (MOR_correctliq ** 2)) + (0.000381908525139781 * MOR_correctliq) - 0.0163450053041212
-            elif refrigerant == "R507A":
-                MOR_correction = (0.000302619054048837 * MOR_correctliq) - 0.00930188913363997
-            elif refrigerant == "R22":
-                MOR_correction = (0.000108153843367715 * MOR_correctliq) - 0.00329248681202757
-            elif refrigerant == "R407C":
-                MOR_correction = (0.00000420322918839302 * (max(MOR_correctliq, -32.0716410083429) ** 2)) + (0.000269608915211859 * max(MOR_correctliq, -32.0716410083429)) - 0.0134546663857195
-            elif refrigerant == "R410A":
-                MOR_correction = 0
-            elif refrigerant == "R407F":
-                MOR_correction = (0.00000347332380289385 * (max(MOR_correctliq, -34.4346433150568) ** 2)) + (0.000239205332540693 * max(MOR_correctliq, -34.4346433150568)) - 0.0121545316131988
-            elif refrigerant == "R134a":
-                MOR_correction = (0.000195224660107459 * MOR_correctliq) - 0.00591757011487048
-            elif refrigerant == "R404A":
-                MOR_correction = (0.0000156507169104918 * (max(MOR_correctliq, -22.031637377024) ** 2)) + (0.000689621839324826 * max(MOR_correctliq, -22.031637377024)) - 0.0392
-            else:
-                MOR_correction = (0.00000461020482461793 * (max(MOR_correctliq, -23.6334996273983) ** 2)) + (0.000217910548009675 * max(MOR_correctliq, -23.6334996273983)) - 0.012074621594626
+            ID_m_arr = rows[:, 0] / 1000.0
+            area_arr = math.pi * (ID_m_arr / 2) ** 2
         
-            if refrigerant == "R744":
-                MOR_correctionmin = (0.000225755013421421 * MOR_correctliqmin) - 0.00280879370374927
-            elif refrigerant == "R744 TC":
-                MOR_correctionmin = (0.0000603336117708171 * h_inmin) - 0.0142318718120024
-            elif refrigerant in ["R407A", "R449A", "R448A", "R502"]:
-                MOR_correctionmin = (0.00000414431651323856 * (MOR_correctliqmin ** 2)) + (0.000381908525139781 * MOR_correctliqmin) - 0.0163450053041212
-            elif refrigerant == "R507A":
-                MOR_correctionmin = (0.000302619054048837 * MOR_correctliqmin) - 0.00930188913363997
-            elif refrigerant == "R22":
-                MOR_correctionmin = (0.000108153843367715 * MOR_correctliqmin) - 0.00329248681202757
-            elif refrigerant == "R407C":
-                MOR_correctionmin = (0.00000420322918839302 * (max(MOR_correctliqmin, -32.0716410083429) ** 2)) + (0.000269608915211859 * max(MOR_correctliqmin, -32.0716410083429)) - 0.0134546663857195
-            elif refrigerant == "R410A":
-                MOR_correctionmin = 0
-            elif refrigerant == "R407F":
-                MOR_correctionmin = (0.00000347332380289385 * (max(MOR_correctliqmin, -34.4346433150568) ** 2)) + (0.000239205332540693 * max(MOR_correctliqmin, -34.4346433150568)) - 0.0121545316131988
-            elif refrigerant == "R134a":
-                MOR_correctionmin = (0.000195224660107459 * MOR_correctliqmin) - 0.00591757011487048
-            elif refrigerant == "R404A":
-                MOR_correctionmin = (0.0000156507169104918 * (max(MOR_correctliqmin, -22.031637377024) ** 2)) + (0.000689621839324826 * max(MOR_correctliqmin, -22.031637377024)) - 0.0392
-            else:
-                MOR_correctionmin = (0.00000461020482461793 * (max(MOR_correctliqmin, -23.6334996273983) ** 2)) + (0.000217910548009675 * max(MOR_correctliqmin, -23.6334996273983)) - 0.012074621594626
+            eps = pipe_roughness(selected_material)
         
-            # Second correction vs evap temp
-            if refrigerant == "R744":
-                MOR_correction2 = (-0.0000176412848988908 * (evapoil ** 2)) - (0.00164308248808803 * evapoil) - 0.0184308798286039
-            elif refrigerant == "R744 TC":
-                MOR_correction2 = (-0.0000176412848988908 * (evapoil ** 2)) - (0.00164308248808803 * evapoil) - 0.0184308798286039
-            elif refrigerant == "R407A":
-                MOR_correction2 = (-0.000864076433837511 * evapoil) - 0.0145018190416687
-            elif refrigerant == "R449A":
-                MOR_correction2 = (-0.000835375233693285 * evapoil) - 0.0138846063856621
-            elif refrigerant == "R448A":
-                MOR_correction2 = (0.00000171366802431428 * (evapoil ** 2)) - (0.000865528727278154 * evapoil) - 0.0152961902042161
-            elif refrigerant == "R502":
-                MOR_correction2 = (0.00000484734071020993 * (evapoil ** 2)) - (0.000624822304716683 * evapoil) - 0.0128725684240106
-            elif refrigerant == "R507A":
-                MOR_correction2 = (-0.000701333343440148 * evapoil) - 0.0114900933623056
-            elif refrigerant == "R22":
-                MOR_correction2 = (0.00000636798209134899 * (evapoil ** 2)) - (0.000157783204337396 * evapoil) - 0.00575251626397381
-            elif refrigerant == "R407C":
-                MOR_correction2 = (-0.00000665735727676349 * (evapoil ** 2)) - (0.000894860288947537 * evapoil) - 0.0116054361757929
-            elif refrigerant == "R410A":
-                MOR_correction2 = (-0.000672268853990701 * evapoil) - 0.0111802230098585
-            elif refrigerant == "R407F":
-                MOR_correction2 = (0.00000263731418614519 * (evapoil ** 2)) - (0.000683997257738699 * evapoil) - 0.0126005968942147
-            elif refrigerant == "R134a":
-                MOR_correction2 = (-0.00000823045532174214 * (evapoil ** 2)) - (0.00108063672211041 * evapoil) - 0.0217411206961643
-            elif refrigerant == "R404A":
-                MOR_correction2 = (0.00000342378568620316 * (evapoil ** 2)) - (0.000329572335134041 * evapoil) - 0.00706087606597149
-            else:
-                MOR_correction2 = (-0.000711441807827186 * evapoil) - 0.0118194116436425
-        
-            # Compose MOR / bounds
-            MOR, MORmin, MORfinal_local = "", "", ""
-            if refrigerant in ["R23", "R508B"]:
-                if -86 <= T_evap <= -42:
-                    MOR = (1 - MOR_correction) * (1 - MOR_correction2) * MOR_pre
-                    MORmin = (1 - MOR_correctionmin) * (1 - MOR_correction2) * MOR_premin
-                    MORfinal_local = max(MOR, MORmin)
-            else:
-                if -40 <= T_evap <= 4:
-                    MOR = (1 - MOR_correction) * (1 - MOR_correction2) * MOR_pre
-                    MORmin = (1 - MOR_correctionmin) * (1 - MOR_correction2) * MOR_premin
-                    MORfinal_local = max(MOR, MORmin)
-        
-            # ---- density/viscosity for Reynolds (same path) ----
-            # use the same density_recalc definition (note: uses velocity_m_s, not final)
-            if velocity_m_s > 0:
-                density_recalc_local = mass_flow_kg_s / (velocity_m_s * area_m2_local)
-            else:
-                density_recalc_local = density  # fallback
-        
-            visc = RefrigerantViscosities()
-            
-            if refrigerant == "R744 TC":
-                viscosity_super = visc.get_viscosity("R744", T_evap - max_penalty + 273.15, superheat_K)
-                viscosity_super2a = visc.get_viscosity("R744", T_evap + 273.15, ((superheat_K + 5) / 2))
-                viscosity_super2b = visc.get_viscosity("R744", T_evap - max_penalty + 273.15, ((superheat_K + 5) / 2))
-                viscosity_super2 = (viscosity_super2a + viscosity_super2b) / 2
-                viscosity_5K = visc.get_viscosity("R744", T_evap + 273.15, 5)
-
-            else:
-                viscosity_super = visc.get_viscosity(refrigerant, T_evap - max_penalty + 273.15, superheat_K)
-                viscosity_super2a = visc.get_viscosity(refrigerant, T_evap + 273.15, ((superheat_K + 5) / 2))
-                viscosity_super2b = visc.get_viscosity(refrigerant, T_evap - max_penalty + 273.15, ((superheat_K + 5) / 2))
-                viscosity_super2 = (viscosity_super2a + viscosity_super2b) / 2
-                viscosity_5K = visc.get_viscosity(refrigerant, T_evap + 273.15, 5)
-            viscosity = (viscosity_super + viscosity_5K) / 2
-            viscosity_final = (viscosity * velocity1_prop) + (viscosity_super2 * (1 - velocity1_prop))
-        
-            reynolds_local = (density_recalc_local * velocity_m_sfinal * ID_m_local) / (viscosity_final / 1_000_000)
-        
-            # ---- friction factor (same eps/material logic) ----
-            eps = 0.00004572 if selected_material in ["Steel SCH40", "Steel SCH80"] else 0.000001524
-        
-            if reynolds_local < 2000.0:
-                f_local = 64.0 / max(reynolds_local, 1e-9)
-            else:
-                tol = 1e-5
-                max_iter = 60
-                flo, fhi = 1e-5, 0.1
-        
-                def balance(gg):
-                    s = math.sqrt(gg)
-                    lhs = 1.0 / s
-                    rhs = -2.0 * math.log10((eps / (3.7 * ID_m_local)) + 2.51 / (reynolds_local * s))
-                    return lhs, rhs
-        
-                for _ in range(max_iter):
-                    f_try = 0.5 * (flo + fhi)
-                    lhs, rhs = balance(f_try)
-                    if abs(1.0 - lhs / rhs) < tol:
-                        f_local = f_try
-                        break
-                    if (lhs - rhs) > 0.0:
-                        flo = f_try
-                    else:
-                        fhi = f_try
-                else:
-                    f_local = 0.5 * (flo + fhi)
-        
-            # ---- pressure drops & ΔT (use this pipe's K-factors) ----
-            required_cols = ["SRB", "LRB", "BALL", "GLOBE"]
-            for c in required_cols:
-                if c not in pipe_row.index:
-                    return float("nan"), float("nan")
-        
-            K_SRB = float(pipe_row["SRB"])
-            K_LRB = float(pipe_row["LRB"])
-            K_BALL = float(pipe_row["BALL"])
-            K_GLOBE = float(pipe_row["GLOBE"])
-        
-            q_kPa_local = 0.5 * density_recalc_local * (velocity_m_sfinal ** 2) / 1000.0
-        
-            B_SRB = SRB + 0.5 * _45 + 2.0 * ubend + 3.0 * ptrap
-            B_LRB = LRB + MAC
-        
-            dp_pipe_kPa_local = f_local * (L / ID_m_local) * q_kPa_local
-            dp_plf_kPa_local = q_kPa_local * PLF
-            dp_fittings_kPa_local = q_kPa_local * (K_SRB * B_SRB + K_LRB * B_LRB)
-            dp_valves_kPa_local = q_kPa_local * (K_BALL * ball + K_GLOBE * globe)
-            dp_total_kPa_local = dp_pipe_kPa_local + dp_fittings_kPa_local + dp_valves_kPa_local + dp_plf_kPa_local
-        
-            converter = PressureTemperatureConverter()
-            if refrigerant == "R744 TC":
-                evappres_local = converter.temp_to_pressure("R744", T_evap)
-            else:
-                evappres_local = converter.temp_to_pressure(refrigerant, T_evap)
-            postcirc_local = evappres_local - (dp_total_kPa_local / 100)
-            if refrigerant == "R744 TC":
-                postcirctemp_local = converter.pressure_to_temp("R744", postcirc_local)
-            else:
-                postcirctemp_local = converter.pressure_to_temp(refrigerant, postcirc_local)
-            dt_local = T_evap - postcirctemp_local
+            MORfinal_arr, dp_total_kPa_arr = _suction_sweep(
+                state, ID_m_arr, area_arr, K, fitting_counts, eps, L, PLF,
+            )
         
-            # ---- Numeric return (handle blank MOR) ----
-            if MORfinal_local == "":
-                mor_num = float("nan")
-            else:
-                mor_num = float(MORfinal_local)
+            converter = CONV
+            ref = "R744" if refrigerant == "R744 TC" else refrigerant
+            postcirc_arr = state.evappres - (dp_total_kPa_arr / 100)
+            dt_arr = T_evap - converter.pressure_to_temp_array(ref, postcirc_arr)
         
-            return mor_num, float(dt_local)
+            return MORfinal_arr, dt_arr
 
         from functools import lru_cache
         
@@ -2824,8 +2099,8 @@ elif tool_selection == "Manual Calculation":
 
         @lru_cache(maxsize=None)
         def MOR_full_cached(size):
-            MOR_s, _ = get_pipe_results(size)
-            return MOR_s
+            MOR_s, _ = get_pipe_results([size], suction)
+            return float(MOR_s[0])
 
         @st.cache_data(show_spinner=False)
         def _cached_double_riser(*args, **kwargs):
@@ -2833,45 +2108,47 @@ elif tool_selection == "Manual Calculation":
 
         col1, col2, col3, col4, col5, spacer = st.columns([0.1, 0.1, 0.1, 0.1, 0.1, 0.4])
         
+        # nominal mm per entry of pipe_sizes, for picking the smallest passing size
+        size_mm_arr = pipe_lookup["mm_arr_by_material"][selected_material]
+        
         # holders for messages to show later (full width)
         error_message = None
         debug_errors = None
         
+        # The auto-select row stays beside Double Riser Mode; its buttons size
+        # against the last submitted Max Penalty / Oil Return Duty.
         with col1:
             st.write("Auto-select")
         
         with col2:
             if st.button("Horizontal"):
                 st.session_state.double_trouble = False
-                results, errors = [], []
+                errors = []
+                try:
+                    _, dt_arr = get_pipe_results(pipe_sizes, suction)
+                except Exception as e:
+                    dt_arr = np.full(len(pipe_sizes), np.nan)
+                    errors.append(("all sizes", str(e)))
         
-                for ps in pipe_sizes:
-                    try:
-                        MOR_i, dt_i = get_pipe_results(ps)
-                        if math.isfinite(dt_i):
-                            results.append({"size": ps, "dt": dt_i})
-                        else:
-                            errors.append((ps, "Non-numeric ΔT"))
-                    except Exception as e:
-                        errors.append((ps, str(e)))
-        
-                if not results:
+                finite = np.isfinite(dt_arr)
+                errors += [(ps, "Non-numeric ΔT") for ps, ok in zip(pipe_sizes, finite) if not ok]
+        
+                if not finite.any():
                     debug_errors = errors
                     error_message = "No valid pipe sizes found. Check inputs and CSV rows."
                 else:
-                    valid = [r for r in results if r["dt"] <= max_penalty]
+                    best_i = _smallest_passing(finite & (dt_arr <= max_penalty), size_mm_arr)
         
-                    if valid:
-                        best = min(valid, key=lambda x: mm_map[x["size"]])
-                        st.session_state["_next_selected_size"] = best["size"]
+                    if best_i is not None:
+                        st.session_state["_next_selected_size"] = pipe_sizes[best_i]
         
                         st.success(
-                            f"✅ Selected low-ΔT pipe size: **{best['size']}**  \n"
-                            f"ΔT: {best['dt']:.3f} K (limit {max_penalty:.3f} K)"
+                            f"✅ Selected low-ΔT pipe size: **{pipe_sizes[best_i]}**  \n"
+                            f"ΔT: {dt_arr[best_i]:.3f} K (limit {max_penalty:.3f} K)"
                         )
                         st.rerun()
                     else:
-                        best_dt = min(r["dt"] for r in results)
+                        best_dt = dt_arr[finite].min()
                         error_message = (
                             f"❌ No pipe satisfies the ΔT limit.\n"
                             f"Best achievable ΔT is **{best_dt:.3f} K**, "
@@ -2881,35 +2158,31 @@ elif tool_selection == "Manual Calculation":
         with col3:
             if st.button("Single Riser"):
                 st.session_state.double_trouble = False
-                results, errors = [], []
+                errors = []
+                try:
+                    MOR_arr, dt_arr = get_pipe_results(pipe_sizes, suction)
+                except Exception as e:
+                    MOR_arr = dt_arr = np.full(len(pipe_sizes), np.nan)
+                    errors.append(("all sizes", str(e)))
         
-                for ps in pipe_sizes:
-                    try:
-                        MOR_i, dt_i = get_pipe_results(ps)
-                        if math.isfinite(MOR_i) and math.isfinite(dt_i):
-                            results.append({"size": ps, "MORfinal": MOR_i, "dt": dt_i})
-                        else:
-                            errors.append((ps, "Non-numeric MOR or ΔT"))
-                    except Exception as e:
-                        errors.append((ps, str(e)))
-        
-                if not results:
+                finite = np.isfinite(MOR_arr) & np.isfinite(dt_arr)
+                errors += [(ps, "Non-numeric MOR or ΔT") for ps, ok in zip(pipe_sizes, finite) if not ok]
+        
+                if not finite.any():
                     debug_errors = errors
                     error_message = "No valid pipe size results. Check inputs and CSV rows."
                 else:
-                    valid = [
-                        r for r in results
-                        if (r["MORfinal"] <= required_oil_duty_pct)
-                        and (r["dt"] <= max_penalty)
-                    ]
+                    best_i = _smallest_passing(
+                        finite & (MOR_arr <= required_oil_duty_pct) & (dt_arr <= max_penalty),
+                        size_mm_arr,
+                    )
         
-                    if valid:
-                        best = min(valid, key=lambda x: mm_map[x["size"]])
-                        st.session_state["_next_selected_size"] = best["size"]
+                    if best_i is not None:
+                        st.session_state["_next_selected_size"] = pipe_sizes[best_i]
         
                         st.success(
-                            f"✅ Selected optimal pipe size: **{best['size']}**  \n"
-                            f"MOR: {best['MORfinal']:.1f}% | ΔT: {best['dt']:.2f} K"
+                            f"✅ Selected optimal pipe size: **{pipe_sizes[best_i]}**  \n"
+                            f"MOR: {MOR_arr[best_i]:.1f}% | ΔT: {dt_arr[best_i]:.2f} K"
                         )
                         st.rerun()
                     else:
@@ -3118,7 +2391,7 @@ elif tool_selection == "Manual Calculation":
                     else:
                         st.metric("Min Oil Return", f"{MOR_full_flow:.1f}%")
                 else:
-                    if MORfinal == "":
+                    if math.isnan(MORfinal):
                         st.metric("MOR (%)", "")
                     else:
                         st.metric("MOR (%)", f"{MORfinal:.1f}%")
@@ -3159,7 +2432,7 @@ elif tool_selection == "Manual Calculation":
                     else:
                         st.metric("Max Oil Return", f"{MOR_large:.1f}%")
                 else:
-                    if MORfinal == "":
+                    if math.isnan(MinCap):
                         st.metric("Minimum Capacity", "")
                     else:
                         st.metric("Minimum Capacity", f"{MinCap:.4f}kW")
@@ -3199,7 +2472,7 @@ elif tool_selection == "Manual Calculation":
             else:
                 st.error(f"{message}")   
         else:
-            if isinstance(MORfinal, (int, float)):
+            if not math.isnan(MORfinal):
                 is_ok, message = (True, "✅ OK") if required_oil_duty_pct >= MORfinal else (False, "❌ Insufficient flow")
             else:
                 is_ok, message = (False, "")
@@ -3212,127 +2485,19 @@ elif tool_selection == "Manual Calculation":
     if mode == "Liquid":
         
         # Load pipe data
-        pipe_data = pd.read_csv("data/pipe_pressure_ratings_full.csv")
-    
-        # --- helpers ---
-        def _nps_inch_to_mm(nps_str: str) -> float:
-            # e.g. "1-1/8", '1"', "3/8"
-            s = str(nps_str).replace('"', '').strip()
-            if not s:
-                return float('nan')
-            parts = s.split('-')
-            tot_in = 0.0
-            for p in parts:
-                p = p.strip()
-                if not p:
-                    continue
-                if '/' in p:
-                    num, den = p.split('/')
-                    tot_in += float(num) / float(den)
-                else:
-                    tot_in += float(p)
-            return tot_in * 25.4  # mm
+        pipe_lookup = _pipe_index()
     
         ss = st.session_state
     
-        # 1) Pipe material
         col1, col2, col3, col4 = st.columns(4)
-        with col2:
-            if refrigerant == "R717":
-                excluded_materials = ["Copper ASTM", " Copper EN12735", "K65 Copper", "Reflok Aluminium"]
-                pipe_materials = sorted(m for m in pipe_data["Material"].dropna().unique()
-                                        if m not in excluded_materials)
-            else:
-                pipe_materials = sorted(pipe_data["Material"].dropna().unique())
-    
-            selected_material = st.selectbox("Pipe Material", pipe_materials, key="material")
-        
-        # detect material change
-        material_changed = ss.get("last_material") is not None and ss.last_material != selected_material
-        ss.last_material = selected_material
-    
-        # 2) Sizes for selected material (de-duped)
-        material_df = pipe_data[pipe_data["Material"] == selected_material].copy()
-    
-        sizes_df = (
-            material_df[["Nominal Size (inch)", "Nominal Size (mm)"]]
-            .dropna(subset=["Nominal Size (inch)"])
-            .assign(**{
-                "Nominal Size (inch)": lambda d: d["Nominal Size (inch)"].astype(str).str.strip(),
-            })
-            .drop_duplicates(subset=["Nominal Size (inch)"], keep="first")
-        )
-    
-        # make sure we have a numeric mm per nominal (fallback: parse the inch string)
-        sizes_df["mm_num"] = pd.to_numeric(sizes_df.get("Nominal Size (mm)"), errors="coerce")
-        sizes_df.loc[sizes_df["mm_num"].isna(), "mm_num"] = sizes_df.loc[sizes_df["mm_num"].isna(), "Nominal Size (inch)"].apply(_nps_inch_to_mm)
-    
-        pipe_sizes = sizes_df["Nominal Size (inch)"].tolist()
-        mm_map = dict(zip(sizes_df["Nominal Size (inch)"], sizes_df["mm_num"]))
-    
-        # choose default index
-        def _closest_index(target_mm: float) -> int:
-            mm_list = [mm_map[s] for s in pipe_sizes]
-            return min(range(len(mm_list)), key=lambda i: abs(mm_list[i] - target_mm)) if mm_list else 0
-    
-        # --- consume any deferred selection from the button ---
-        if "_next_selected_size" in st.session_state:
-            new_val = st.session_state.pop("_next_selected_size")
-            # only accept if the option exists for the current material
-            if new_val in pipe_sizes:
-                # force the widget to pick this value on next render
-                st.session_state["selected_size"] = new_val
-                # optional: keep a one-shot override flag so we can clean up later
-                st.session_state["_selected_size_just_set"] = True
-        
-        default_index = 0
-        if material_changed and "prev_pipe_mm" in ss:
-            default_index = _closest_index(ss.prev_pipe_mm)
-        elif selected_material == " Copper EN12735" and ("1/2" in pipe_sizes or '1/2"' in pipe_sizes):
-            # first load or no previous selection → prefer 1-1/8" for  Copper EN12735
-            want = "1/2" if "1/2" in pipe_sizes else '1/2"'
-            default_index = pipe_sizes.index(want)
-        elif "selected_size" in ss and ss.selected_size in pipe_sizes:
-            # if Streamlit kept the selection, use it
-            default_index = pipe_sizes.index(ss.selected_size)
-        
-        with col1:
-            selected_size = st.selectbox(
-                "Nominal Pipe Size (inch)",
-                pipe_sizes,
-                index=default_index,
-                key="selected_size",
-            )
-    
-        # remove the one-shot flag so future reruns don't keep forcing it
-        if st.session_state.get("_selected_size_just_set"):
-            del st.session_state["_selected_size_just_set"]
-        
-        # remember the selected size in mm for next material change
-        ss.prev_pipe_mm = float(mm_map.get(selected_size, float("nan")))
-
-        # --- consume any deferred gauge from Auto-select ---
-        if "_next_gauge" in st.session_state:
-            g = st.session_state.pop("_next_gauge")
-        
-            # Only apply if the current size actually has that gauge option
-            rows = material_df[
-                material_df["Nominal Size (inch)"].astype(str).str.strip() == str(selected_size)
-            ]
-            if "Gauge" in rows.columns and rows["Gauge"].notna().any():
-                valid_gauges = set(rows["Gauge"].dropna().unique())
-                if g in valid_gauges:
-                    st.session_state["gauge"] = g
-    
-        # 3) Gauge (if applicable)
-        gauge_options = material_df[material_df["Nominal Size (inch)"].astype(str).str.strip() == selected_size]
-        if "Gauge" in gauge_options.columns and gauge_options["Gauge"].notna().any():
-            gauges = sorted(gauge_options["Gauge"].dropna().unique())
-            with col2:
-                selected_gauge = st.selectbox("Copper Gauge", gauges, key="gauge")
-            selected_pipe_row = gauge_options[gauge_options["Gauge"] == selected_gauge].iloc[0]
-        else:
-            selected_pipe_row = gauge_options.iloc[0]
+        pipe_sel = _pipe_selector(pipe_lookup, refrigerant, col1, col2, default_size="1/2")
+        selected_material = pipe_sel.material
+        selected_size = pipe_sel.size
+        selected_gauge = pipe_sel.gauge
+        selected_pipe_row = pipe_sel.row
+        pipe_sizes = pipe_sel.sizes
+        mm_map = pipe_sel.mm_map
+        material_df = pipe_sel.material_df
 
         pipe_index = material_to_pipe_index(selected_material)
         
@@ -3365,18 +2530,11 @@ elif tool_selection == "Manual Calculation":
             evap_capacity_kw = st.number_input("Evaporator Capacity (kW)", min_value=0.03, max_value=20000.0, value=10.0, step=1.0)
             
             # --- Base ranges per refrigerant ---
-            if refrigerant in ("R23", "R508B"):
-                evap_min, evap_max, evap_default = -100.0, -20.0, -80.0
-                cond_min, cond_max, cond_default = -100.0, 10.0, -30.0
-                maxliq_min, maxliq_max, maxliq_default = -100.0, 10.0, -40.0
-            elif refrigerant == "R744":
-                evap_min, evap_max, evap_default = -50.0, 20.0, -10.0
-                cond_min, cond_max, cond_default = -23.0, 30.0, 15.0
-                maxliq_min, maxliq_max, maxliq_default = -50.0, 30.0, 10.0
-            else:
-                evap_min, evap_max, evap_default = -50.0, 30.0, -10.0
-                cond_min, cond_max, cond_default = -23.0, 60.0, 43.0
-                maxliq_min, maxliq_max, maxliq_default = -50.0, 60.0, 40.0
+            (
+                (evap_min, evap_max, evap_default),
+                (cond_min, cond_max, cond_default),
+                (maxliq_min, maxliq_max, maxliq_default),
+            ) = SYSTEM_TEMP_RANGES.get(refrigerant, SYSTEM_TEMP_RANGES["_default"])
     
             # --- Init state (widget-backed) ---
             ss = st.session_state
@@ -3391,11 +2549,7 @@ elif tool_selection == "Manual Calculation":
             ss.setdefault("maxliq_temp", maxliq_default)
             ss.setdefault("evap_temp",   evap_default)
 
-            if "maxliq_temp" in ss and "cond_temp" in ss and "evap_temp" in ss:
-                ss.cond_temp = min(max(ss.cond_temp, ss.maxliq_temp, ss.evap_temp), cond_max)
-    
-            if "cond_temp" in ss and "maxliq_temp" in ss and "evap_temp" in ss:
-                ss.evap_temp = min(ss.maxliq_temp, ss.cond_temp, ss.evap_temp)
+            _clamp_cond_temps(cond_max)
             
             # --- Callbacks implementing your downstream clamping logic ---
             def on_change_cond():
@@ -3482,10 +2636,6 @@ elif tool_selection == "Manual Calculation":
             globe = st.number_input("Globe Valves", min_value=0, max_value=20, value=0, step=1, key="globe")
             PLF = st.number_input("Pressure Loss Factors", min_value=0.0, max_value=20.0, value=0.0, step=0.1)
         
-        from utils.refrigerant_properties import RefrigerantProperties
-        from utils.refrigerant_densities import RefrigerantDensities
-        from utils.refrigerant_viscosities import RefrigerantViscosities
-        from utils.supercompliq_co2 import RefrigerantProps
     
         if refrigerant == "R744 TC":
             T_evap = evaporating_temp
@@ -3496,8 +2646,8 @@ elif tool_selection == "Manual Calculation":
             T_liq = maxliq_temp
             T_cond = condensing_temp
     
-        props = RefrigerantProperties()
-        props_sup = RefrigerantProps()
+        props = PROPS
+        props_sup = PROPS_SUP
         
         if refrigerant == "R744 TC":
             h_in = props_sup.get_enthalpy_sup(gc_max_pres, maxliq_temp)
@@ -3510,66 +2660,28 @@ elif tool_selection == "Manual Calculation":
         delta_h = h_evap - h_in
 
         mass_flow_kg_s = evap_capacity_kw / delta_h if delta_h > 0 else 0.01
+
+        # Liquid properties depend only on T_liq, so one lookup serves the
+        # selected size and every size in the auto-select sweep
+        if refrigerant == "R744 TC":
+            density = props_sup.get_density_sup(gc_max_pres, maxliq_temp)
+            viscosity = props_sup.get_viscosity_sup(gc_max_pres, maxliq_temp)
+        else:
+            liq_props = props.get_properties(refrigerant, T_liq)
+            density = liq_props["density_liquid2"]
+            viscosity = liq_props["viscosity_liquid"]
     
         if ID_mm is not None:
             ID_m = ID_mm / 1000.0
 
             area_m2 = math.pi * (ID_m / 2) ** 2
 
-            if refrigerant == "R744 TC":
-                density = props_sup.get_density_sup(gc_max_pres, maxliq_temp)
-            else:
-                density = RefrigerantProperties().get_properties(refrigerant, T_liq)["density_liquid2"]
-
             velocity_m_s = mass_flow_kg_s / (area_m2 * density)
 
         else:
             velocity_m_s = None
-
-        if refrigerant == "R744 TC":
-            viscosity = props_sup.get_viscosity_sup(gc_max_pres, maxliq_temp)
-        else:
-            viscosity = RefrigerantProperties().get_properties(refrigerant, T_liq)["viscosity_liquid"]
-    
-        reynolds = (density * velocity_m_s * ID_m) / (viscosity / 1000000)
-    
-        if selected_material in ["Steel SCH40", "Steel SCH80"]:
-            eps = 0.00004572 #0.00015
-        else:
-            eps = 0.000001524 #0.000005
-        
-        tol = 1e-5
-        max_iter = 60
-        
-        if reynolds < 2000.0:
-            f = 64.0 / reynolds
-        else:
-            flo, fhi = 1e-5, 0.1
-            def balance(gg):
-                s = math.sqrt(gg)
-                lhs = 1.0 / s
-                rhs = -2.0 * math.log10((eps / (3.7 * ID_m)) + 2.51 / (reynolds * s))
-                return lhs, rhs
-    
-            f = 0.5 * (flo + fhi)
-            for _ in range(max_iter):
-                f = 0.5 * (flo + fhi)
-                lhs, rhs = balance(f)
-                if abs(1.0 - lhs/rhs) < tol:
-                    break
-                # decide side using sign of (lhs - rhs)
-                if (lhs - rhs) > 0.0:
-                    flo = f
-                else:
-                    fhi = f
-        
-        # dynamic (velocity) pressure, kPa
-        q_kPa = 0.5 * density * (velocity_m_s ** 2) / 1000.0
     
-        # 1) straight pipe only
-        dp_pipe_kPa = f * (L / ID_m) * q_kPa
-        
-        dp_plf_kPa = q_kPa * PLF
+        eps = pipe_roughness(selected_material)
     
         required_cols = ["SRB", "LRB", "BALL", "GLOBE"]
         missing = [c for c in required_cols if c not in selected_pipe_row.index]
@@ -3577,42 +2689,31 @@ elif tool_selection == "Manual Calculation":
             st.error(f"CSV missing required K columns: {missing}")
             st.stop()
     
-        # Convert to floats and check NaNs
-        try:
-            K_SRB  = float(selected_pipe_row["SRB"])
-            K_LRB  = float(selected_pipe_row["LRB"])
-            K_BALL = float(selected_pipe_row["BALL"])
-            K_GLOBE= float(selected_pipe_row["GLOBE"])
-        except Exception as e:
-            st.error(f"Failed to parse K-factors as numbers: {e}")
-            st.stop()
-    
-        if any(pd.isna([K_SRB, K_LRB, K_BALL, K_GLOBE])):
+        # K columns are float64 from load, so one array read replaces per-column coercion
+        K_row = selected_pipe_row[required_cols].to_numpy(dtype=float)
+        if np.isnan(K_row).any():
             st.error("One or more K-factors are NaN in the CSV row.")
             st.stop()
         
         B_SRB = SRB + 0.5 * _45 + 2.0 * ubend + 3.0 * ptrap
         B_LRB = LRB + MAC
+        # same counts weight every size in the auto-select sweep
+        fitting_counts = np.array([B_SRB, B_LRB, ball, globe], dtype=float)
     
-        dp_fittings_kPa = q_kPa * (
-        K_SRB   * B_SRB +
-        K_LRB   * B_LRB
-        )
-
-        dp_valves_kPa = q_kPa * (
-        K_BALL  * ball +
-        K_GLOBE * globe
+        # straight pipe, fittings, valves and PLF, same helper as the auto-select sweep
+        dp_pipe_kPa, dp_fittings_kPa, dp_valves_kPa, dp_plf_kPa = _liquid_line_dp(
+            mass_flow_kg_s, density, viscosity, ID_m, area_m2, K_row, fitting_counts, eps, L, PLF,
         )
         
         dp_total_kPa = dp_pipe_kPa + dp_fittings_kPa + dp_valves_kPa + dp_plf_kPa
         
         if refrigerant == "R744 TC":
-            converter = PressureTemperatureConverter()
+            converter = CONV
             condpres = gc_max_pres
             evappres = converter.temp_to_pressure("R744", T_evap)
         
         else:
-            converter = PressureTemperatureConverter()
+            converter = CONV
             condpres = converter.temp_to_pressure(refrigerant, T_cond)
             postcirc = condpres - (dp_total_kPa / 100)
             postcirctemp = converter.pressure_to_temp(refrigerant, postcirc)
@@ -3638,117 +2739,6 @@ elif tool_selection == "Manual Calculation":
 
         compratio = condpres / evappres
 
-        def _pipe_row_for_size(size_inch: str):
-            """Return the CSV row for a given nominal size, respecting selected gauge if present."""
-            rows = material_df[material_df["Nominal Size (inch)"].astype(str).str.strip() == str(size_inch)]
-            if rows.empty:
-                return None
-            if "Gauge" in rows.columns and rows["Gauge"].notna().any():
-                if "gauge" in st.session_state:
-                    g = st.session_state["gauge"]
-                    rows_g = rows[rows["Gauge"] == g]
-                    if not rows_g.empty:
-                        return rows_g.iloc[0]
-                return rows.iloc[0]
-            return rows.iloc[0]
-        
-        def get_liquid_dt_for_size(size_inch: str) -> float:
-            """
-            Compute ΔT (dt) for a given pipe size using the SAME logic as your main Liquid calc
-            (without static head — use 'dt', not 'tall').
-            Returns float('nan') on any failure.
-            """
-            try:
-                pipe_row = _pipe_row_for_size(size_inch)
-                if pipe_row is None:
-                    return float("nan")
-        
-                ID_mm_local = float(pipe_row["ID_mm"])
-                ID_m_local = ID_mm_local / 1000.0
-                area_m2_local = math.pi * (ID_m_local / 2) ** 2
-        
-                # Properties at liquid temperature (size-independent)
-                if refrigerant == "R744 TC":
-                    density_liq = props_sup.get_density_sup(gc_max_pres, maxliq_temp)
-                    visc_liq = props_sup.get_viscosity_sup(gc_max_pres, maxliq_temp)
-                else:
-                    density_liq = RefrigerantProperties().get_properties(refrigerant, T_liq)["density_liquid2"]
-                    visc_liq = RefrigerantProperties().get_properties(refrigerant, T_liq)["viscosity_liquid"]
-                
-                # Mass flow already computed outside (size-independent)
-                v_local = mass_flow_kg_s / (area_m2_local * density_liq)
-        
-                # Reynolds
-                Re = (density_liq * v_local * ID_m_local) / (visc_liq / 1_000_000)
-        
-                # Roughness by material
-                eps = 0.00004572 if selected_material in ["Steel SCH40", "Steel SCH80"] else 0.000001524
-        
-                # Friction factor (laminar vs Colebrook)
-                if Re < 2000.0 and Re > 0:
-                    f_local = 64.0 / Re
-                else:
-                    flo, fhi = 1e-5, 0.1
-                    tol, max_iter = 1e-5, 60
-        
-                    def bal(gg):
-                        s = math.sqrt(gg)
-                        lhs = 1.0 / s
-                        rhs = -2.0 * math.log10((eps / (3.7 * ID_m_local)) + (2.51 / (Re * s)))
-                        return lhs, rhs
-        
-                    f_local = 0.5 * (flo + fhi)
-                    for _ in range(max_iter):
-                        f_try = 0.5 * (flo + fhi)
-                        lhs, rhs = bal(f_try)
-                        if abs(1.0 - lhs / rhs) < tol:
-                            f_local = f_try
-                            break
-                        if (lhs - rhs) > 0.0:
-                            flo = f_try
-                        else:
-                            fhi = f_try
-                    else:
-                        f_local = 0.5 * (flo + fhi)
-        
-                # Dynamic pressure (kPa)
-                q_kPa_local = 0.5 * density_liq * (v_local ** 2) / 1000.0
-        
-                # K-factors for this size
-                for c in ["SRB", "LRB", "BALL", "GLOBE"]:
-                    if c not in pipe_row.index or pd.isna(pipe_row[c]):
-                        return float("nan")
-                K_SRB   = float(pipe_row["SRB"])
-                K_LRB   = float(pipe_row["LRB"])
-                K_BALL  = float(pipe_row["BALL"])
-                K_GLOBE = float(pipe_row["GLOBE"])
-        
-                # Bend/valve counts
-                B_SRB = SRB + 0.5 * _45 + 2.0 * ubend + 3.0 * ptrap
-                B_LRB = LRB + MAC
-        
-                # Pressure drops (kPa)
-                dp_pipe_kPa_local    = f_local * (L / ID_m_local) * q_kPa_local
-                dp_plf_kPa_local     = q_kPa_local * PLF
-                dp_fittings_kPa_local= q_kPa_local * (K_SRB * B_SRB + K_LRB * B_LRB)
-                dp_valves_kPa_local  = q_kPa_local * (K_BALL * ball    + K_GLOBE * globe)
-        
-                dp_total_kPa_local = dp_pipe_kPa_local + dp_fittings_kPa_local + dp_valves_kPa_local + dp_plf_kPa_local
-        
-                # Convert DP to post-circ temperature and get ΔT
-                if refrigerant == "R744 TC":
-                    dt_local = dp_total_kPa_local
-                else:
-                    conv = PressureTemperatureConverter()
-                    condpres_local = conv.temp_to_pressure(refrigerant, T_cond)
-                    postcirc_local = condpres_local - (dp_total_kPa_local / 100.0)  # kPa -> bar: /100
-                    postcirctemp_local = conv.pressure_to_temp(refrigerant, postcirc_local)
-                    dt_local = T_cond - postcirctemp_local
-        
-                return float(dt_local)
-            except Exception:
-                return float("nan")
-
         def _auto_select_copper_gauge(
             *,
             material_df,
@@ -3804,123 +2794,85 @@ elif tool_selection == "Manual Calculation":
                 return min(gauges)
         
         if st.button("Auto-select"):
-            if refrigerant == "R744 TC":
-                results, errors = [], []
-            
-                for ps in pipe_sizes:
-                    dt_i = get_liquid_dt_for_size(ps)
-                    if math.isfinite(dt_i):
-                        results.append({"size": ps, "dt": dt_i})
-                    else:
-                        errors.append((ps, "Non-numeric ΔT"))
-            
-                if not results:
-                    with st.expander("⚠️ Liquid selection debug details", expanded=True):
-                        for ps, msg in errors:
-                            st.write(f"❌ {ps}: {msg}")
-                    st.error("No valid pipe size results. Check inputs and CSV rows.")
+            # nominal mm per entry of pipe_sizes, for picking the smallest passing size
+            size_mm_arr = pipe_lookup["mm_arr_by_material"][selected_material]
+            # R744 TC sizes on the pressure drop itself rather than a temperature penalty
+            limit = max_lineloss if refrigerant == "R744 TC" else max_penalty
+            errors = []
+            try:
+                dp_arr = _liquid_dp_for_sizes(
+                    pipe_lookup, selected_material, st.session_state.get("gauge"), pipe_sizes,
+                    mass_flow_kg_s, density, viscosity, fitting_counts, eps, L, PLF,
+                )
+                if refrigerant == "R744 TC":
+                    dt_arr = dp_arr
                 else:
-                    # Keep sizes that satisfy the dt limit, pick the smallest OD (mm)
-                    valid = [r for r in results if r["dt"] <= max_lineloss]
-            
-                    if valid:
-                        best = min(valid, key=lambda x: mm_map[x["size"]])
-                        st.session_state["_next_selected_size"] = best["size"]
-
-                        # 🔹 Auto-select gauge for Copper EN12735
-                        if selected_material.strip() == "Copper EN12735":
-                            rows = material_df[
-                                material_df["Nominal Size (inch)"].astype(str).str.strip() == best["size"]
-                            ]
-                    
-                            if "Gauge" in rows.columns and rows["Gauge"].notna().any():
-                                gauges = sorted(rows["Gauge"].dropna().unique())
-                    
-                                best_gauge = _auto_select_copper_gauge(
-                                    material_df=material_df,
-                                    size_inch=best["size"],
-                                    gauges=gauges,
-                                    design_pressure=result["design_pressure_bar_g"],
-                                    refrigerant=refrigerant,
-                                    design_temp_c=design_temp_c,
-                                    mwp_temp_c=mwp_temp_c,
-                                    circuit=circuit,
-                                    pipe_index=pipe_index,
-                                    copper_calc=copper_calc,
-                                    dp_standard=dp_standard,
-                                    r744_tc_pressure_bar_g=r744_tc_pressure_bar_g,
-                                )
-                    
-                                st.session_state["_next_gauge"] = best_gauge
-                        
+                    # ΔT without static head, as 'dt' in the main calc (kPa -> bar: /100)
+                    dt_arr = T_cond - converter.pressure_to_temp_array(refrigerant, condpres - dp_arr / 100.0)
+            except Exception as e:
+                dt_arr = np.full(len(pipe_sizes), np.nan)
+                errors.append(("all sizes", str(e)))
+        
+            finite = np.isfinite(dt_arr)
+            errors += [(ps, "Non-numeric ΔT") for ps, ok in zip(pipe_sizes, finite) if not ok]
+        
+            if not finite.any():
+                with st.expander("⚠️ Liquid selection debug details", expanded=True):
+                    for ps, msg in errors:
+                        st.write(f"❌ {ps}: {msg}")
+                st.error("No valid pipe size results. Check inputs and CSV rows.")
+            else:
+                # Keep sizes that satisfy the dt limit, pick the smallest OD (mm)
+                best_i = _smallest_passing(finite & (dt_arr <= limit), size_mm_arr)
+        
+                if best_i is not None:
+                    best_size = pipe_sizes[best_i]
+                    st.session_state["_next_selected_size"] = best_size
+
+                    # 🔹 Auto-select gauge for Copper EN12735
+                    if selected_material.strip() == "Copper EN12735":
+                        rows = pipe_lookup["rows_by_material_size"][(selected_material, best_size)]
+                
+                        if "Gauge" in rows.columns and rows["Gauge"].notna().any():
+                            gauges = sorted(rows["Gauge"].dropna().unique())
+                
+                            best_gauge = _auto_select_copper_gauge(
+                                material_df=material_df,
+                                size_inch=best_size,
+                                gauges=gauges,
+                                design_pressure=result["design_pressure_bar_g"],
+                                refrigerant=refrigerant,
+                                design_temp_c=design_temp_c,
+                                mwp_temp_c=mwp_temp_c,
+                                circuit=circuit,
+                                pipe_index=pipe_index,
+                                copper_calc=copper_calc,
+                                dp_standard=dp_standard,
+                                r744_tc_pressure_bar_g=r744_tc_pressure_bar_g,
+                            )
+                
+                            st.session_state["_next_gauge"] = best_gauge
+
+                    if refrigerant == "R744 TC":
                         st.success(
-                            f"✅ Selected liquid pipe size: **{best['size']}**  \n"
-                            f"ΔT: {best['dt']:.2f} kPa (limit {max_lineloss:.2f} kPa)"
+                            f"✅ Selected liquid pipe size: **{best_size}**  \n"
+                            f"ΔT: {dt_arr[best_i]:.2f} kPa (limit {max_lineloss:.2f} kPa)"
                         )
-                        st.rerun()
                     else:
-                        best_dt = min(r["dt"] for r in results if math.isfinite(r["dt"]))
+                        st.success(
+                            f"✅ Selected liquid pipe size: **{best_size}**  \n"
+                            f"ΔT: {dt_arr[best_i]:.3f} K (limit {max_penalty:.3f} K)"
+                        )
+                    st.rerun()
+                else:
+                    best_dt = dt_arr[finite].min()
+                    if refrigerant == "R744 TC":
                         st.error(
                             "❌ No pipe meets the PD limit.  \n"
                             f"Best achievable PD = {best_dt:.2f} kPa (must be ≤ {max_lineloss:.2f} kPa)  \n"
                             "➡ Relax the Max PD or choose a different material/length/fittings."
                         )
-            else:
-                results, errors = [], []
-            
-                for ps in pipe_sizes:
-                    dt_i = get_liquid_dt_for_size(ps)
-                    if math.isfinite(dt_i):
-                        results.append({"size": ps, "dt": dt_i})
-                    else:
-                        errors.append((ps, "Non-numeric ΔT"))
-            
-                if not results:
-                    with st.expander("⚠️ Liquid selection debug details", expanded=True):
-                        for ps, msg in errors:
-                            st.write(f"❌ {ps}: {msg}")
-                    st.error("No valid pipe size results. Check inputs and CSV rows.")
-                else:
-                    # Keep sizes that satisfy the dt limit, pick the smallest OD (mm)
-                    valid = [r for r in results if r["dt"] <= max_penalty]
-            
-                    if valid:
-                        best = min(valid, key=lambda x: mm_map[x["size"]])
-                        st.session_state["_next_selected_size"] = best["size"]
-
-                        # 🔹 Auto-select gauge for Copper EN12735
-                        if selected_material.strip() == "Copper EN12735":
-                            rows = material_df[
-                                material_df["Nominal Size (inch)"].astype(str).str.strip() == best["size"]
-                            ]
-                    
-                            if "Gauge" in rows.columns and rows["Gauge"].notna().any():
-                                gauges = sorted(rows["Gauge"].dropna().unique())
-                    
-                                best_gauge = _auto_select_copper_gauge(
-                                    material_df=material_df,
-                                    size_inch=best["size"],
-                                    gauges=gauges,
-                                    design_pressure=result["design_pressure_bar_g"],
-                                    refrigerant=refrigerant,
-                                    design_temp_c=design_temp_c,
-                                    mwp_temp_c=mwp_temp_c,
-                                    circuit=circuit,
-                                    pipe_index=pipe_index,
-                                    copper_calc=copper_calc,
-                                    dp_standard=dp_standard,
-                                    r744_tc_pressure_bar_g=r744_tc_pressure_bar_g,
-                                )
-                    
-                                st.session_state["_next_gauge"] = best_gauge
-                        
-                        st.success(
-                            f"✅ Selected liquid pipe size: **{best['size']}**  \n"
-                            f"ΔT: {best['dt']:.3f} K (limit {max_penalty:.3f} K)"
-                        )
-                        st.rerun()
                     else:
-                        best_dt = min(r["dt"] for r in results if math.isfinite(r["dt"]))
                         st.error(
                             "❌ No pipe meets the ΔT limit.  \n"
                             f"Best achievable ΔT = {best_dt:.3f} K (must be ≤ {max_penalty:.3f} K)  \n"
@@ -3984,131 +2936,20 @@ elif tool_selection == "Manual Calculation":
 
     if mode == "Discharge":
 
-        from utils.refrigerant_properties import RefrigerantProperties
-        from utils.refrigerant_densities import RefrigerantDensities
-        from utils.refrigerant_viscosities import RefrigerantViscosities
-        from utils.refrigerant_entropies import RefrigerantEntropies
-        from utils.refrigerant_enthalpies import RefrigerantEnthalpies
-        from utils.supercompliq_co2 import RefrigerantProps
-        
         # Load pipe data
-        pipe_data = pd.read_csv("data/pipe_pressure_ratings_full.csv")
-    
-        # --- helpers ---
-        def _nps_inch_to_mm(nps_str: str) -> float:
-            # e.g. "1-1/8", '1"', "3/8"
-            s = str(nps_str).replace('"', '').strip()
-            if not s:
-                return float('nan')
-            parts = s.split('-')
-            tot_in = 0.0
-            for p in parts:
-                p = p.strip()
-                if not p:
-                    continue
-                if '/' in p:
-                    num, den = p.split('/')
-                    tot_in += float(num) / float(den)
-                else:
-                    tot_in += float(p)
-            return tot_in * 25.4  # mm
+        pipe_lookup = _pipe_index()
     
         ss = st.session_state
     
-        # 1) Pipe material
         col1, col2, col3, col4 = st.columns(4)
-        with col2:
-            if refrigerant == "R717":
-                excluded_materials = ["Copper ASTM", " Copper EN12735", "K65 Copper", "Reflok Aluminium"]
-                pipe_materials = sorted(m for m in pipe_data["Material"].dropna().unique()
-                                        if m not in excluded_materials)
-            else:
-                pipe_materials = sorted(pipe_data["Material"].dropna().unique())
-    
-            selected_material = st.selectbox("Pipe Material", pipe_materials, key="material")
-        
-        # detect material change
-        material_changed = ss.get("last_material") is not None and ss.last_material != selected_material
-        ss.last_material = selected_material
-    
-        # 2) Sizes for selected material (de-duped)
-        material_df = pipe_data[pipe_data["Material"] == selected_material].copy()
-    
-        sizes_df = (
-            material_df[["Nominal Size (inch)", "Nominal Size (mm)"]]
-            .dropna(subset=["Nominal Size (inch)"])
-            .assign(**{
-                "Nominal Size (inch)": lambda d: d["Nominal Size (inch)"].astype(str).str.strip(),
-            })
-            .drop_duplicates(subset=["Nominal Size (inch)"], keep="first")
-        )
-    
-        # make sure we have a numeric mm per nominal (fallback: parse the inch string)
-        sizes_df["mm_num"] = pd.to_numeric(sizes_df.get("Nominal Size (mm)"), errors="coerce")
-        sizes_df.loc[sizes_df["mm_num"].isna(), "mm_num"] = sizes_df.loc[sizes_df["mm_num"].isna(), "Nominal Size (inch)"].apply(_nps_inch_to_mm)
-    
-        pipe_sizes = sizes_df["Nominal Size (inch)"].tolist()
-        mm_map = dict(zip(sizes_df["Nominal Size (inch)"], sizes_df["mm_num"]))
-    
-        # choose default index
-        def _closest_index(target_mm: float) -> int:
-            mm_list = [mm_map[s] for s in pipe_sizes]
-            return min(range(len(mm_list)), key=lambda i: abs(mm_list[i] - target_mm)) if mm_list else 0
-    
-        # --- consume any deferred selection from the button ---
-        if "_next_selected_size" in st.session_state:
-            new_val = st.session_state.pop("_next_selected_size")
-            if new_val in pipe_sizes:
-                st.session_state["selected_size"] = new_val
-                st.session_state["_selected_size_just_set"] = True
-        
-        default_index = 0
-        if material_changed and "prev_pipe_mm" in ss:
-            default_index = _closest_index(ss.prev_pipe_mm)
-        elif selected_material == " Copper EN12735" and ("5/8" in pipe_sizes or '5/8"' in pipe_sizes):
-            # first load or no previous selection → prefer 1-1/8" for  Copper EN12735
-            want = "5/8" if "5/8" in pipe_sizes else '5/8"'
-            default_index = pipe_sizes.index(want)
-        elif "selected_size" in ss and ss.selected_size in pipe_sizes:
-            # if Streamlit kept the selection, use it
-            default_index = pipe_sizes.index(ss.selected_size)
-    
-        with col1:
-            selected_size = st.selectbox(
-                "Nominal Pipe Size (inch)",
-                pipe_sizes,
-                index=default_index,
-                key="selected_size",
-            )
-    
-        if st.session_state.get("_selected_size_just_set"):
-            del st.session_state["_selected_size_just_set"]
-        
-        # remember the selected size in mm for next material change
-        ss.prev_pipe_mm = float(mm_map.get(selected_size, float("nan")))
-
-        # --- consume any deferred gauge from Auto-select (Discharge mode) ---
-        if "_next_gauge" in st.session_state:
-            g = st.session_state.pop("_next_gauge")
-        
-            rows = material_df[
-                material_df["Nominal Size (inch)"].astype(str).str.strip() == str(selected_size)
-            ]
-        
-            if "Gauge" in rows.columns and rows["Gauge"].notna().any():
-                valid_gauges = set(rows["Gauge"].dropna().unique())
-                if g in valid_gauges:
-                    st.session_state["gauge"] = g
-    
-        # 3) Gauge (if applicable)
-        gauge_options = material_df[material_df["Nominal Size (inch)"].astype(str).str.strip() == selected_size]
-        if "Gauge" in gauge_options.columns and gauge_options["Gauge"].notna().any():
-            gauges = sorted(gauge_options["Gauge"].dropna().unique())
-            with col2:
-                selected_gauge = st.selectbox("Copper Gauge", gauges, key="gauge")
-            selected_pipe_row = gauge_options[gauge_options["Gauge"] == selected_gauge].iloc[0]
-        else:
-            selected_pipe_row = gauge_options.iloc[0]
+        pipe_sel = _pipe_selector(pipe_lookup, refrigerant, col1, col2, default_size="5/8")
+        selected_material = pipe_sel.material
+        selected_size = pipe_sel.size
+        selected_gauge = pipe_sel.gauge
+        selected_pipe_row = pipe_sel.row
+        pipe_sizes = pipe_sel.sizes
+        mm_map = pipe_sel.mm_map
+        material_df = pipe_sel.material_df
 
         pipe_index = material_to_pipe_index(selected_material)
         
@@ -4141,18 +2982,11 @@ elif tool_selection == "Manual Calculation":
             evap_capacity_kw = st.number_input("Evaporator Capacity (kW)", min_value=0.03, max_value=20000.0, value=10.0, step=1.0)
             
             # --- Base ranges per refrigerant ---
-            if refrigerant in ("R23", "R508B"):
-                evap_min, evap_max, evap_default = -100.0, -20.0, -80.0
-                cond_min, cond_max, cond_default = -100.0, 10.0, -30.0
-                maxliq_min, maxliq_max, maxliq_default = -100.0, 10.0, -40.0
-            elif refrigerant == "R744":
-                evap_min, evap_max, evap_default = -50.0, 20.0, -10.0
-                cond_min, cond_max, cond_default = -23.0, 30.0, 15.0
-                maxliq_min, maxliq_max, maxliq_default = -50.0, 30.0, 10.0
-            else:
-                evap_min, evap_max, evap_default = -50.0, 30.0, -10.0
-                cond_min, cond_max, cond_default = -23.0, 60.0, 43.0
-                maxliq_min, maxliq_max, maxliq_default = -50.0, 60.0, 40.0
+            (
+                (evap_min, evap_max, evap_default),
+                (cond_min, cond_max, cond_default),
+                (maxliq_min, maxliq_max, maxliq_default),
+            ) = SYSTEM_TEMP_RANGES.get(refrigerant, SYSTEM_TEMP_RANGES["_default"])
     
             # --- Init state (widget-backed) ---
             ss = st.session_state
@@ -4167,11 +3001,7 @@ elif tool_selection == "Manual Calculation":
             ss.setdefault("maxliq_temp", maxliq_default)
             ss.setdefault("evap_temp",   evap_default)
 
-            if "maxliq_temp" in ss and "cond_temp" in ss and "evap_temp" in ss:
-                ss.cond_temp = min(max(ss.cond_temp, ss.maxliq_temp, ss.evap_temp), cond_max)
-    
-            if "cond_temp" in ss and "maxliq_temp" in ss and "evap_temp" in ss:
-                ss.evap_temp = min(ss.maxliq_temp, ss.cond_temp, ss.evap_temp)
+            _clamp_cond_temps(cond_max)
             
             # --- Callbacks implementing your downstream clamping logic ---
             def on_change_cond():
@@ -4261,9 +3091,11 @@ elif tool_selection == "Manual Calculation":
             T_evap = evaporating_temp
             T_liq = maxliq_temp
             T_cond = condensing_temp
+            T_cond_K = T_cond + 273.15
+        T_evap_K = T_evap + 273.15
     
-        props = RefrigerantProperties()
-        props_sup = RefrigerantProps()
+        props = PROPS
+        props_sup = PROPS_SUP
 
         if refrigerant == "R744 TC":
             h_in = props_sup.get_enthalpy_sup(gc_max_pres, maxliq_temp)
@@ -4282,15 +3114,15 @@ elif tool_selection == "Manual Calculation":
             area_m2 = math.pi * (ID_m / 2) ** 2
 
             if refrigerant == "R744 TC":
-                suc_ent = RefrigerantEntropies().get_entropy("R744", T_evap + 273.15, superheat_K)
+                suc_ent = ENTROPIES.get_entropy("R744", T_evap_K, superheat_K)
                 isen_sup = props_sup.get_temperature_from_entropy(gc_max_pres, suc_ent)
                 isen_enth = props_sup.get_enthalpy_sup(gc_max_pres, isen_sup)
-                suc_enth = RefrigerantEnthalpies().get_enthalpy("R744", T_evap + 273.15, superheat_K)
+                suc_enth = ENTHALPIES.get_enthalpy("R744", T_evap_K, superheat_K)
             else:
-                suc_ent = RefrigerantEntropies().get_entropy(refrigerant, T_evap + 273.15, superheat_K)
-                isen_sup = RefrigerantEntropies().get_superheat_from_entropy(refrigerant, T_cond + 273.15, suc_ent)
-                isen_enth = RefrigerantEnthalpies().get_enthalpy(refrigerant, T_cond + 273.15, isen_sup)
-                suc_enth = RefrigerantEnthalpies().get_enthalpy(refrigerant, T_evap + 273.15, superheat_K)
+                suc_ent = ENTROPIES.get_entropy(refrigerant, T_evap_K, superheat_K)
+                isen_sup = ENTROPIES.get_superheat_from_entropy(refrigerant, T_cond_K, suc_ent)
+                isen_enth = ENTHALPIES.get_enthalpy(refrigerant, T_cond_K, isen_sup)
+                suc_enth = ENTHALPIES.get_enthalpy(refrigerant, T_evap_K, superheat_K)
 
             isen_change = isen_enth - suc_enth
 
@@ -4301,15 +3133,15 @@ elif tool_selection == "Manual Calculation":
             if refrigerant == "R744 TC":
                 dis_t = props_sup.get_temperature_from_enthalpy(gc_max_pres, dis_enth)
             else:
-                dis_sup = RefrigerantEnthalpies().get_superheat_from_enthalpy(refrigerant, T_cond + 273.15, dis_enth)
+                dis_sup = ENTHALPIES.get_superheat_from_enthalpy(refrigerant, T_cond_K, dis_enth)
                 dis_t = T_cond + dis_sup
             
             if refrigerant == "R744 TC":
                 dis_dens = props_sup.get_density_sup(gc_max_pres, dis_t)
                 dis_visc = props_sup.get_viscosity_sup(gc_max_pres, dis_t)
             else:
-                dis_dens = RefrigerantDensities().get_density(refrigerant, T_cond + 273.15, dis_sup)
-                dis_visc = RefrigerantViscosities().get_viscosity(refrigerant, T_cond + 273.15, dis_sup)
+                dis_dens = DENS.get_density(refrigerant, T_cond_K, dis_sup)
+                dis_visc = VISC.get_viscosity(refrigerant, T_cond_K, dis_sup)
 
             velocity_m_s = mass_flow_kg_s / (area_m2 * dis_dens)
             
@@ -4318,35 +3150,12 @@ elif tool_selection == "Manual Calculation":
 
         reynolds = (dis_dens * velocity_m_s * ID_m) / (dis_visc / 1000000)
 
-        if selected_material in ["Steel SCH40", "Steel SCH80"]:
-            eps = 0.00004572 #0.00015
-        else:
-            eps = 0.000001524 #0.000005
-        
-        tol = 1e-5
-        max_iter = 60
+        eps = pipe_roughness(selected_material)
         
         if reynolds < 2000.0:
             f = 64.0 / reynolds
         else:
-            flo, fhi = 1e-5, 0.1
-            def balance(gg):
-                s = math.sqrt(gg)
-                lhs = 1.0 / s
-                rhs = -2.0 * math.log10((eps / (3.7 * ID_m)) + 2.51 / (reynolds * s))
-                return lhs, rhs
-    
-            f = 0.5 * (flo + fhi)
-            for _ in range(max_iter):
-                f = 0.5 * (flo + fhi)
-                lhs, rhs = balance(f)
-                if abs(1.0 - lhs/rhs) < tol:
-                    break
-                # decide side using sign of (lhs - rhs)
-                if (lhs - rhs) > 0.0:
-                    flo = f
-                else:
-                    fhi = f
+            f = _serghides(reynolds, eps, ID_m)
 
         q_kPa = 0.5 * dis_dens * (velocity_m_s ** 2) / 1000.0
 
@@ -4356,26 +3165,20 @@ elif tool_selection == "Manual Calculation":
     
         required_cols = ["SRB", "LRB", "BALL", "GLOBE"]
         missing = [c for c in required_cols if c not in selected_pipe_row.index]
-        if missing:
-            st.error(f"CSV missing required K columns: {missing}")
-            st.stop()
-    
-        # Convert to floats and check NaNs
-        try:
-            K_SRB  = float(selected_pipe_row["SRB"])
-            K_LRB  = float(selected_pipe_row["LRB"])
-            K_BALL = float(selected_pipe_row["BALL"])
-            K_GLOBE= float(selected_pipe_row["GLOBE"])
-        except Exception as e:
-            st.error(f"Failed to parse K-factors as numbers: {e}")
+        if missing:
+            st.error(f"CSV missing required K columns: {missing}")
             st.stop()
     
-        if any(pd.isna([K_SRB, K_LRB, K_BALL, K_GLOBE])):
+        # K columns are float64 from load, so one array read replaces per-column coercion
+        K_row = selected_pipe_row[required_cols].to_numpy(dtype=float)
+        if np.isnan(K_row).any():
             st.error("One or more K-factors are NaN in the CSV row.")
             st.stop()
+        K_SRB, K_LRB, K_BALL, K_GLOBE = K_row.tolist()
         
         B_SRB = SRB + 0.5 * _45 + 2.0 * ubend + 3.0 * ptrap
         B_LRB = LRB + MAC
+        fitting_counts = np.array([B_SRB, B_LRB, ball, globe], dtype=float)
     
         dp_fittings_kPa = q_kPa * (
         K_SRB   * B_SRB +
@@ -4390,12 +3193,12 @@ elif tool_selection == "Manual Calculation":
         dp_total_kPa = dp_pipe_kPa + dp_fittings_kPa + dp_valves_kPa + dp_plf_kPa
         
         if refrigerant == "R744 TC":
-            converter = PressureTemperatureConverter()
+            converter = CONV
             condpres = gc_max_pres
             evappres = converter.temp_to_pressure("R744", T_evap)
         
         else:
-            converter = PressureTemperatureConverter()
+            converter = CONV
             condpres = converter.temp_to_pressure(refrigerant, T_cond)
             postcirc = condpres - (dp_total_kPa / 100)
             postcirctemp = converter.pressure_to_temp(refrigerant, postcirc)
@@ -4406,135 +3209,22 @@ elif tool_selection == "Manual Calculation":
 
         compratio = condpres / evappres
         
-        def _pipe_row_for_size(size_inch: str):
-            rows = material_df[material_df["Nominal Size (inch)"].astype(str).str.strip() == str(size_inch)]
-            if rows.empty:
-                return None
-            if "Gauge" in rows.columns and rows["Gauge"].notna().any():
-                if "gauge" in st.session_state:
-                    g = st.session_state["gauge"]
-                    rows_g = rows[rows["Gauge"] == g]
-                    if not rows_g.empty:
-                        return rows_g.iloc[0]
-                return rows.iloc[0]
-            return rows.iloc[0]
-
-        def get_discharge_dt_for_size(size_inch: str) -> float:
+        def get_discharge_dt_for_sizes(sizes):
             """
-            Compute ΔT (dt) for a given discharge pipe size using the SAME method as the main block:
-            1) Isentropic chain → discharge superheat, enthalpy, temperature
-            2) Discharge density/viscosity at (T_cond, dis_sup)
-            3) Velocity/Reynolds → friction factor (Colebrook or laminar)
-            4) q_kPa → dp's (pipe + fittings + valves + PLF)
-            5) Convert dp to post-circ temperature → dt = T_cond - postcirc_temp
-            Returns NaN on failure.
+            ΔT (dt) for each of `sizes`, aligned with it; NaN where a size has no usable row.
+            Discharge density/viscosity, mass flow and fitting counts are size-independent
+            (main block), so the dp sweep is one array pass over the bores and K-factors;
+            Δp → ΔT at the condenser side is one array lookup (R744 TC sizes on the
+            pressure drop itself).
             """
-            try:
-                pipe_row = _pipe_row_for_size(size_inch)
-                if pipe_row is None:
-                    return float("nan")
-        
-                # Geometry
-                ID_mm_local = float(pipe_row["ID_mm"])
-                ID_m_local  = ID_mm_local / 1000.0
-                area_m2     = math.pi * (ID_m_local / 2) ** 2
-        
-                # 1) Isentropic chain – size independent, but we recompute to be safe
-                if refrigerant == "R744 TC":
-                    suc_ent    = RefrigerantEntropies().get_entropy("R744", T_evap + 273.15, superheat_K)
-                    isen_sup   = props_sup.get_temperature_from_entropy(gc_max_pres, suc_ent)
-                    isen_enth  = props_sup.get_enthalpy_sup(gc_max_pres, isen_sup)
-                    suc_enth   = RefrigerantEnthalpies().get_enthalpy("R744", T_evap + 273.15, superheat_K)
-                else:
-                    suc_ent    = RefrigerantEntropies().get_entropy(refrigerant, T_evap + 273.15, superheat_K)
-                    isen_sup   = RefrigerantEntropies().get_superheat_from_entropy(refrigerant, T_cond + 273.15, suc_ent)
-                    isen_enth  = RefrigerantEnthalpies().get_enthalpy(refrigerant, T_cond + 273.15, isen_sup)
-                    suc_enth   = RefrigerantEnthalpies().get_enthalpy(refrigerant, T_evap + 273.15, superheat_K)
-                
-                isen_change = isen_enth - suc_enth
-                enth_change = isen_change / (isen / 100.0)
-                dis_enth    = suc_enth + enth_change
-                
-                if refrigerant == "R744 TC":
-                    dis_t = props_sup.get_temperature_from_enthalpy(gc_max_pres, dis_enth)
-                else:
-                    dis_sup     = RefrigerantEnthalpies().get_superheat_from_enthalpy(refrigerant, T_cond + 273.15, dis_enth)
-        
-                # Discharge properties at (T_cond, dis_sup)
-                if refrigerant == "R744 TC":
-                    dis_dens = props_sup.get_density_sup(gc_max_pres, dis_t)
-                    dis_visc = props_sup.get_viscosity_sup(gc_max_pres, dis_t)
-                else:
-                    dis_dens = RefrigerantDensities().get_density(refrigerant, T_cond + 273.15, dis_sup)
-                    dis_visc = RefrigerantViscosities().get_viscosity(refrigerant, T_cond + 273.15, dis_sup)
-        
-                # Mass flow is size-independent (already computed in main code)
-                v = mass_flow_kg_s / (area_m2 * dis_dens)
-        
-                # 2) Reynolds
-                Re = (dis_dens * v * ID_m_local) / (dis_visc / 1_000_000)
-        
-                # 3) Roughness and friction factor
-                eps = 0.00004572 if selected_material in ["Steel SCH40", "Steel SCH80"] else 0.000001524
-                if Re < 2000.0 and Re > 0:
-                    f_local = 64.0 / Re
-                else:
-                    flo, fhi = 1e-5, 0.1
-                    tol, max_iter = 1e-5, 60
-                    def balance(gg):
-                        s = math.sqrt(gg)
-                        lhs = 1.0 / s
-                        rhs = -2.0 * math.log10((eps / (3.7 * ID_m_local)) + 2.51 / (Re * s))
-                        return lhs, rhs
-                    f_local = 0.5 * (flo + fhi)
-                    for _ in range(max_iter):
-                        f_try = 0.5 * (flo + fhi)
-                        lhs, rhs = balance(f_try)
-                        if abs(1.0 - lhs / rhs) < tol:
-                            f_local = f_try
-                            break
-                        if (lhs - rhs) > 0.0:
-                            flo = f_try
-                        else:
-                            fhi = f_try
-                    else:
-                        f_local = 0.5 * (flo + fhi)
-        
-                # 4) Dynamic pressure and K-based losses
-                q_kPa = 0.5 * dis_dens * (v ** 2) / 1000.0
-        
-                for c in ["SRB", "LRB", "BALL", "GLOBE"]:
-                    if c not in pipe_row.index or pd.isna(pipe_row[c]):
-                        return float("nan")
-                K_SRB   = float(pipe_row["SRB"])
-                K_LRB   = float(pipe_row["LRB"])
-                K_BALL  = float(pipe_row["BALL"])
-                K_GLOBE = float(pipe_row["GLOBE"])
-        
-                B_SRB = SRB + 0.5 * _45 + 2.0 * ubend + 3.0 * ptrap
-                B_LRB = LRB + MAC
-        
-                dp_pipe_kPa = f_local * (L / ID_m_local) * q_kPa
-                dp_plf_kPa  = q_kPa * PLF
-                dp_fit_kPa  = q_kPa * (K_SRB * B_SRB + K_LRB * B_LRB)
-                dp_val_kPa  = q_kPa * (K_BALL * ball + K_GLOBE * globe)
-        
-                dp_total_kPa_local = dp_pipe_kPa + dp_fit_kPa + dp_val_kPa + dp_plf_kPa
-        
-                # 5) Convert Δp → ΔT at condenser side
-                if refrigerant == "R744 TC":
-                    dt_local = dp_total_kPa_local
-                else:
-                    conv = PressureTemperatureConverter()
-                    condpres_local   = conv.temp_to_pressure(refrigerant, T_cond)
-                    postcirc_local   = condpres_local - (dp_total_kPa_local / 100.0)  # kPa→bar
-                    postcirctemp_loc = conv.pressure_to_temp(refrigerant, postcirc_local)
-                    dt_local         = T_cond - postcirctemp_loc
-        
-                return float(dt_local)
-        
-            except Exception:
-                return float("nan")
+            dp_arr = _liquid_dp_for_sizes(
+                pipe_lookup, selected_material, st.session_state.get("gauge"), sizes,
+                mass_flow_kg_s, dis_dens, dis_visc, fitting_counts, eps, L, PLF,
+            )
+            if refrigerant == "R744 TC":
+                return dp_arr
+            postcirc_arr = condpres - (dp_arr / 100.0)  # kPa→bar
+            return T_cond - converter.pressure_to_temp_array(refrigerant, postcirc_arr)
 
         def _auto_select_copper_gauge(
             *,
@@ -4591,117 +3281,77 @@ elif tool_selection == "Manual Calculation":
                 return min(gauges)
         
         if st.button("Auto-select"):
-            if refrigerant == "R744 TC":
-                results, errors = [], []
-                for ps in pipe_sizes:
-                    dt_i = get_discharge_dt_for_size(ps)
-                    if math.isfinite(dt_i):
-                        results.append({"size": ps, "dt": dt_i})
-                    else:
-                        errors.append((ps, "Non-numeric ΔT"))
-            
-                if not results:
-                    with st.expander("⚠️ Discharge selection debug details", expanded=True):
-                        for ps, msg in errors:
-                            st.write(f"❌ {ps}: {msg}")
-                    st.error("No valid pipe size results. Check inputs and CSV rows.")
-                else:
-                    valid = [r for r in results if r["dt"] <= max_linelosss]
-                    if valid:
-                        best = min(valid, key=lambda x: mm_map[x["size"]])  # smallest OD that passes
-                        st.session_state["_next_selected_size"] = best["size"]
-
-                        # 🔹 Auto-select gauge for Copper EN12735
-                        if selected_material.strip() == "Copper EN12735":
-                            rows = material_df[
-                                material_df["Nominal Size (inch)"].astype(str).str.strip() == best["size"]
-                            ]
-                    
-                            if "Gauge" in rows.columns and rows["Gauge"].notna().any():
-                                gauges = sorted(rows["Gauge"].dropna().unique())
-                    
-                                best_gauge = _auto_select_copper_gauge(
-                                    material_df=material_df,
-                                    size_inch=best["size"],
-                                    gauges=gauges,
-                                    design_pressure=result["design_pressure_bar_g"],
-                                    refrigerant=refrigerant,
-                                    design_temp_c=design_temp_c,
-                                    mwp_temp_c=mwp_temp_c,
-                                    circuit=circuit,
-                                    pipe_index=pipe_index,
-                                    copper_calc=copper_calc,
-                                    dp_standard=dp_standard,
-                                    r744_tc_pressure_bar_g=r744_tc_pressure_bar_g,
-                                )
-                    
-                                st.session_state["_next_gauge"] = best_gauge
-                        
+            # nominal mm per entry of pipe_sizes, for picking the smallest passing size
+            size_mm_arr = pipe_lookup["mm_arr_by_material"][selected_material]
+            # R744 TC sizes on the pressure drop itself rather than a temperature penalty
+            limit = max_linelosss if refrigerant == "R744 TC" else max_penalty
+            errors = []
+            try:
+                dt_arr = get_discharge_dt_for_sizes(pipe_sizes)
+            except Exception as e:
+                dt_arr = np.full(len(pipe_sizes), np.nan)
+                errors.append(("all sizes", str(e)))
+        
+            finite = np.isfinite(dt_arr)
+            errors += [(ps, "Non-numeric ΔT") for ps, ok in zip(pipe_sizes, finite) if not ok]
+        
+            if not finite.any():
+                with st.expander("⚠️ Discharge selection debug details", expanded=True):
+                    for ps, msg in errors:
+                        st.write(f"❌ {ps}: {msg}")
+                st.error("No valid pipe size results. Check inputs and CSV rows.")
+            else:
+                # smallest OD that passes
+                best_i = _smallest_passing(finite & (dt_arr <= limit), size_mm_arr)
+        
+                if best_i is not None:
+                    best_size = pipe_sizes[best_i]
+                    st.session_state["_next_selected_size"] = best_size
+
+                    # 🔹 Auto-select gauge for Copper EN12735
+                    if selected_material.strip() == "Copper EN12735":
+                        rows = pipe_lookup["rows_by_material_size"][(selected_material, best_size)]
+                
+                        if "Gauge" in rows.columns and rows["Gauge"].notna().any():
+                            gauges = sorted(rows["Gauge"].dropna().unique())
+                
+                            best_gauge = _auto_select_copper_gauge(
+                                material_df=material_df,
+                                size_inch=best_size,
+                                gauges=gauges,
+                                design_pressure=result["design_pressure_bar_g"],
+                                refrigerant=refrigerant,
+                                design_temp_c=design_temp_c,
+                                mwp_temp_c=mwp_temp_c,
+                                circuit=circuit,
+                                pipe_index=pipe_index,
+                                copper_calc=copper_calc,
+                                dp_standard=dp_standard,
+                                r744_tc_pressure_bar_g=r744_tc_pressure_bar_g,
+                            )
+                
+                            st.session_state["_next_gauge"] = best_gauge
+
+                    if refrigerant == "R744 TC":
                         st.success(
-                            f"✅ Selected discharge pipe size: **{best['size']}**  \n"
-                            f"ΔT: {best['dt']:.2f} kPa (limit {max_linelosss:.2f} kPa)"
+                            f"✅ Selected discharge pipe size: **{best_size}**  \n"
+                            f"ΔT: {dt_arr[best_i]:.2f} kPa (limit {max_linelosss:.2f} kPa)"
                         )
-                        st.rerun()
                     else:
-                        best_dt = min(r["dt"] for r in results if math.isfinite(r["dt"]))
+                        st.success(
+                            f"✅ Selected discharge pipe size: **{best_size}**  \n"
+                            f"ΔT: {dt_arr[best_i]:.3f} K (limit {max_penalty:.3f} K)"
+                        )
+                    st.rerun()
+                else:
+                    best_dt = dt_arr[finite].min()
+                    if refrigerant == "R744 TC":
                         st.error(
                             "❌ No pipe meets the PD limit.  \n"
                             f"Best achievable PD = {best_dt:.2f} kPa (must be ≤ {max_linelosss:.2f} kPa)  \n"
                             "➡ Relax the Max PD or change material/length/fittings."
                         )
-            else:
-                results, errors = [], []
-                for ps in pipe_sizes:
-                    dt_i = get_discharge_dt_for_size(ps)
-                    if math.isfinite(dt_i):
-                        results.append({"size": ps, "dt": dt_i})
-                    else:
-                        errors.append((ps, "Non-numeric ΔT"))
-            
-                if not results:
-                    with st.expander("⚠️ Discharge selection debug details", expanded=True):
-                        for ps, msg in errors:
-                            st.write(f"❌ {ps}: {msg}")
-                    st.error("No valid pipe size results. Check inputs and CSV rows.")
-                else:
-                    valid = [r for r in results if r["dt"] <= max_penalty]
-                    if valid:
-                        best = min(valid, key=lambda x: mm_map[x["size"]])  # smallest OD that passes
-                        st.session_state["_next_selected_size"] = best["size"]
-
-                        # 🔹 Auto-select gauge for Copper EN12735
-                        if selected_material.strip() == "Copper EN12735":
-                            rows = material_df[
-                                material_df["Nominal Size (inch)"].astype(str).str.strip() == best["size"]
-                            ]
-                    
-                            if "Gauge" in rows.columns and rows["Gauge"].notna().any():
-                                gauges = sorted(rows["Gauge"].dropna().unique())
-                    
-                                best_gauge = _auto_select_copper_gauge(
-                                    material_df=material_df,
-                                    size_inch=best["size"],
-                                    gauges=gauges,
-                                    design_pressure=result["design_pressure_bar_g"],
-                                    refrigerant=refrigerant,
-                                    design_temp_c=design_temp_c,
-                                    mwp_temp_c=mwp_temp_c,
-                                    circuit=circuit,
-                                    pipe_index=pipe_index,
-                                    copper_calc=copper_calc,
-                                    dp_standard=dp_standard,
-                                    r744_tc_pressure_bar_g=r744_tc_pressure_bar_g,
-                                )
-                    
-                                st.session_state["_next_gauge"] = best_gauge
-                        
-                        st.success(
-                            f"✅ Selected discharge pipe size: **{best['size']}**  \n"
-                            f"ΔT: {best['dt']:.3f} K (limit {max_penalty:.3f} K)"
-                        )
-                        st.rerun()
                     else:
-                        best_dt = min(r["dt"] for r in results if math.isfinite(r["dt"]))
                         st.error(
                             "❌ No pipe meets the ΔT limit.  \n"
                             f"Best achievable ΔT = {best_dt:.3f} K (must be ≤ {max_penalty:.3f} K)  \n"
@@ -4760,145 +3410,33 @@ elif tool_selection == "Manual Calculation":
 
     if mode == "Drain":
 
-        from utils.refrigerant_properties import RefrigerantProperties
-        from utils.refrigerant_densities import RefrigerantDensities
-        from utils.refrigerant_viscosities import RefrigerantViscosities
-        from utils.refrigerant_entropies import RefrigerantEntropies
-        from utils.refrigerant_enthalpies import RefrigerantEnthalpies
-        
         # Load pipe data
-        pipe_data = pd.read_csv("data/pipe_pressure_ratings_full.csv")
-    
-        # --- helpers ---
-        def _nps_inch_to_mm(nps_str: str) -> float:
-            # e.g. "1-1/8", '1"', "3/8"
-            s = str(nps_str).replace('"', '').strip()
-            if not s:
-                return float('nan')
-            parts = s.split('-')
-            tot_in = 0.0
-            for p in parts:
-                p = p.strip()
-                if not p:
-                    continue
-                if '/' in p:
-                    num, den = p.split('/')
-                    tot_in += float(num) / float(den)
-                else:
-                    tot_in += float(p)
-            return tot_in * 25.4  # mm
+        pipe_lookup = _pipe_index()
     
         ss = st.session_state
     
-        # 1) Pipe material
         col1, col2, col3, col4 = st.columns(4)
-        with col2:
-            if refrigerant == "R717":
-                excluded_materials = ["Copper ASTM", " Copper EN12735", "K65 Copper", "Reflok Aluminium"]
-                pipe_materials = sorted(m for m in pipe_data["Material"].dropna().unique()
-                                        if m not in excluded_materials)
-            else:
-                pipe_materials = sorted(pipe_data["Material"].dropna().unique())
-    
-            selected_material = st.selectbox("Pipe Material", pipe_materials, key="material", disabled=True)
-        
-        # detect material change
-        material_changed = ss.get("last_material") is not None and ss.last_material != selected_material
-        ss.last_material = selected_material
-    
-        # 2) Sizes for selected material (de-duped)
-        material_df = pipe_data[pipe_data["Material"] == selected_material].copy()
-    
-        sizes_df = (
-            material_df[["Nominal Size (inch)", "Nominal Size (mm)"]]
-            .dropna(subset=["Nominal Size (inch)"])
-            .assign(**{
-                "Nominal Size (inch)": lambda d: d["Nominal Size (inch)"].astype(str).str.strip(),
-            })
-            .drop_duplicates(subset=["Nominal Size (inch)"], keep="first")
+        pipe_sel = _pipe_selector(
+            pipe_lookup, refrigerant, col1, col2,
+            size_override=ss.pop("auto_selected_main", None),
+            default_size=None,
+            material_disabled=True,
+            size_label="Main Pipe Size (inch)",
+            gauge_label="Main Copper Gauge",
+            next_gauge_key="_next_gauge_main",
         )
-    
-        # make sure we have a numeric mm per nominal (fallback: parse the inch string)
-        sizes_df["mm_num"] = pd.to_numeric(sizes_df.get("Nominal Size (mm)"), errors="coerce")
-        sizes_df.loc[sizes_df["mm_num"].isna(), "mm_num"] = sizes_df.loc[sizes_df["mm_num"].isna(), "Nominal Size (inch)"].apply(_nps_inch_to_mm)
-    
-        pipe_sizes = sizes_df["Nominal Size (inch)"].tolist()
-        mm_map = dict(zip(sizes_df["Nominal Size (inch)"], sizes_df["mm_num"]))
-    
-        # choose default index
-        def _closest_index(target_mm: float) -> int:
-            mm_list = [mm_map[s] for s in pipe_sizes]
-            return min(range(len(mm_list)), key=lambda i: abs(mm_list[i] - target_mm)) if mm_list else 0
-
-        default_index = 0
-        if material_changed and "prev_pipe_mm" in ss:
-            default_index = _closest_index(ss.prev_pipe_mm)
-        elif "selected_size" in ss and ss.selected_size in pipe_sizes:
-            default_index = pipe_sizes.index(ss.selected_size)
-        
-        # Apply auto-selected value if present
-        if "auto_selected_main" in ss and ss.auto_selected_main in pipe_sizes:
-            default_index = pipe_sizes.index(ss.auto_selected_main)
-            del ss.auto_selected_main
-        
-        with col1:
-
-            # --- Before main pipe selectbox ---
-            if "auto_selected_main" in st.session_state and st.session_state.auto_selected_main in pipe_sizes:
-                default_index = pipe_sizes.index(st.session_state.auto_selected_main)
-                del st.session_state.auto_selected_main  # clear after use
-
-            selected_size = st.selectbox(
-                "Main Pipe Size (inch)",
-                pipe_sizes,
-                index=default_index,
-                key="selected_size",
-            )
-    
-        # remember the selected size in mm for next material change
-        ss.prev_pipe_mm = float(mm_map.get(selected_size, float("nan")))
-    
-        # 3) Gauge (if applicable)
-        gauge_options = material_df[material_df["Nominal Size (inch)"].astype(str).str.strip() == selected_size]
-
-        if "_next_gauge_main" in st.session_state:
-            g = st.session_state.pop("_next_gauge_main")
-            rows = gauge_options
-            if "Gauge" in rows.columns:
-                valid = set(rows["Gauge"].dropna())
-                if g in valid:
-                    st.session_state["gauge"] = g
-        
-        if "Gauge" in gauge_options.columns and gauge_options["Gauge"].notna().any():
-            gauges = sorted(gauge_options["Gauge"].dropna().unique())
-            with col2:
-                selected_gauge = st.selectbox("Main Copper Gauge", gauges, key="gauge")
-            selected_pipe_row = gauge_options[gauge_options["Gauge"] == selected_gauge].iloc[0]
-        else:
-            selected_pipe_row = gauge_options.iloc[0]
+        selected_material = pipe_sel.material
+        selected_size = pipe_sel.size
+        selected_gauge = pipe_sel.gauge
+        selected_pipe_row = pipe_sel.row
+        pipe_sizes = pipe_sel.sizes
+        mm_map = pipe_sel.mm_map
+        material_df = pipe_sel.material_df
     
         # Pipe parameters
         pipe_size_inch = selected_pipe_row["Nominal Size (inch)"]
         ID_mm = selected_pipe_row["ID_mm"]
 
-        # --- helpers (reuse or keep separate if you want clarity) ---
-        def _nps_inch_to_mm_2(nps_str: str) -> float:
-            s = str(nps_str).replace('"', '').strip()
-            if not s:
-                return float('nan')
-            parts = s.split('-')
-            tot_in = 0.0
-            for p in parts:
-                p = p.strip()
-                if not p:
-                    continue
-                if '/' in p:
-                    num, den = p.split('/')
-                    tot_in += float(num) / float(den)
-                else:
-                    tot_in += float(p)
-            return tot_in * 25.4  # mm
-
         ss = st.session_state
 
         # 1️⃣ Use same pipe material from main pipe
@@ -4908,25 +3446,9 @@ elif tool_selection == "Manual Calculation":
             st.stop()
 
         # 2️⃣ Filter data for that material only
-        material_df_2 = pipe_data[pipe_data["Material"] == selected_material_2].copy()
-
-        sizes_df_2 = (
-            material_df_2[["Nominal Size (inch)", "Nominal Size (mm)"]]
-            .dropna(subset=["Nominal Size (inch)"])
-            .assign(**{
-                "Nominal Size (inch)": lambda d: d["Nominal Size (inch)"].astype(str).str.strip(),
-            })
-            .drop_duplicates(subset=["Nominal Size (inch)"], keep="first")
-        )
-
-        # Convert inch → mm if needed
-        sizes_df_2["mm_num"] = pd.to_numeric(sizes_df_2.get("Nominal Size (mm)"), errors="coerce")
-        sizes_df_2.loc[sizes_df_2["mm_num"].isna(), "mm_num"] = sizes_df_2.loc[
-            sizes_df_2["mm_num"].isna(), "Nominal Size (inch)"
-        ].apply(_nps_inch_to_mm_2)
-
-        pipe_sizes_2 = sizes_df_2["Nominal Size (inch)"].tolist()
-        mm_map_2 = dict(zip(sizes_df_2["Nominal Size (inch)"], sizes_df_2["mm_num"]))
+        material_df_2 = pipe_lookup["by_material"][selected_material_2]
+        pipe_sizes_2 = pipe_lookup["sizes_by_material"][selected_material_2]
+        mm_map_2 = pipe_lookup["mm_by_material"][selected_material_2]
 
         # 3️⃣ Choose default index
         def _closest_index_2(target_mm: float) -> int:
@@ -4962,9 +3484,7 @@ elif tool_selection == "Manual Calculation":
         ss.prev_pipe_mm_2 = float(mm_map_2.get(selected_size_2, float("nan")))
 
         # 5️⃣ Gauge selector (if applicable)
-        gauge_options_2 = material_df_2[
-            material_df_2["Nominal Size (inch)"].astype(str).str.strip() == selected_size_2
-        ]
+        gauge_options_2 = pipe_lookup["rows_by_material_size"][(selected_material_2, selected_size_2)]
 
         if "_next_gauge_branch" in st.session_state:
             g = st.session_state.pop("_next_gauge_branch")
@@ -5000,7 +3520,7 @@ elif tool_selection == "Manual Calculation":
         
             pipe_index = material_to_pipe_index(selected_material)
         
-            g_main = selected_gauge if "selected_gauge" in locals() else None
+            g_main = selected_gauge
             g_branch = selected_gauge_2 if "selected_gauge_2" in locals() else None
         
             od_main, id_main = get_dimensions_for_row(material_df, selected_size, g_main)
@@ -5045,18 +3565,11 @@ elif tool_selection == "Manual Calculation":
             no_branch = st.number_input("No. of Branches", min_value=2, max_value=10, value=2, step=1)
             
             # --- Base ranges per refrigerant ---
-            if refrigerant in ("R23", "R508B"):
-                evap_min, evap_max, evap_default = -100.0, -20.0, -80.0
-                cond_min, cond_max, cond_default = -100.0, 10.0, -30.0
-                maxliq_min, maxliq_max, maxliq_default = -100.0, 10.0, -40.0
-            elif refrigerant == "R744":
-                evap_min, evap_max, evap_default = -50.0, 20.0, -10.0
-                cond_min, cond_max, cond_default = -23.0, 30.0, 15.0
-                maxliq_min, maxliq_max, maxliq_default = -50.0, 30.0, 10.0
-            else:
-                evap_min, evap_max, evap_default = -50.0, 30.0, -10.0
-                cond_min, cond_max, cond_default = -23.0, 60.0, 43.0
-                maxliq_min, maxliq_max, maxliq_default = -50.0, 60.0, 40.0
+            (
+                (evap_min, evap_max, evap_default),
+                (cond_min, cond_max, cond_default),
+                (maxliq_min, maxliq_max, maxliq_default),
+            ) = SYSTEM_TEMP_RANGES.get(refrigerant, SYSTEM_TEMP_RANGES["_default"])
     
             # --- Init state (widget-backed) ---
             ss = st.session_state
@@ -5071,11 +3584,7 @@ elif tool_selection == "Manual Calculation":
             ss.setdefault("maxliq_temp", maxliq_default)
             ss.setdefault("evap_temp",   evap_default)
 
-            if "maxliq_temp" in ss and "cond_temp" in ss and "evap_temp" in ss:
-                ss.cond_temp = min(max(ss.cond_temp, ss.maxliq_temp, ss.evap_temp), cond_max)
-    
-            if "cond_temp" in ss and "maxliq_temp" in ss and "evap_temp" in ss:
-                ss.evap_temp = min(ss.maxliq_temp, ss.cond_temp, ss.evap_temp)
+            _clamp_cond_temps(cond_max)
             
             # --- Callbacks implementing your downstream clamping logic ---
             def on_change_cond():
@@ -5125,7 +3634,7 @@ elif tool_selection == "Manual Calculation":
             T_liq = maxliq_temp
             T_cond = condensing_temp
         
-            props = RefrigerantProperties()
+            props = PROPS
     
             h_in = props.get_properties(refrigerant, T_liq)["enthalpy_liquid2"]
     
@@ -5140,9 +3649,9 @@ elif tool_selection == "Manual Calculation":
     
                 area_m2 = math.pi * (ID_m / 2) ** 2
     
-                density1 = RefrigerantProperties().get_properties(refrigerant, T_liq)["density_liquid2"]
+                density1 = PROPS.get_properties(refrigerant, T_liq)["density_liquid2"]
     
-                density2 = RefrigerantProperties().get_properties(refrigerant, T_cond)["density_liquid"]
+                density2 = PROPS.get_properties(refrigerant, T_cond)["density_liquid"]
     
                 density = min(density1, density2)
     
@@ -5220,9 +3729,7 @@ elif tool_selection == "Manual Calculation":
                 # Compute main pipe size
                 best_main = None
                 for size in pipe_sizes:
-                    ID_main_mm = material_df.loc[
-                        material_df["Nominal Size (inch)"].astype(str).str.strip() == size, "ID_mm"
-                    ].iloc[0]
+                    ID_main_mm = pipe_lookup["first_row_by_material_size"][(selected_material, size)]["ID_mm"]
                     ID_main_m = ID_main_mm / 1000.0
                     area_main = math.pi * (ID_main_m / 2) ** 2
                     vel_main = mass_flow_kg_s / (area_main * density)
@@ -5233,9 +3740,7 @@ elif tool_selection == "Manual Calculation":
                 # Compute branch pipe size
                 best_branch = None
                 for size in pipe_sizes_2:
-                    ID_branch_mm = material_df_2.loc[
-                        material_df_2["Nominal Size (inch)"].astype(str).str.strip() == size, "ID_mm"
-                    ].iloc[0]
+                    ID_branch_mm = pipe_lookup["first_row_by_material_size"][(selected_material_2, size)]["ID_mm"]
                     ID_branch_m = ID_branch_mm / 1000.0
                     area_branch = math.pi * (ID_branch_m / 2) ** 2
                     vel_branch_calc = mf_branch / (area_branch * density)
@@ -5244,11 +3749,7 @@ elif tool_selection == "Manual Calculation":
                         break
 
                 if best_main:
-                    gauges_main = sorted(
-                        material_df[
-                            material_df["Nominal Size (inch)"].astype(str).str.strip() == best_main
-                        ]["Gauge"].dropna().unique()
-                    )
+                    gauges_main = pipe_lookup["gauges_by_material_size"][(selected_material, best_main)]
             
                     if gauges_main:
                         best_gauge_main = _auto_select_copper_gauge(
@@ -5269,11 +3770,7 @@ elif tool_selection == "Manual Calculation":
                         st.session_state["_next_gauge_main"] = best_gauge_main
             
                 if best_branch:
-                    gauges_branch = sorted(
-                        material_df_2[
-                            material_df_2["Nominal Size (inch)"].astype(str).str.strip() == best_branch
-                        ]["Gauge"].dropna().unique()
-                    )
+                    gauges_branch = pipe_lookup["gauges_by_material_size"][(selected_material_2, best_branch)]
             
                     if gauges_branch:
                         best_gauge_branch = _auto_select_copper_gauge(
@@ -5357,20 +3854,7 @@ elif tool_selection == "Manual Calculation":
                 if Reno < 2000:
                     FF = 64.0 / Reno
                 else:
-                    # Colebrook bisection exactly like VB
-                    Hi = 0.1
-                    Lo = 0.00001
-                    FF = None
-                    for _ in range(60):
-                        FF_try = (Hi + Lo) / 2.0
-                        LHS = 1.0 / math.sqrt(FF_try)
-                        RHS = -2 * (math.log10((surface_roughness / (PipeDia * 3.7)) +
-                                               (2.51 / (Reno * math.sqrt(FF_try)))))
-                        if LHS > RHS:
-                            Lo = FF_try
-                        else:
-                            Hi = FF_try
-                    FF = (Hi + Lo) / 2.0
+                    FF = _serghides(Reno, surface_roughness, PipeDia)
         
                 # Pipe pressure drop
                 PPD = FF * 30.48 / PipeDia * VP
@@ -5386,137 +3870,19 @@ elif tool_selection == "Manual Calculation":
             return PipeDia
         
         # Load pipe data
-        pipe_data = pd.read_csv("data/pipe_pressure_ratings_full.csv")
-    
-        # --- helpers ---
-        def _nps_inch_to_mm(nps_str: str) -> float:
-            # e.g. "1-1/8", '1"', "3/8"
-            s = str(nps_str).replace('"', '').strip()
-            if not s:
-                return float('nan')
-            parts = s.split('-')
-            tot_in = 0.0
-            for p in parts:
-                p = p.strip()
-                if not p:
-                    continue
-                if '/' in p:
-                    num, den = p.split('/')
-                    tot_in += float(num) / float(den)
-                else:
-                    tot_in += float(p)
-            return tot_in * 25.4  # mm
+        pipe_lookup = _pipe_index()
     
         ss = st.session_state
     
-        # 1) Pipe material
         col1, col2, col3, col4 = st.columns(4)
-        with col2:
-            if refrigerant == "R717":
-                excluded_materials = ["Copper ASTM", " Copper EN12735", "K65 Copper", "Reflok Aluminium"]
-                pipe_materials = sorted(m for m in pipe_data["Material"].dropna().unique()
-                                        if m not in excluded_materials)
-            else:
-                pipe_materials = sorted(pipe_data["Material"].dropna().unique())
-    
-            selected_material = st.selectbox("Pipe Material", pipe_materials, key="material")
-        
-        # detect material change
-        material_changed = ss.get("last_material") is not None and ss.last_material != selected_material
-        ss.last_material = selected_material
-    
-        # 2) Sizes for selected material (de-duped)
-        material_df = pipe_data[pipe_data["Material"] == selected_material].copy()
-    
-        sizes_df = (
-            material_df[["Nominal Size (inch)", "Nominal Size (mm)"]]
-            .dropna(subset=["Nominal Size (inch)"])
-            .assign(**{
-                "Nominal Size (inch)": lambda d: d["Nominal Size (inch)"].astype(str).str.strip(),
-            })
-            .drop_duplicates(subset=["Nominal Size (inch)"], keep="first")
-        )
-    
-        # make sure we have a numeric mm per nominal (fallback: parse the inch string)
-        sizes_df["mm_num"] = pd.to_numeric(sizes_df.get("Nominal Size (mm)"), errors="coerce")
-        sizes_df.loc[sizes_df["mm_num"].isna(), "mm_num"] = sizes_df.loc[sizes_df["mm_num"].isna(), "Nominal Size (inch)"].apply(_nps_inch_to_mm)
-    
-        pipe_sizes = sizes_df["Nominal Size (inch)"].tolist()
-        mm_map = dict(zip(sizes_df["Nominal Size (inch)"], sizes_df["mm_num"]))
-
-        def _pipe_row_for_size(size_inch: str):
-            rows = material_df[material_df["Nominal Size (inch)"].astype(str).str.strip() == str(size_inch)]
-            if rows.empty:
-                return None
-            if "Gauge" in rows.columns and rows["Gauge"].notna().any():
-                if "gauge" in st.session_state:
-                    g = st.session_state["gauge"]
-                    match = rows[rows["Gauge"] == g]
-                    if not match.empty:
-                        return match.iloc[0]
-                return rows.iloc[0]
-            return rows.iloc[0]
-    
-        # choose default index
-        def _closest_index(target_mm: float) -> int:
-            mm_list = [mm_map[s] for s in pipe_sizes]
-            return min(range(len(mm_list)), key=lambda i: abs(mm_list[i] - target_mm)) if mm_list else 0
-    
-        # --- consume any deferred selection from Auto-select button ---
-        if "_next_selected_size" in st.session_state:
-            new_val = st.session_state.pop("_next_selected_size")
-            if new_val in pipe_sizes:
-                st.session_state["selected_size"] = new_val
-                st.session_state["_selected_size_just_set"] = True
-        
-        default_index = 0
-        if material_changed and "prev_pipe_mm" in ss:
-            default_index = _closest_index(ss.prev_pipe_mm)
-        elif selected_material == " Copper EN12735" and ("7/8" in pipe_sizes or '7/8"' in pipe_sizes):
-            # first load or no previous selection → prefer 1-1/8" for  Copper EN12735
-            want = "7/8" if "7/8" in pipe_sizes else '7/8"'
-            default_index = pipe_sizes.index(want)
-        elif "selected_size" in ss and ss.selected_size in pipe_sizes:
-            # if Streamlit kept the selection, use it
-            default_index = pipe_sizes.index(ss.selected_size)
-        
-        with col1:
-            selected_size = st.selectbox(
-                "Nominal Pipe Size (inch)",
-                pipe_sizes,
-                index=default_index,
-                key="selected_size",
-            )
-
-        # --- clean up one-shot flag ---
-        if st.session_state.get("_selected_size_just_set"):
-            del st.session_state["_selected_size_just_set"]
-    
-        # remember the selected size in mm for next material change
-        ss.prev_pipe_mm = float(mm_map.get(selected_size, float("nan")))
-
-        # --- consume any deferred gauge from Auto-select (Wet Suction) ---
-        if "_next_gauge" in st.session_state:
-            g = st.session_state.pop("_next_gauge")
-        
-            rows = material_df[
-                material_df["Nominal Size (inch)"].astype(str).str.strip() == str(selected_size)
-            ]
-        
-            if "Gauge" in rows.columns and rows["Gauge"].notna().any():
-                valid_gauges = set(rows["Gauge"].dropna().unique())
-                if g in valid_gauges:
-                    st.session_state["gauge"] = g
-    
-        # 3) Gauge (if applicable)
-        gauge_options = material_df[material_df["Nominal Size (inch)"].astype(str).str.strip() == selected_size]
-        if "Gauge" in gauge_options.columns and gauge_options["Gauge"].notna().any():
-            gauges = sorted(gauge_options["Gauge"].dropna().unique())
-            with col2:
-                selected_gauge = st.selectbox("Copper Gauge", gauges, key="gauge")
-            selected_pipe_row = gauge_options[gauge_options["Gauge"] == selected_gauge].iloc[0]
-        else:
-            selected_pipe_row = gauge_options.iloc[0]
+        pipe_sel = _pipe_selector(pipe_lookup, refrigerant, col1, col2, default_size="7/8")
+        selected_material = pipe_sel.material
+        selected_size = pipe_sel.size
+        selected_gauge = pipe_sel.gauge
+        selected_pipe_row = pipe_sel.row
+        pipe_sizes = pipe_sel.sizes
+        mm_map = pipe_sel.mm_map
+        material_df = pipe_sel.material_df
 
         pipe_index = material_to_pipe_index(selected_material)
         
@@ -5549,12 +3915,7 @@ elif tool_selection == "Manual Calculation":
             evap_capacity_kw = st.number_input("Evaporator Capacity (kW)", min_value=0.03, max_value=20000.0, value=10.0, step=1.0)
             
             # --- Base ranges per refrigerant ---
-            if refrigerant in ("R23", "R508B"):
-                evap_min, evap_max, evap_default = -100.0, -20.0, -80.0
-            elif refrigerant == "R744":
-                evap_min, evap_max, evap_default = -50.0, 20.0, -10.0
-            else:
-                evap_min, evap_max, evap_default = -50.0, 30.0, -10.0
+            evap_min, evap_max, evap_default = SYSTEM_TEMP_RANGES.get(refrigerant, SYSTEM_TEMP_RANGES["_default"])[0]
     
             # --- Init state (widget-backed) ---
             ss = st.session_state
@@ -5593,16 +3954,13 @@ elif tool_selection == "Manual Calculation":
             globe = st.number_input("Globe Valves", min_value=0, max_value=20, value=0, step=1, key="globe")
             PLF = st.number_input("Pressure Loss Factors", min_value=0.0, max_value=20.0, value=0.0, step=0.1)
         
-        from utils.refrigerant_properties import RefrigerantProperties
-        from utils.refrigerant_densities import RefrigerantDensities
-        from utils.refrigerant_viscosities import RefrigerantViscosities
     
         D_int = ID_mm / 1000
         A_total = math.pi * (D_int / 2)**2
         
         T_evap = evaporating_temp
     
-        props = RefrigerantProperties()
+        props = PROPS
 
         h_in = props.get_properties(refrigerant, T_evap)["enthalpy_liquid"]
         h_out = props.get_properties(refrigerant, T_evap)["enthalpy_vapor"]
@@ -5619,13 +3977,13 @@ elif tool_selection == "Manual Calculation":
         d_vap1 = props.get_properties(refrigerant, T_evap)["density_vapor"]
 
         v_liq1 = props.get_properties(refrigerant, T_evap)["viscosity_liquid3"] / 1000000
-        v_vap1 = RefrigerantViscosities().get_viscosity(refrigerant, T_evap + 273.15, 0) / 1000000
+        v_vap1 = VISC.get_viscosity(refrigerant, T_evap + 273.15, 0) / 1000000
 
         d_liq2 = props.get_properties(refrigerant, T_evap - max_penalty)["density_liquid"]
         d_vap2 = props.get_properties(refrigerant, T_evap - max_penalty)["density_vapor"]
 
         v_liq2 = props.get_properties(refrigerant, T_evap - max_penalty)["viscosity_liquid3"] / 1000000
-        v_vap2 = RefrigerantViscosities().get_viscosity(refrigerant, T_evap + 273.15 - max_penalty, 0) / 1000000
+        v_vap2 = VISC.get_viscosity(refrigerant, T_evap + 273.15 - max_penalty, 0) / 1000000
 
         d_liq = (d_liq1 + d_liq2) / 2
         d_vap = (d_vap1 + d_vap2) / 2
@@ -5645,10 +4003,7 @@ elif tool_selection == "Manual Calculation":
             # --- VB6 Wet Suction Logic (faithful) ---
             
             # Determine surface roughness exactly like VB
-            if selected_material in ["Steel SCH40", "Steel SCH80"]:
-                surface_roughness = 0.00004572
-            else:
-                surface_roughness = 0.000001524
+            surface_roughness = pipe_roughness(selected_material)
             
             # Mass flow terms for VB
             D = BMR_massflow   # VB scaling
@@ -5695,38 +4050,26 @@ elif tool_selection == "Manual Calculation":
         else:
             Re = 0
     
-        if selected_material in ["Steel SCH40", "Steel SCH80"]:
-            eps = 0.00004572
-        else:
-            eps = 0.000001524
+        eps = pipe_roughness(selected_material)
     
         if Re <= 0:
             f = 0
         elif Re < 2000:
             f = 64 / Re
         else:
-            rel = eps / D_h
-            f = 0.02
-            for _ in range(60):
-                rhs = -2.0 * math.log10((rel / 3.7) + (2.51 / (Re * math.sqrt(f))))
-                f_new = 1.0 / (rhs * rhs)
-                if abs(f_new - f) / f < 1e-5:
-                    f = f_new
-                    break
-                f = f_new
+            f = _serghides(Re, eps, D_h)
     
         dyn = 0.5 * d_vap * gas_velocity**2 / 1000
     
         dp_pipe = f * (L / D_h) * dyn
         dp_plf = dyn * PLF
     
-        K_SRB = float(selected_pipe_row["SRB"])
-        K_LRB = float(selected_pipe_row["LRB"])
-        K_BALL = float(selected_pipe_row["BALL"])
-        K_GLOBE = float(selected_pipe_row["GLOBE"])
+        # K columns are float64 from load, so one array read replaces per-column coercion
+        K_SRB, K_LRB, K_BALL, K_GLOBE = selected_pipe_row[["SRB", "LRB", "BALL", "GLOBE"]].to_numpy(dtype=float).tolist()
     
         B_SRB = SRB + 0.5 * _45 + 2 * ubend + 3 * ptrap
         B_LRB = LRB + MAC
+        fitting_counts = np.array([B_SRB, B_LRB, ball, globe], dtype=float)
     
         dp_fittings = dyn * (K_SRB * B_SRB + K_LRB * B_LRB)
         dp_valves = dyn * (K_BALL * ball + K_GLOBE * globe)
@@ -5748,7 +4091,7 @@ elif tool_selection == "Manual Calculation":
     
         dp_total_ws = dp_pipe_ws + dp_fittings_ws + dp_valves_ws + dp_plf_ws
         
-        converter = PressureTemperatureConverter()
+        converter = CONV
         evappres = converter.temp_to_pressure(refrigerant, T_evap)
 
         postcirc = evappres - (dp_total_ws / 100)
@@ -5757,132 +4100,45 @@ elif tool_selection == "Manual Calculation":
 
         dt = T_evap - postcirctemp
 
-        def get_wet_suction_dt_for_size(size_inch: str) -> float:
-            """Compute ΔT for a given Wet Suction pipe size using identical logic to the main block."""
-            try:
-                pipe_row = _pipe_row_for_size(size_inch)
-                if pipe_row is None:
-                    return float("nan")
-        
-                # Geometry
-                ID_mm_local = float(pipe_row["ID_mm"])
-                D_int = ID_mm_local / 1000
-                A_total = math.pi * (D_int / 2) ** 2
-        
-                # --- identical property setup ---
-                T_evap_local = T_evap
-                props = RefrigerantProperties()
-                h_in = props.get_properties(refrigerant, T_evap_local)["enthalpy_liquid"]
-                h_out = props.get_properties(refrigerant, T_evap_local)["enthalpy_vapor"]
-                deltah = h_out - h_in
-                base_massflow = evap_capacity_kw / deltah
-                BMR_massflow = 293.07107017224996 / deltah
-                overfeed_ratio = 1 + liq_oq / 100
-                m_g = base_massflow
-                m_l = base_massflow * (overfeed_ratio - 1)
-                m_gplusl = m_g + m_l
-        
-                d_liq1 = props.get_properties(refrigerant, T_evap_local)["density_liquid"]
-                d_vap1 = props.get_properties(refrigerant, T_evap_local)["density_vapor"]
-                v_liq1 = props.get_properties(refrigerant, T_evap_local)["viscosity_liquid3"] / 1_000_000
-                v_vap1 = RefrigerantViscosities().get_viscosity(refrigerant, T_evap_local + 273.15, 0) / 1_000_000
-                d_liq2 = props.get_properties(refrigerant, T_evap_local - max_penalty)["density_liquid"]
-                d_vap2 = props.get_properties(refrigerant, T_evap_local - max_penalty)["density_vapor"]
-                v_liq2 = props.get_properties(refrigerant, T_evap_local - max_penalty)["viscosity_liquid3"] / 1_000_000
-                v_vap2 = RefrigerantViscosities().get_viscosity(refrigerant, T_evap_local + 273.15 - max_penalty, 0) / 1_000_000
-        
-                d_liq = (d_liq1 + d_liq2) / 2
-                d_vap = (d_vap1 + d_vap2) / 2
-                v_liq = (v_liq1 + v_liq2) / 2
-                v_vap = (v_vap1 + v_vap2) / 2
-        
-                Q_g = m_g / d_vap
-                Q_l = m_l / d_liq if liq_oq > 0 else 0
-        
-                # --- identical wet suction geometry logic ---
+        def get_wet_suction_dt_for_sizes(sizes):
+            """
+            ΔT for each of `sizes`, aligned with it; NaN where a size has no usable row.
+            Properties, liquid_ratio and WetSucFactor are size-independent (main block),
+            so only the strata geometry, friction and K-factors vary with the bore and the
+            whole sweep is one array pass, converted in one array lookup.
+            """
+            rows = _sweep_rows(pipe_lookup, selected_material, sizes, st.session_state.get("gauge"))
+            D_int_arr = rows[:, 0] / 1000
+            TotalArea_arr = math.pi * (D_int_arr / 2) ** 2
+
+            with np.errstate(divide="ignore", invalid="ignore"):
                 if liq_oq <= 0 or overfeed_ratio <= 1:
-                    liquid_ratio = 0.0
-                    A_gas = A_total
-                    gas_velocity = Q_g / A_gas if A_gas > 0 else 0.0
-                    D_h = D_int
+                    A_gas_arr = TotalArea_arr
+                    D_h_arr = D_int_arr
                 else:
-                    # surface roughness
-                    surface_roughness = 0.00004572 if selected_material in ["Steel SCH40", "Steel SCH80"] else 0.000001524
-        
-                    D = BMR_massflow
-                    A_diam = find_pipe_diameter(689.476, v_vap, d_vap, D, 1, surface_roughness)
-                    B_diam = find_pipe_diameter(689.476, v_liq, d_liq, D * (overfeed_ratio - 1), 2, surface_roughness)
-                    A_area = math.pi * (A_diam / 2) ** 2
-                    B_area = math.pi * (B_diam / 2) ** 2
-                    C_area = A_area + B_area
-                    liquid_ratio = B_area / C_area if C_area > 0 else 0
-                    Radius = D_int / 2
-                    TotalArea = math.pi * Radius**2
-                    LiqArea = TotalArea * liquid_ratio
-                    SucArea = TotalArea - LiqArea
+                    # --- same VB strata model as the main block, per bore ---
+                    Radius_arr = D_int_arr / 2
+                    LiqArea_arr = TotalArea_arr * liquid_ratio
+                    A_gas_arr = TotalArea_arr - LiqArea_arr
                     DegCon = 57.2957795130824
-                    Angle = (LiqArea / (Radius**2 * 0.5)) * DegCon
-                    Chord = math.sin((Angle / DegCon) / 2) * Radius * 2
-                    Arc = ((360 - Angle) * math.pi) / (360 / (Radius * 2))
-                    Perimeter = Chord + Arc
-                    D_h = 4 * TotalArea / Perimeter if Perimeter > 0 else D_int
-                    A_gas = SucArea
-                    gas_velocity = Q_g / A_gas if A_gas > 0 else 0
-        
-                # --- identical friction and dp chain ---
-                Re = d_vap * gas_velocity * D_h / v_vap if v_vap > 0 else 0
-                eps = 0.00004572 if selected_material in ["Steel SCH40", "Steel SCH80"] else 0.000001524
-        
-                if Re <= 0:
-                    f = 0
-                elif Re < 2000:
-                    f = 64 / Re
-                else:
-                    rel = eps / D_h
-                    f = 0.02
-                    for _ in range(60):
-                        rhs = -2.0 * math.log10((rel / 3.7) + (2.51 / (Re * math.sqrt(f))))
-                        f_new = 1.0 / (rhs * rhs)
-                        if abs(f_new - f) / f < 1e-5:
-                            f = f_new
-                            break
-                        f = f_new
-        
-                dyn = 0.5 * d_vap * gas_velocity**2 / 1000
-                dp_pipe = f * (L / D_h) * dyn
-                dp_plf = dyn * PLF
-                K_SRB = float(pipe_row["SRB"])
-                K_LRB = float(pipe_row["LRB"])
-                K_BALL = float(pipe_row["BALL"])
-                K_GLOBE = float(pipe_row["GLOBE"])
-                B_SRB = SRB + 0.5 * _45 + 2 * ubend + 3 * ptrap
-                B_LRB = LRB + MAC
-                dp_fittings = dyn * (K_SRB * B_SRB + K_LRB * B_LRB)
-                dp_valves = dyn * (K_BALL * ball + K_GLOBE * globe)
-        
-                # --- identical wet suction correction ---
-                if refrigerant == "R404A": C_ref = 0.77
-                elif refrigerant == "R502": C_ref = 0.76
-                elif refrigerant == "R717": C_ref = 0.64
-                elif refrigerant == "R134a": C_ref = 0.71
-                else: C_ref = 0.73
-        
-                WetSucFactor = 1 + (WetSucPenaltyFactor - 1) * (liquid_ratio / C_ref)
-                if WetSucFactor < 1:
-                    WetSucFactor = 1
-        
-                dp_total_ws = (dp_pipe + dp_fittings + dp_valves + dp_plf) * WetSucFactor
-        
-                conv = PressureTemperatureConverter()
-                evappres = conv.temp_to_pressure(refrigerant, T_evap_local)
-                postcirc = evappres - (dp_total_ws / 100)
-                postcirctemp = conv.pressure_to_temp(refrigerant, postcirc)
-                dt_local = T_evap_local - postcirctemp
-        
-                return float(dt_local)
-        
-            except Exception:
-                return float("nan")
+                    Angle_arr = (LiqArea_arr / (Radius_arr**2 * 0.5)) * DegCon
+                    Chord_arr = np.sin((Angle_arr / DegCon) / 2) * Radius_arr * 2
+                    Arc_arr = ((360 - Angle_arr) * math.pi) / (360 / (Radius_arr * 2))
+                    Perimeter_arr = Chord_arr + Arc_arr
+                    D_h_arr = np.where(Perimeter_arr > 0, 4 * TotalArea_arr / Perimeter_arr, D_int_arr)
+
+                gas_velocity_arr = np.where(A_gas_arr > 0, Q_g / A_gas_arr, 0.0)
+                Re_arr = d_vap * gas_velocity_arr * D_h_arr / v_vap if v_vap > 0 else np.zeros_like(D_h_arr)
+                f_arr = np.where(
+                    Re_arr <= 0, 0.0,
+                    np.where(Re_arr < 2000, 64 / Re_arr, _serghides(Re_arr, eps, D_h_arr)),
+                )
+
+            dyn_arr = 0.5 * d_vap * gas_velocity_arr**2 / 1000
+            dp_arr = dyn_arr * (f_arr * (L / D_h_arr) + PLF + rows[:, 1:] @ fitting_counts) * WetSucFactor
+
+            postcirc_arr = evappres - (dp_arr / 100)
+            return T_evap - converter.pressure_to_temp_array(refrigerant, postcirc_arr)
 
         def _auto_select_copper_gauge(
             *,
@@ -5939,37 +4195,41 @@ elif tool_selection == "Manual Calculation":
                 return min(gauges)
 
         if st.button("Auto-select"):
-            results, errors = [], []
-            for ps in pipe_sizes:
-                dt_i = get_wet_suction_dt_for_size(ps)
-                if math.isfinite(dt_i):
-                    results.append({"size": ps, "dt": dt_i})
-                else:
-                    errors.append((ps, "failed or non-numeric ΔT"))
+            # nominal mm per entry of pipe_sizes, for picking the smallest passing size
+            size_mm_arr = pipe_lookup["mm_arr_by_material"][selected_material]
+            errors = []
+            try:
+                dt_arr = get_wet_suction_dt_for_sizes(pipe_sizes)
+            except Exception as e:
+                dt_arr = np.full(len(pipe_sizes), np.nan)
+                errors.append(("all sizes", str(e)))
         
-            if not results:
+            finite = np.isfinite(dt_arr)
+            errors += [(ps, "failed or non-numeric ΔT") for ps, ok in zip(pipe_sizes, finite) if not ok]
+        
+            if not finite.any():
                 with st.expander("⚠️ Debug Details", expanded=True):
                     for ps, msg in errors:
                         st.write(f"❌ {ps}: {msg}")
                 st.error("No valid results for any pipe size — check CSV or inputs.")
             else:
-                valid = [r for r in results if r["dt"] <= max_penalty]
-                if valid:
-                    best = min(valid, key=lambda x: mm_map[x["size"]])  # smallest ID that passes
-                    st.session_state["_next_selected_size"] = best["size"]
+                # smallest ID that passes
+                best_i = _smallest_passing(finite & (dt_arr <= max_penalty), size_mm_arr)
+        
+                if best_i is not None:
+                    best_size = pipe_sizes[best_i]
+                    st.session_state["_next_selected_size"] = best_size
 
                     # 🔹 Auto-select gauge for Copper EN12735
                     if selected_material.strip() == "Copper EN12735":
-                        rows = material_df[
-                            material_df["Nominal Size (inch)"].astype(str).str.strip() == best["size"]
-                        ]
+                        rows = pipe_lookup["rows_by_material_size"][(selected_material, best_size)]
                 
                         if "Gauge" in rows.columns and rows["Gauge"].notna().any():
                             gauges = sorted(rows["Gauge"].dropna().unique())
                 
                             best_gauge = _auto_select_copper_gauge(
                                 material_df=material_df,
-                                size_inch=best["size"],
+                                size_inch=best_size,
                                 gauges=gauges,
                                 design_pressure=result["design_pressure_bar_g"],
                                 refrigerant=refrigerant,
@@ -5985,12 +4245,12 @@ elif tool_selection == "Manual Calculation":
                             st.session_state["_next_gauge"] = best_gauge
                     
                     st.success(
-                        f"✅ Auto-selected pipe: **{best['size']}**  \n"
-                        f"ΔT = {best['dt']:.3f} K ≤ {max_penalty:.3f} K"
+                        f"✅ Auto-selected pipe: **{best_size}**  \n"
+                        f"ΔT = {dt_arr[best_i]:.3f} K ≤ {max_penalty:.3f} K"
                     )
                     st.rerun()
                 else:
-                    best_dt = min(r["dt"] for r in results if math.isfinite(r["dt"]))
+                    best_dt = dt_arr[finite].min()
                     st.error(
                         f"❌ No pipe meets ΔT ≤ {max_penalty:.3f} K.  \n"
                         f"Best achievable ΔT = {best_dt:.3f} K."
@@ -6045,228 +4305,19 @@ elif tool_selection == "Manual Calculation":
     if mode == "Pumped Liquid":
 
         # Load pipe data
-        pipe_data = pd.read_csv("data/pipe_pressure_ratings_full.csv")
-    
-        # --- helpers ---
-        def _nps_inch_to_mm(nps_str: str) -> float:
-            # e.g. "1-1/8", '1"', "3/8"
-            s = str(nps_str).replace('"', '').strip()
-            if not s:
-                return float('nan')
-            parts = s.split('-')
-            tot_in = 0.0
-            for p in parts:
-                p = p.strip()
-                if not p:
-                    continue
-                if '/' in p:
-                    num, den = p.split('/')
-                    tot_in += float(num) / float(den)
-                else:
-                    tot_in += float(p)
-            return tot_in * 25.4  # mm
+        pipe_lookup = _pipe_index()
     
         ss = st.session_state
     
-        # 1) Pipe material
         col1, col2, col3, col4 = st.columns(4)
-        with col2:
-            if refrigerant == "R717":
-                excluded_materials = ["Copper ASTM", " Copper EN12735", "K65 Copper", "Reflok Aluminium"]
-                pipe_materials = sorted(m for m in pipe_data["Material"].dropna().unique()
-                                        if m not in excluded_materials)
-            else:
-                pipe_materials = sorted(pipe_data["Material"].dropna().unique())
-    
-            selected_material = st.selectbox("Pipe Material", pipe_materials, key="material")
-        
-        # detect material change
-        material_changed = ss.get("last_material") is not None and ss.last_material != selected_material
-        ss.last_material = selected_material
-    
-        # 2) Sizes for selected material (de-duped)
-        material_df = pipe_data[pipe_data["Material"] == selected_material].copy()
-    
-        sizes_df = (
-            material_df[["Nominal Size (inch)", "Nominal Size (mm)"]]
-            .dropna(subset=["Nominal Size (inch)"])
-            .assign(**{
-                "Nominal Size (inch)": lambda d: d["Nominal Size (inch)"].astype(str).str.strip(),
-            })
-            .drop_duplicates(subset=["Nominal Size (inch)"], keep="first")
-        )
-    
-        # make sure we have a numeric mm per nominal (fallback: parse the inch string)
-        sizes_df["mm_num"] = pd.to_numeric(sizes_df.get("Nominal Size (mm)"), errors="coerce")
-        sizes_df.loc[sizes_df["mm_num"].isna(), "mm_num"] = sizes_df.loc[sizes_df["mm_num"].isna(), "Nominal Size (inch)"].apply(_nps_inch_to_mm)
-    
-        pipe_sizes = sizes_df["Nominal Size (inch)"].tolist()
-        mm_map = dict(zip(sizes_df["Nominal Size (inch)"], sizes_df["mm_num"]))
-
-        # -------- helper: get CSV row for a given pipe size --------
-        def _pipe_row_for_size(size_inch: str):
-            rows = material_df[
-                material_df["Nominal Size (inch)"].astype(str).str.strip() == str(size_inch)
-            ]
-            if rows.empty:
-                return None
-        
-            # If material has gauges, respect user's selected gauge
-            if "Gauge" in rows.columns and rows["Gauge"].notna().any():
-                if "gauge" in st.session_state:
-                    g = st.session_state["gauge"]
-                    rows_g = rows[rows["Gauge"] == g]
-                    if not rows_g.empty:
-                        return rows_g.iloc[0]
-                return rows.iloc[0]
-        
-            return rows.iloc[0]
-
-        # -------- helper: recompute dp_total_kPa for any pipe size --------
-        def get_pumped_dp_for_size(size_inch: str) -> float:
-            """
-            Returns dp_total_kPa for a given size using the EXACT SAME PHYSICS AND EQUATIONS
-            as the Pumped Liquid main calculation block.
-            """
-        
-            try:
-                row = _pipe_row_for_size(size_inch)
-                if row is None:
-                    return float("nan")
-        
-                # Extract diameter
-                ID_mm_local = float(row["ID_mm"])
-                ID_m_local = ID_mm_local / 1000.0
-                A_local = math.pi * (ID_m_local / 2)**2
-        
-                # SAME liquid density & viscosity
-                rho = RefrigerantProperties().get_properties(refrigerant, T_evap)["density_liquid2"]
-                visc = RefrigerantProperties().get_properties(refrigerant, T_evap)["viscosity_liquid"]
-        
-                # SAME mass flow
-                m_dot = (
-                    evap_capacity_kw / deltah * (1 + liq_oq / 100)
-                    if deltah > 0 else 0.01
-                )
-        
-                # Velocity
-                v = m_dot / (A_local * rho)
-        
-                # Reynolds
-                Re = (rho * v * ID_m_local) / (visc / 1_000_000)
-        
-                # Roughness
-                eps = 0.00004572 if selected_material in ["Steel SCH40", "Steel SCH80"] else 0.000001524
-        
-                # Friction factor identical method
-                if Re < 2000:
-                    f_local = 64.0 / Re
-                else:
-                    flo, fhi = 1e-5, 0.1
-                    tol, max_iter = 1e-5, 60
-        
-                    def bal(ff):
-                        s = math.sqrt(ff)
-                        lhs = 1.0 / s
-                        rhs = -2.0 * math.log10((eps / (3.7 * ID_m_local)) + 2.51 / (Re * s))
-                        return lhs, rhs
-        
-                    f_local = 0.5 * (flo + fhi)
-                    for _ in range(max_iter):
-                        f_try = 0.5 * (flo + fhi)
-                        lhs, rhs = bal(f_try)
-                        if abs(1 - lhs / rhs) < tol:
-                            f_local = f_try
-                            break
-        
-                        if (lhs - rhs) > 0:
-                            flo = f_try
-                        else:
-                            fhi = f_try
-        
-                # Dynamic pressure (kPa)
-                q_kPa_local = 0.5 * rho * v**2 / 1000.0
-        
-                # K-factors
-                try:
-                    K_SRB   = float(row["SRB"])
-                    K_LRB   = float(row["LRB"])
-                    K_BALL  = float(row["BALL"])
-                    K_GLOBE = float(row["GLOBE"])
-                except:
-                    return float("nan")
-        
-                # Bend factors identical to main block
-                B_SRB = SRB + 0.5 * _45 + 2*ubend + 3*ptrap
-                B_LRB = LRB + MAC
-        
-                # Pressure drops
-                dp_pipe_local = f_local * (L / ID_m_local) * q_kPa_local
-                dp_plf_local  = q_kPa_local * PLF
-                dp_fit_local  = q_kPa_local * (K_SRB * B_SRB + K_LRB * B_LRB)
-                dp_valv_local = q_kPa_local * (K_BALL * ball + K_GLOBE * globe)
-        
-                dp_total_local = dp_pipe_local + dp_fit_local + dp_valv_local + dp_plf_local
-        
-                return float(dp_total_local)
-        
-            except Exception:
-                return float("nan")
-        
-        # choose default index
-        def _closest_index(target_mm: float) -> int:
-            mm_list = [mm_map[s] for s in pipe_sizes]
-            return min(range(len(mm_list)), key=lambda i: abs(mm_list[i] - target_mm)) if mm_list else 0
-        
-        default_index = 0
-        if material_changed and "prev_pipe_mm" in ss:
-            default_index = _closest_index(ss.prev_pipe_mm)
-        elif selected_material == " Copper EN12735" and ("1/2" in pipe_sizes or '1/2"' in pipe_sizes):
-            # first load or no previous selection → prefer 1-1/8" for  Copper EN12735
-            want = "1/2" if "1/2" in pipe_sizes else '1/2"'
-            default_index = pipe_sizes.index(want)
-        elif "selected_size" in ss and ss.selected_size in pipe_sizes:
-            # if Streamlit kept the selection, use it
-            default_index = pipe_sizes.index(ss.selected_size)
-        
-        if "_next_selected_size" in ss:
-            if ss["_next_selected_size"] in pipe_sizes:
-                ss.selected_size = ss["_next_selected_size"]
-            del ss["_next_selected_size"]
-        
-        with col1:
-            selected_size = st.selectbox(
-                "Nominal Pipe Size (inch)",
-                pipe_sizes,
-                index=default_index,
-                key="selected_size",
-            )
-        
-        # remember the selected size in mm for next material change
-        ss.prev_pipe_mm = float(mm_map.get(selected_size, float("nan")))
-
-        # --- consume any deferred gauge from Auto-select (Pumped Liquid) ---
-        if "_next_gauge" in st.session_state:
-            g = st.session_state.pop("_next_gauge")
-        
-            rows = material_df[
-                material_df["Nominal Size (inch)"].astype(str).str.strip() == str(selected_size)
-            ]
-        
-            if "Gauge" in rows.columns and rows["Gauge"].notna().any():
-                valid_gauges = set(rows["Gauge"].dropna().unique())
-                if g in valid_gauges:
-                    st.session_state["gauge"] = g
-    
-        # 3) Gauge (if applicable)
-        gauge_options = material_df[material_df["Nominal Size (inch)"].astype(str).str.strip() == selected_size]
-        if "Gauge" in gauge_options.columns and gauge_options["Gauge"].notna().any():
-            gauges = sorted(gauge_options["Gauge"].dropna().unique())
-            with col2:
-                selected_gauge = st.selectbox("Copper Gauge", gauges, key="gauge")
-            selected_pipe_row = gauge_options[gauge_options["Gauge"] == selected_gauge].iloc[0]
-        else:
-            selected_pipe_row = gauge_options.iloc[0]
+        pipe_sel = _pipe_selector(pipe_lookup, refrigerant, col1, col2, default_size="1/2")
+        selected_material = pipe_sel.material
+        selected_size = pipe_sel.size
+        selected_gauge = pipe_sel.gauge
+        selected_pipe_row = pipe_sel.row
+        pipe_sizes = pipe_sel.sizes
+        mm_map = pipe_sel.mm_map
+        material_df = pipe_sel.material_df
 
         pipe_index = material_to_pipe_index(selected_material)
         
@@ -6299,12 +4350,7 @@ elif tool_selection == "Manual Calculation":
             evap_capacity_kw = st.number_input("Evaporator Capacity (kW)", min_value=0.03, max_value=20000.0, value=10.0, step=1.0)
             
             # --- Base ranges per refrigerant ---
-            if refrigerant in ("R23", "R508B"):
-                evap_min, evap_max, evap_default = -100.0, -20.0, -80.0
-            elif refrigerant == "R744":
-                evap_min, evap_max, evap_default = -50.0, 20.0, -10.0
-            else:
-                evap_min, evap_max, evap_default = -50.0, 30.0, -10.0
+            evap_min, evap_max, evap_default = SYSTEM_TEMP_RANGES.get(refrigerant, SYSTEM_TEMP_RANGES["_default"])[0]
     
             # --- Init state (widget-backed) ---
             ss = st.session_state
@@ -6343,13 +4389,10 @@ elif tool_selection == "Manual Calculation":
             globe = st.number_input("Globe Valves", min_value=0, max_value=20, value=0, step=1, key="globe")
             PLF = st.number_input("Pressure Loss Factors", min_value=0.0, max_value=20.0, value=0.0, step=0.1)
         
-        from utils.refrigerant_properties import RefrigerantProperties
-        from utils.refrigerant_densities import RefrigerantDensities
-        from utils.refrigerant_viscosities import RefrigerantViscosities
     
         T_evap = evaporating_temp
     
-        props = RefrigerantProperties()
+        props = PROPS
 
         h_in = props.get_properties(refrigerant, T_evap)["enthalpy_liquid2"]
         h_out = props.get_properties(refrigerant, T_evap)["enthalpy_vapor"]
@@ -6362,46 +4405,23 @@ elif tool_selection == "Manual Calculation":
 
             area_m2 = math.pi * (ID_m / 2) ** 2
 
-            density = RefrigerantProperties().get_properties(refrigerant, T_evap)["density_liquid2"]
+            density = PROPS.get_properties(refrigerant, T_evap)["density_liquid2"]
 
             velocity_m_s = mass_flow_kg_s / (area_m2 * density)
 
         else:
             velocity_m_s = None
 
-        viscosity = RefrigerantProperties().get_properties(refrigerant, T_evap)["viscosity_liquid"]
+        viscosity = PROPS.get_properties(refrigerant, T_evap)["viscosity_liquid"]
     
         reynolds = (density * velocity_m_s * ID_m) / (viscosity / 1000000)
     
-        if selected_material in ["Steel SCH40", "Steel SCH80"]:
-            eps = 0.00004572 #0.00015
-        else:
-            eps = 0.000001524 #0.000005
-        
-        tol = 1e-5
-        max_iter = 60
+        eps = pipe_roughness(selected_material)
         
         if reynolds < 2000.0:
             f = 64.0 / reynolds
         else:
-            flo, fhi = 1e-5, 0.1
-            def balance(gg):
-                s = math.sqrt(gg)
-                lhs = 1.0 / s
-                rhs = -2.0 * math.log10((eps / (3.7 * ID_m)) + 2.51 / (reynolds * s))
-                return lhs, rhs
-    
-            f = 0.5 * (flo + fhi)
-            for _ in range(max_iter):
-                f = 0.5 * (flo + fhi)
-                lhs, rhs = balance(f)
-                if abs(1.0 - lhs/rhs) < tol:
-                    break
-                # decide side using sign of (lhs - rhs)
-                if (lhs - rhs) > 0.0:
-                    flo = f
-                else:
-                    fhi = f
+            f = _serghides(reynolds, eps, ID_m)
         
         # dynamic (velocity) pressure, kPa
         q_kPa = 0.5 * density * (velocity_m_s ** 2) / 1000.0
@@ -6417,22 +4437,16 @@ elif tool_selection == "Manual Calculation":
             st.error(f"CSV missing required K columns: {missing}")
             st.stop()
     
-        # Convert to floats and check NaNs
-        try:
-            K_SRB  = float(selected_pipe_row["SRB"])
-            K_LRB  = float(selected_pipe_row["LRB"])
-            K_BALL = float(selected_pipe_row["BALL"])
-            K_GLOBE= float(selected_pipe_row["GLOBE"])
-        except Exception as e:
-            st.error(f"Failed to parse K-factors as numbers: {e}")
-            st.stop()
-    
-        if any(pd.isna([K_SRB, K_LRB, K_BALL, K_GLOBE])):
+        # K columns are float64 from load, so one array read replaces per-column coercion
+        K_row = selected_pipe_row[required_cols].to_numpy(dtype=float)
+        if np.isnan(K_row).any():
             st.error("One or more K-factors are NaN in the CSV row.")
             st.stop()
+        K_SRB, K_LRB, K_BALL, K_GLOBE = K_row.tolist()
         
         B_SRB = SRB + 0.5 * _45 + 2.0 * ubend + 3.0 * ptrap
         B_LRB = LRB + MAC
+        fitting_counts = np.array([B_SRB, B_LRB, ball, globe], dtype=float)
     
         dp_fittings_kPa = q_kPa * (
         K_SRB   * B_SRB +
@@ -6446,7 +4460,7 @@ elif tool_selection == "Manual Calculation":
         
         dp_total_kPa = dp_pipe_kPa + dp_fittings_kPa + dp_valves_kPa + dp_plf_kPa
         
-        converter = PressureTemperatureConverter()
+        converter = CONV
         evappres = converter.temp_to_pressure2(refrigerant, T_evap)
         postcirc = evappres - (dp_total_kPa / 100)
 
@@ -6524,37 +4538,36 @@ elif tool_selection == "Manual Calculation":
 
         # -------- Auto-select smallest pipe size meeting dp ≤ max_ppd_kpa --------
         if st.button("Auto-select"):
-            results = []
-            errors = []
-        
-            for ps in pipe_sizes:
-                dp_i = get_pumped_dp_for_size(ps)
-                if math.isfinite(dp_i):
-                    results.append({"size": ps, "dp": dp_i})
-                else:
-                    errors.append((ps, "Non-numeric DP"))
+            # nominal mm per entry of pipe_sizes, for picking the smallest passing size
+            size_mm_arr = pipe_lookup["mm_arr_by_material"][selected_material]
+        
+            # density, viscosity, mass flow, roughness and fitting counts are the
+            # main block's; only the bore and K-factors vary across the sweep
+            dp_arr = _liquid_dp_for_sizes(
+                pipe_lookup, selected_material, st.session_state.get("gauge"), pipe_sizes,
+                mass_flow_kg_s, density, viscosity, fitting_counts, eps, L, PLF,
+            )
+            finite = np.isfinite(dp_arr)
         
-            if not results:
+            if not finite.any():
                 st.error("No valid pipe results. Check CSV or input data.")
             else:
-                valid = [r for r in results if r["dp"] <= max_ppd_kpa]
+                best_i = _smallest_passing(finite & (dp_arr <= max_ppd_kpa), size_mm_arr)
         
-                if valid:
-                    best = min(valid, key=lambda x: mm_map[x["size"]])
-                    st.session_state["_next_selected_size"] = best["size"]
+                if best_i is not None:
+                    best_size = pipe_sizes[best_i]
+                    st.session_state["_next_selected_size"] = best_size
 
                     # 🔹 Auto-select gauge for Copper EN12735
                     if selected_material.strip() == "Copper EN12735":
-                        rows = material_df[
-                            material_df["Nominal Size (inch)"].astype(str).str.strip() == best["size"]
-                        ]
+                        rows = pipe_lookup["rows_by_material_size"][(selected_material, best_size)]
                 
                         if "Gauge" in rows.columns and rows["Gauge"].notna().any():
                             gauges = sorted(rows["Gauge"].dropna().unique())
                 
                             best_gauge = _auto_select_copper_gauge(
                                 material_df=material_df,
-                                size_inch=best["size"],
+                                size_inch=best_size,
                                 gauges=gauges,
                                 design_pressure=result["design_pressure_bar_g"],
                                 refrigerant=refrigerant,
@@ -6570,12 +4583,12 @@ elif tool_selection == "Manual Calculation":
                             st.session_state["_next_gauge"] = best_gauge
                     
                     st.success(
-                        f"✅ Selected pumped liquid pipe size: **{best['size']}**\n"
-                        f"Pressure Drop: {best['dp']:.2f} kPa (limit {max_ppd_kpa:.2f} kPa)"
+                        f"✅ Selected pumped liquid pipe size: **{best_size}**\n"
+                        f"Pressure Drop: {dp_arr[best_i]:.2f} kPa (limit {max_ppd_kpa:.2f} kPa)"
                     )
                     st.rerun()
                 else:
-                    best_dp = min(r["dp"] for r in results)
+                    best_dp = dp_arr[finite].min()
                     st.error(
                         f"❌ No pipe meets the pressure-drop limit.\n"
                         f"Best achievable: {best_dp:.2f} kPa (limit {max_ppd_kpa:.2f} kPa)."
@@ -11,14 +11,15 @@ from utils.refrigerant_densities import RefrigerantDensities
 from utils.refrigerant_viscosities import RefrigerantViscosities
 from utils.supercompliq_co2 import RefrigerantProps
 from utils.pressure_temp_converter import PressureTemperatureConverter
+from utils.oil_return_checker import R23_LIKE, get_velocity1_prop
+from utils.friction_calculations import pipe_roughness
 
 from functools import lru_cache
 
-# ---- module-level singletons to avoid re-instantiation overhead ----
-_PROPS = RefrigerantProperties()
-_DENS = RefrigerantDensities()
-_VISC = RefrigerantViscosities()
-_CONV = PressureTemperatureConverter()
+# ---- process-wide helper instances, shared with app.py and the checkers ----
+from utils.shared_props import (
+    PROPS as _PROPS, PROPS_SUP as _PROPS_SUP, DENS as _DENS, VISC as _VISC, CONV as _CONV,
+)
 
 @lru_cache(maxsize=4096)
 def _props_cached(ref: str, T_C: float) -> dict:
@@ -79,11 +80,11 @@ class RiserContext:
     gc_max_pres: Optional[float] = None
     gc_min_pres: Optional[float] = None
 
-    props: RefrigerantProperties = RefrigerantProperties()
-    props_sup: RefrigerantProps = RefrigerantProps()
-    dens: RefrigerantDensities = RefrigerantDensities()
-    visc: RefrigerantViscosities = RefrigerantViscosities()
-    conv: PressureTemperatureConverter = PressureTemperatureConverter()
+    props: RefrigerantProperties = _PROPS
+    props_sup: RefrigerantProps = _PROPS_SUP
+    dens: RefrigerantDensities = _DENS
+    visc: RefrigerantViscosities = _VISC
+    conv: PressureTemperatureConverter = _CONV
 
 @dataclass
 class PipeResult:
@@ -121,37 +122,6 @@ class DoubleRiserResult:
     dp_valve: float
     dp_plf: float
 
-def _velocity1_prop_for_refrigerant(refrigerant: str, superheat_K: float) -> float:
-
-    if refrigerant in ["R744", "R744 TC"]:
-        return 1.0
-
-    if refrigerant == "R404A":
-        return (0.0328330590542629 * superheat_K) - 1.47748765744183 if superheat_K > 45 else 0.0
-
-    if refrigerant == "R134a":
-        if superheat_K > 30:
-            return (
-                -0.000566085879684639 * (superheat_K ** 2) +
-                0.075049554857083 * superheat_K -
-                1.74200935399632
-            )
-        return 0.0
-
-    if refrigerant in ["R407F", "R407A", "R410A", "R22", "R502", "R507A", "R448A", "R449A", "R717"]:
-        return 1.0
-
-    if refrigerant == "R407C":
-        return 0.0
-
-    if superheat_K > 30:
-        return (
-            0.0000406422632403154 * (superheat_K ** 2) -
-            0.000541007136813307 * superheat_K +
-            0.748882946418884
-        )
-    return 0.769230769230769
-
 def pipe_results_for_massflow(
     size_inch: str,
     branch_mass_flow_kg_s: float,
@@ -244,7 +214,7 @@ def pipe_results_for_massflow(
     v2 = m / (A * density_super2) if density_super2 > 0 else 0
     v2min = m_min / (A * density_super2) if density_super2 > 0 else 0
 
-    w = _velocity1_prop_for_refrigerant(ref, SH)
+    w = get_velocity1_prop(ref, SH)
     v = max(v1*w + v2*(1-w), v1min*w + v2min*(1-w))
 
     if ref == "R744 TC":
@@ -268,7 +238,7 @@ def pipe_results_for_massflow(
     Re = rho_recalc * v * ID_m / (vis_final/1e6) if vis_final > 0 else 0
 
     # friction factor
-    eps = 0.00004572 if ctx.selected_material in ["Steel SCH40","Steel SCH80"] else 0.000001524
+    eps = pipe_roughness(ctx.selected_material)
 
     f = _friction_factor(Re, eps, ID_m)
 
@@ -430,7 +400,7 @@ def compute_double_riser_oil_metrics(
     MOR_full_flow: Optional[float]
     MOR_large: Optional[float]
 
-    if refrigerant in ["R23", "R508B"]:
+    if refrigerant in R23_LIKE:
         if T_evap < -86 or T_evap > -42:
             MOR_full_flow = None
             MOR_large = None
@@ -2,6 +2,15 @@
 
 import math
 
+# Pipe grades that take the commercial-steel roughness; all others are drawn tube
+STEEL_MATERIALS = frozenset({"Steel SCH40", "Steel SCH80"})
+
+def pipe_roughness(material):
+    """
+    Absolute pipe roughness (m) used in the friction factor.
+    """
+    return 0.00004572 if material in STEEL_MATERIALS else 0.000001524
+
 def darcy_friction_factor(Re):
     """
     Calculate Darcy friction factor.
@@ -1,5 +1,8 @@
 import math
-from utils.refrigerant_properties import RefrigerantProperties
+import numpy as np
+from utils.shared_props import PROPS as _PROPS, PROPS_SUP as _PROPS_SUP, DENS as _DENS
+
+_PI = math.pi
 
 def get_correction_factor(pipe_size_inch):
     correction_factors = {
@@ -34,12 +37,10 @@ def check_oil_return(pipe_size_inch, refrigerant, evap_capacity_kw, duty_pct,
     base_min_kw = get_base_min_duty_kw(refrigerant)
     scaling = get_scaling_factor(refrigerant)
 
-    props = RefrigerantProperties()
-
     try:
-        h_liq = props.get_properties(refrigerant, cond_temp - subcool)["enthalpy_liquid"]
-        h_vap = props.get_properties(refrigerant, evap_temp)["enthalpy_vapor"]
-        h_vap_plus10 = props.get_properties(refrigerant, evap_temp)["enthalpy_super"]
+        h_liq = _PROPS.get_properties(refrigerant, cond_temp - subcool)["enthalpy_liquid"]
+        h_vap = _PROPS.get_properties(refrigerant, evap_temp)["enthalpy_vapor"]
+        h_vap_plus10 = _PROPS.get_properties(refrigerant, evap_temp)["enthalpy_super"]
     except Exception:
         return False, "❌ Error reading refrigerant enthalpies"
 
@@ -67,3 +68,326 @@ def check_oil_return(pipe_size_inch, refrigerant, evap_capacity_kw, duty_pct,
         return True, f"✅ OK: {actual_mass_flow:.3f} kg/s ≥ {min_mass_flow:.3f} kg/s (min required)", min_oil_return
     else:
         return False, f"❌ Insufficient flow: {actual_mass_flow:.3f} < {min_mass_flow:.3f} kg/s (min required)", min_oil_return
+
+# ---- MOR correlation tables (keyed by refrigerant) ----
+
+# Low-temperature refrigerants that share the offset MOR correlations
+R23_LIKE = frozenset({"R23", "R508B"})
+
+JG_HALF = {
+    "R404A": 0.860772464072673, "R134a": 0.869986729796935, "R407F": 0.869042493641944,
+    "R744": 0.877950613678719, "R744 TC": 0.877950613678719, "R407A": 0.867374311574041,
+    "R410A": 0.8904423325365, "R407C": 0.858592104849471, "R22": 0.860563058394146,
+    "R502": 0.858236706656266, "R507A": 0.887709710291009, "R449A": 0.867980496631757,
+    "R448A": 0.86578818145833, "R717": 0.854957410951708, "R290": 0.844975139695726,
+    "R1270": 0.849089717732815, "R600a": 0.84339338979887, "R1234ze": 0.867821375349728,
+    "R1234yf": 0.860767472602571, "R12": 0.8735441986466, "R11": 0.864493203834913,
+    "R454B": 0.869102255850291, "R450A": 0.865387140496035, "R513A": 0.861251244627232,
+    "R454A": 0.868161104592492, "R455A": 0.865687329727713, "R454C": 0.866423016875524,
+    "R32": 0.875213309852597, "R23": 0.865673418568001, "R508B": 0.864305626845382,
+}
+
+# velocity1_prop for refrigerants where it does not depend on superheat
+_VELOCITY1_PROP_FIXED = {
+    "R744": 1, "R744 TC": 1, "R407F": 1, "R407A": 1, "R410A": 1, "R407C": 0,
+    "R22": 1, "R502": 1, "R507A": 1, "R448A": 1, "R449A": 1, "R717": 1,
+}
+
+# (superheat threshold, (a, b, c) above threshold, value at/below threshold)
+_VELOCITY1_PROP_SUPERHEAT = {
+    "R404A": (45, (0.0, 0.0328330590542629, -1.47748765744183), 0),
+    "R134a": (30, (-0.000566085879684639, 0.075049554857083, -1.74200935399632), 0),
+}
+_VELOCITY1_PROP_DEFAULT = (30, (0.0000406422632403154, -0.000541007136813307, 0.748882946418884), 0.769230769230769)
+
+# (a, b, c, lower clip on x) for a*x^2 + b*x + c, x = liquid temperature
+# (R744 TC correlates against gas cooler outlet enthalpy instead)
+_MOR_CORRECTION = {
+    "R744": (0.0, 0.000225755013421421, -0.00280879370374927, None),
+    "R744 TC": (0.0, 0.0000603336117708171, -0.0142318718120024, None),
+    "R407A": (0.00000414431651323856, 0.000381908525139781, -0.0163450053041212, None),
+    "R449A": (0.00000414431651323856, 0.000381908525139781, -0.0163450053041212, None),
+    "R448A": (0.00000414431651323856, 0.000381908525139781, -0.0163450053041212, None),
+    "R502": (0.00000414431651323856, 0.000381908525139781, -0.0163450053041212, None),
+    "R507A": (0.0, 0.000302619054048837, -0.00930188913363997, None),
+    "R22": (0.0, 0.000108153843367715, -0.00329248681202757, None),
+    "R407C": (0.00000420322918839302, 0.000269608915211859, -0.0134546663857195, -32.0716410083429),
+    "R410A": (0.0, 0.0, 0.0, None),
+    "R407F": (0.00000347332380289385, 0.000239205332540693, -0.0121545316131988, -34.4346433150568),
+    "R134a": (0.0, 0.000195224660107459, -0.00591757011487048, None),
+    "R404A": (0.0000156507169104918, 0.000689621839324826, -0.0392, -22.031637377024),
+}
+_MOR_CORRECTION_DEFAULT = (0.00000461020482461793, 0.000217910548009675, -0.012074621594626, -23.6334996273983)
+
+# (a, b, c) for a*x^2 + b*x + c, x = evaporating temperature
+_MOR_CORRECTION2 = {
+    "R744": (-0.0000176412848988908, -0.00164308248808803, -0.0184308798286039),
+    "R744 TC": (-0.0000176412848988908, -0.00164308248808803, -0.0184308798286039),
+    "R407A": (0.0, -0.000864076433837511, -0.0145018190416687),
+    "R449A": (0.0, -0.000835375233693285, -0.0138846063856621),
+    "R448A": (0.00000171366802431428, -0.000865528727278154, -0.0152961902042161),
+    "R502": (0.00000484734071020993, -0.000624822304716683, -0.0128725684240106),
+    "R507A": (0.0, -0.000701333343440148, -0.0114900933623056),
+    "R22": (0.00000636798209134899, -0.000157783204337396, -0.00575251626397381),
+    "R407C": (-0.00000665735727676349, -0.000894860288947537, -0.0116054361757929),
+    "R410A": (0.0, -0.000672268853990701, -0.0111802230098585),
+    "R407F": (0.00000263731418614519, -0.000683997257738699, -0.0126005968942147),
+    "R134a": (-0.00000823045532174214, -0.00108063672211041, -0.0217411206961643),
+    "R404A": (0.00000342378568620316, -0.000329572335134041, -0.00706087606597149),
+}
+_MOR_CORRECTION2_DEFAULT = (0.0, -0.000711441807827186, -0.0118194116436425)
+
+# (a, b, c) for oil density a*T^2 + b*T + c (kg/m³)
+_OIL_DENSITY = {
+    "R23": (0.0, -0.853841209044878, 999.190772536527),
+    "R508B": (0.0, -0.853841209044878, 999.190772536527),
+}
+_OIL_DENSITY_DEFAULT = (-0.00356060606060549, -0.957878787878808, 963.595454545455)
+
+def _quad(coeffs, x):
+    # Horner form of a*x**2 + b*x + c
+    a, b, c = coeffs
+    return (a * x + b) * x + c
+
+def get_jg_half(refrigerant):
+    return JG_HALF.get(refrigerant, 0.865)
+
+def get_velocity1_prop(refrigerant, superheat_K):
+    if refrigerant in _VELOCITY1_PROP_FIXED:
+        return _VELOCITY1_PROP_FIXED[refrigerant]
+    threshold, coeffs, below = _VELOCITY1_PROP_SUPERHEAT.get(refrigerant, _VELOCITY1_PROP_DEFAULT)
+    if superheat_K > threshold:
+        return _quad(coeffs, superheat_K)
+    return below
+
+def get_mor_corrections(refrigerant, liq_temp, liq_tempmin, evapoil, h_liq=None, h_liqmin=None):
+    """(MOR_correction, MOR_correctionmin, MOR_correction2) from one table lookup."""
+    a, b, c, clip = _MOR_CORRECTION.get(refrigerant, _MOR_CORRECTION_DEFAULT)
+    if refrigerant == "R744 TC":
+        x, xmin = h_liq, h_liqmin
+    else:
+        x, xmin = liq_temp, liq_tempmin
+    if clip is not None:
+        x, xmin = max(x, clip), max(xmin, clip)
+    coeffs = (a, b, c)
+    return (
+        _quad(coeffs, x),
+        _quad(coeffs, xmin),
+        _quad(_MOR_CORRECTION2.get(refrigerant, _MOR_CORRECTION2_DEFAULT), evapoil),
+    )
+
+def get_oil_density(refrigerant, T):
+    # T may be a scalar or an array of temperatures
+    return np.polyval(_OIL_DENSITY.get(refrigerant, _OIL_DENSITY_DEFAULT), T)
+
+def compute_mass_flows(refrigerant, T_evap, T_cond, minliq_temp, superheat_K, evap_capacity_kw,
+                       gc_max_pres=None, gc_min_pres=None):
+    """Suction mass flows at max and min liquid temperature.
+
+    Needs only enthalpies, so it can run before (or without) a pipe ID.
+    """
+    if refrigerant == "R744 TC":
+        h_in = _PROPS_SUP.get_enthalpy_sup(gc_max_pres, T_cond)
+        if gc_min_pres >= 73.8:
+            h_inmin = _PROPS_SUP.get_enthalpy_sup(gc_min_pres, minliq_temp)
+        elif gc_min_pres <= 72.13:
+            h_inmin = _PROPS.get_properties("R744", minliq_temp)["enthalpy_liquid2"]
+        else:
+            raise ValueError("This pressure range (72.13–73.8 bar) is not allowed. Please choose another value.")
+        h_inlet = h_in
+        h_inletmin = h_inmin
+        p_evap = _PROPS.get_properties("R744", T_evap)
+        h_evap = p_evap["enthalpy_vapor"]
+        h_10K = p_evap["enthalpy_super"]
+    else:
+        p_cond = _PROPS.get_properties(refrigerant, T_cond)
+        p_min = _PROPS.get_properties(refrigerant, minliq_temp)
+        p_evap = _PROPS.get_properties(refrigerant, T_evap)
+
+        h_in = p_cond["enthalpy_liquid2"]
+        # for velocity
+        h_inmin = p_min["enthalpy_liquid2"]
+        h_inlet = p_cond["enthalpy_liquid"]
+        h_inletmin = p_min["enthalpy_liquid"]
+        h_evap = p_evap["enthalpy_vapor"]
+        h_10K = p_evap["enthalpy_super"]
+
+    hdiff_10K = h_10K - h_evap
+    hdiff_custom = hdiff_10K * min(max(superheat_K, 5), 30) / 10
+    h_super = h_evap + hdiff_custom
+    h_foroil = (h_evap + h_super) / 2
+
+    delta_h = h_evap - h_in
+    delta_hmin = h_evap - h_inmin
+
+    delta_h_foroil = h_foroil - h_inlet
+    delta_h_foroilmin = h_foroil - h_inletmin
+
+    mass_flow_kg_s = evap_capacity_kw / delta_h if delta_h > 0 else 0.01
+    mass_flow_kg_smin = evap_capacity_kw / delta_hmin if delta_hmin > 0 else 0.01
+
+    return {
+        "h_in": h_in,
+        "h_inmin": h_inmin,
+        "mass_flow_kg_s": mass_flow_kg_s,
+        "mass_flow_kg_smin": mass_flow_kg_smin,
+        "M_total": max(mass_flow_kg_s, mass_flow_kg_smin),
+        "mass_flow_foroil": evap_capacity_kw / delta_h_foroil if delta_h_foroil > 0 else 0.01,
+        "mass_flow_foroilmin": evap_capacity_kw / delta_h_foroilmin if delta_h_foroilmin > 0 else 0.01,
+    }
+
+def compute_mor_factors(refrigerant, T_evap, T_cond, minliq_temp, superheat_K, h_in, h_inmin):
+    """Bore-independent half of the MOR stage.
+
+    Oil density, jg_half and the three MOR corrections depend only on the
+    operating point, so a sweep over pipe sizes needs them once.
+    """
+    oil_density_sat, oil_density_super = get_oil_density(
+        refrigerant, np.array([T_evap, T_evap + min(max(superheat_K, 5), 30)])
+    )
+    oil_density = float(oil_density_sat + oil_density_super) / 2
+
+    if refrigerant in R23_LIKE:
+        MOR_correctliq = T_cond + 47.03
+        MOR_correctliqmin = minliq_temp + 47.03
+        evapoil = T_evap + 46.14
+        in_range = -86 <= T_evap <= -42
+    else:
+        MOR_correctliq = T_cond
+        MOR_correctliqmin = minliq_temp
+        evapoil = T_evap
+        in_range = -40 <= T_evap <= 4
+
+    MOR_correction, MOR_correctionmin, MOR_correction2 = get_mor_corrections(
+        refrigerant, MOR_correctliq, MOR_correctliqmin, evapoil, h_in, h_inmin,
+    )
+
+    return {
+        "oil_density": oil_density,
+        "jg_half": get_jg_half(refrigerant),
+        "MOR_correction": MOR_correction,
+        "MOR_correctionmin": MOR_correctionmin,
+        "MOR_correction2": MOR_correction2,
+        "in_range": in_range,
+    }
+
+def mor_final(factors, ID_m, area_m2, density_foroil, mass_flow_foroil, mass_flow_foroilmin):
+    """MORfinal for one bore or an array of bores.
+
+    NaN when T_evap is outside the correlation's validity window.
+    """
+    MinMassFlux = (factors["jg_half"] ** 2) * np.sqrt(
+        density_foroil * 9.81 * ID_m * (factors["oil_density"] - density_foroil)
+    )
+    MinMassFlow = MinMassFlux * area_m2
+    if not factors["in_range"]:
+        return np.full_like(MinMassFlow, np.nan)
+
+    correction2 = 1 - factors["MOR_correction2"]
+    return np.maximum(
+        (1 - factors["MOR_correction"]) * correction2 * ((MinMassFlow / mass_flow_foroil) * 100),
+        (1 - factors["MOR_correctionmin"]) * correction2 * ((MinMassFlow / mass_flow_foroilmin) * 100),
+    )
+
+def compute_mor(refrigerant, T_evap, T_cond, minliq_temp, superheat_K, ID_m, area_m2,
+                density_foroil, mass_flow_foroil, mass_flow_foroilmin, h_in, h_inmin):
+    """Minimum oil return stage, from the suction state at the riser.
+
+    Scalar wrapper shared by every suction sizer. MORfinal is NaN when
+    T_evap is outside the correlation's validity window.
+    """
+    factors = compute_mor_factors(refrigerant, T_evap, T_cond, minliq_temp, superheat_K, h_in, h_inmin)
+    MORfinal = float(mor_final(
+        factors, ID_m, area_m2, density_foroil, mass_flow_foroil, mass_flow_foroilmin,
+    ))
+
+    return {
+        "oil_density": factors["oil_density"],
+        "jg_half": factors["jg_half"],
+        "MOR_correction": factors["MOR_correction"],
+        "MOR_correctionmin": factors["MOR_correctionmin"],
+        "MOR_correction2": factors["MOR_correction2"],
+        "MORfinal": MORfinal,
+    }
+
+def compute_oil_return(refrigerant, T_evap, T_cond, minliq_temp, superheat_K, max_penalty,
+                       evap_capacity_kw, ID_mm, gc_max_pres=None, gc_min_pres=None):
+    """Minimum oil return (MOR) for a single suction riser.
+
+    MORfinal and MinCap are NaN when T_evap is outside the correlation's
+    validity window or no bore is given.
+    """
+    flows = compute_mass_flows(
+        refrigerant, T_evap, T_cond, minliq_temp, superheat_K, evap_capacity_kw,
+        gc_max_pres, gc_min_pres,
+    )
+    mass_flow_foroil = flows["mass_flow_foroil"]
+    mass_flow_foroilmin = flows["mass_flow_foroilmin"]
+
+    results = {
+        "M_total": flows["M_total"],
+        "mass_flow_foroil": mass_flow_foroil,
+        "mass_flow_foroilmin": mass_flow_foroilmin,
+        "velocity_m_sfinal": None,
+        "MORfinal": math.nan,
+        "MinCap": math.nan,
+    }
+    if ID_mm is None:
+        return results
+
+    # Everything below depends on the pipe bore
+    mass_flow_kg_s = flows["mass_flow_kg_s"]
+    mass_flow_kg_smin = flows["mass_flow_kg_smin"]
+    sh_clamped = min(max(superheat_K, 5), 30)
+
+    ID_m = ID_mm / 1000.0
+    area_m2 = _PI * (ID_m * 0.5) ** 2
+
+    # Transcritical CO2 uses the subcritical R744 density tables on the suction side
+    dens_ref = "R744" if refrigerant == "R744 TC" else refrigerant
+    T_evap_K = T_evap + 273.15
+    density_super, density_super2a, density_super2b, density_super_foroil, density_5K = _DENS.get_densities(
+        dens_ref,
+        [
+            T_evap - max_penalty + 273.15,
+            T_evap_K,
+            T_evap - max_penalty + 273.15,
+            T_evap_K,
+            T_evap_K,
+        ],
+        [
+            superheat_K,
+            (superheat_K + 5) / 2,
+            (superheat_K + 5) / 2,
+            sh_clamped,
+            5,
+        ],
+    )
+    density_super2 = (density_super2a + density_super2b) / 2
+    density_sat = _PROPS.get_properties(dens_ref, T_evap)["density_vapor"]
+
+    density = (density_super + density_5K) / 2
+    density_foroil = (density_super_foroil + density_sat) / 2
+    velocity_m_s1 = mass_flow_kg_s / (area_m2 * density)
+    velocity_m_s1min = mass_flow_kg_smin / (area_m2 * density)
+    velocity_m_s2 = mass_flow_kg_s / (area_m2 * density_super2)
+    velocity_m_s2min = mass_flow_kg_smin / (area_m2 * density_super2)
+    velocity1_prop = get_velocity1_prop(refrigerant, superheat_K)
+    velocity_m_s = (velocity_m_s1 * velocity1_prop) + (velocity_m_s2 * (1 - velocity1_prop))
+    velocity_m_smin = (velocity_m_s1min * velocity1_prop) + (velocity_m_s2min * (1 - velocity1_prop))
+
+    mor = compute_mor(
+        refrigerant, T_evap, T_cond, minliq_temp, superheat_K, ID_m, area_m2,
+        density_foroil, mass_flow_foroil, mass_flow_foroilmin, flows["h_in"], flows["h_inmin"],
+    )
+    MORfinal = float(mor["MORfinal"])
+    MinCap = MORfinal * evap_capacity_kw / 100
+
+    results.update(mor)
+    results.update({
+        "velocity_m_sfinal": max(velocity_m_s, velocity_m_smin),
+        "density_foroil": density_foroil,
+        "MORfinal": MORfinal,
+        "MinCap": MinCap,
+    })
+    return results
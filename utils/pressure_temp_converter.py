@@ -2,8 +2,105 @@
 
 import numpy as np
 import math
+from functools import lru_cache
+from utils.property_grid import load_tables
 from utils.refrigerant_properties import RefrigerantProperties
 
+@lru_cache(maxsize=8192)
+def _pressure_to_temp(data_path, refrigerant, target_pressure_bar):
+    # Module-level cache shared by every converter instance; callers round the
+    # pressure so near-identical sweep pressures land on the same key
+    data = load_tables(data_path)[refrigerant]
+    pressures = data["pressure_bar"]
+    temperatures = data["temperature_C"]
+
+    for i in range(len(pressures) - 1):
+        if pressures[i] <= target_pressure_bar <= pressures[i + 1]:
+            x1, x2 = pressures[i], pressures[i + 1]
+            y1, y2 = temperatures[i], temperatures[i + 1]
+
+            ln_x1, ln_x2 = math.log(x1), math.log(x2)
+            ln_target = math.log(target_pressure_bar)
+            slope = (y2 - y1) / (ln_x2 - ln_x1)
+            return y1 + slope * (ln_target - ln_x1)
+
+    # Outside range — clamp to min or max
+    if target_pressure_bar < pressures[0]:
+        return temperatures[0]
+    else:
+        return temperatures[-1]
+
+@lru_cache(maxsize=8192)
+def _temp_to_pressure(data_path, refrigerant, temperature_C):
+    data = load_tables(data_path)[refrigerant]
+    pressures = data["pressure_bar"]
+    temperatures = data["temperature_C"]
+
+    for i in range(len(temperatures) - 1):
+        if temperatures[i] <= temperature_C <= temperatures[i + 1]:
+            y1, y2 = temperatures[i], temperatures[i + 1]
+            x1, x2 = pressures[i], pressures[i + 1]
+
+            ln_x1, ln_x2 = math.log(x1), math.log(x2)
+            slope = (y2 - y1) / (ln_x2 - ln_x1)
+
+            # Rearranged to get ln(P) from T: ln(P) = (T - y1)/slope + ln(x1)
+            ln_target = (temperature_C - y1) / slope + math.log(x1)
+            return math.exp(ln_target)
+
+    # Outside range — clamp to min or max
+    if temperature_C < temperatures[0]:
+        return pressures[0]
+    else:
+        return pressures[-1]
+
+@lru_cache(maxsize=8192)
+def _pressure2_to_temp(data_path, refrigerant, target_pressure_bar):
+    # Bubble-point counterparts of the two above, cached the same way
+    data = load_tables(data_path)[refrigerant]
+    temps = np.array(data["bubblepoint_C"])
+    pressures = np.array(data["pressure_bar"])
+
+    for i in range(len(pressures) - 1):
+        if pressures[i] <= target_pressure_bar <= pressures[i + 1]:
+            x1, x2 = pressures[i], pressures[i + 1]
+            y1, y2 = temps[i], temps[i + 1]
+
+            ln_x1, ln_x2 = math.log(x1), math.log(x2)
+            ln_target = math.log(target_pressure_bar)
+            slope = (y2 - y1) / (ln_x2 - ln_x1)
+
+            return y1 + slope * (ln_target - ln_x1)
+
+    # Clamp
+    if target_pressure_bar < pressures[0]:
+        return temps[0]
+    else:
+        return temps[-1]
+
+@lru_cache(maxsize=8192)
+def _temp_to_pressure2(data_path, refrigerant, temperature_C):
+    data = load_tables(data_path)[refrigerant]
+    temps = np.array(data["bubblepoint_C"])
+    pressures = np.array(data["pressure_bar"])
+
+    for i in range(len(temps) - 1):
+        if temps[i] <= temperature_C <= temps[i + 1]:
+            y1, y2 = temps[i], temps[i + 1]
+            x1, x2 = pressures[i], pressures[i + 1]
+
+            ln_x1, ln_x2 = math.log(x1), math.log(x2)
+            slope = (y2 - y1) / (ln_x2 - ln_x1)
+
+            ln_target = (temperature_C - y1) / slope + ln_x1
+            return math.exp(ln_target)
+
+    # Clamp
+    if temperature_C < temps[0]:
+        return pressures[0]
+    else:
+        return pressures[-1]
+
 class PressureTemperatureConverter:
     def __init__(self):
         self.refrigerant_props = RefrigerantProperties()
@@ -11,55 +108,43 @@ class PressureTemperatureConverter:
     def pressure_to_temp(self, refrigerant, target_pressure_bar):
         """
         Find saturation temperature for a given pressure using ln interpolation.
-        """
-        data = self.refrigerant_props.tables[refrigerant]
-        pressures = data["pressure_bar"]
-        temperatures = data["temperature_C"]
-
-        for i in range(len(pressures) - 1):
-            if pressures[i] <= target_pressure_bar <= pressures[i + 1]:
-                x1, x2 = pressures[i], pressures[i + 1]
-                y1, y2 = temperatures[i], temperatures[i + 1]
 
-                import math
-                ln_x1, ln_x2 = math.log(x1), math.log(x2)
-                ln_target = math.log(target_pressure_bar)
-                slope = (y2 - y1) / (ln_x2 - ln_x1)
-                return y1 + slope * (ln_target - ln_x1)
-
-        # Outside range — clamp to min or max
-        if target_pressure_bar < pressures[0]:
-            return temperatures[0]
-        else:
-            return temperatures[-1]
+        Results are memoized per (refrigerant, pressure rounded to 1e-4 bar).
+        """
+        return _pressure_to_temp(
+            self.refrigerant_props.data_path, refrigerant, round(float(target_pressure_bar), 4)
+        )
 
     def temp_to_pressure(self, refrigerant, temperature_C):
         """
         Find saturation pressure for a given temperature using ln interpolation.
+
+        Results are memoized per (refrigerant, temperature rounded to 1e-4 °C).
         """
-        import math
+        return _temp_to_pressure(self.refrigerant_props.data_path, refrigerant, round(float(temperature_C), 4))
 
+    def pressure_to_temp_array(self, refrigerant, target_pressures_bar):
+        """
+        Vectorised pressure_to_temp: same ln interpolation and end clamping,
+        applied to a whole array of pressures at once. NaN pressures give NaN.
+        """
         data = self.refrigerant_props.tables[refrigerant]
-        pressures = data["pressure_bar"]
-        temperatures = data["temperature_C"]
+        pressures = np.asarray(data["pressure_bar"], dtype=float)
+        temperatures = np.asarray(data["temperature_C"], dtype=float)
+        target = np.asarray(target_pressures_bar, dtype=float)
 
-        for i in range(len(temperatures) - 1):
-            if temperatures[i] <= temperature_C <= temperatures[i + 1]:
-                y1, y2 = temperatures[i], temperatures[i + 1]
-                x1, x2 = pressures[i], pressures[i + 1]
+        i = np.clip(np.searchsorted(pressures, target, side="left") - 1, 0, len(pressures) - 2)
+        x1, x2 = pressures[i], pressures[i + 1]
+        y1, y2 = temperatures[i], temperatures[i + 1]
 
-                ln_x1, ln_x2 = math.log(x1), math.log(x2)
-                slope = (y2 - y1) / (ln_x2 - ln_x1)
-
-                # Rearranged to get ln(P) from T: ln(P) = (T - y1)/slope + ln(x1)
-                ln_target = (temperature_C - y1) / slope + math.log(x1)
-                return math.exp(ln_target)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ln_x1 = np.log(x1)
+            slope = (y2 - y1) / (np.log(x2) - ln_x1)
+            result = y1 + slope * (np.log(target) - ln_x1)
 
         # Outside range — clamp to min or max
-        if temperature_C < temperatures[0]:
-            return pressures[0]
-        else:
-            return pressures[-1]
+        result = np.where(target < pressures[0], temperatures[0], result)
+        return np.where(target > pressures[-1], temperatures[-1], result)
 
     def pressure_drop_to_temp_penalty(self, refrigerant, sat_temp_C, pressure_drop_kPa):
         data = self.refrigerant_props.tables[refrigerant]
@@ -111,54 +196,21 @@ class PressureTemperatureConverter:
         """
         Convert pressure_bar2 → temperature using ln interpolation.
         Uses: bubblepoint_C vs pressure_bar
-        """
-        data = self.refrigerant_props.tables[refrigerant]
-        temps = np.array(data["bubblepoint_C"])
-        pressures = np.array(data["pressure_bar"])
-
-        for i in range(len(pressures) - 1):
-            if pressures[i] <= target_pressure_bar <= pressures[i + 1]:
-                x1, x2 = pressures[i], pressures[i + 1]
-                y1, y2 = temps[i], temps[i + 1]
-
-                ln_x1, ln_x2 = math.log(x1), math.log(x2)
-                ln_target = math.log(target_pressure_bar)
-                slope = (y2 - y1) / (ln_x2 - ln_x1)
-
-                return y1 + slope * (ln_target - ln_x1)
-
-        # Clamp
-        if target_pressure_bar < pressures[0]:
-            return temps[0]
-        else:
-            return temps[-1]
 
+        Results are memoized per (refrigerant, pressure rounded to 1e-4 bar).
+        """
+        return _pressure2_to_temp(
+            self.refrigerant_props.data_path, refrigerant, round(float(target_pressure_bar), 4)
+        )
 
     def temp_to_pressure2(self, refrigerant, temperature_C):
         """
         Convert temperature → pressure_bar2 using ln interpolation.
         Uses: bubblepoint_C vs pressure_bar
-        """
-        data = self.refrigerant_props.tables[refrigerant]
-        temps = np.array(data["bubblepoint_C"])
-        pressures = np.array(data["pressure_bar"])
-
-        for i in range(len(temps) - 1):
-            if temps[i] <= temperature_C <= temps[i + 1]:
-                y1, y2 = temps[i], temps[i + 1]
-                x1, x2 = pressures[i], pressures[i + 1]
 
-                ln_x1, ln_x2 = math.log(x1), math.log(x2)
-                slope = (y2 - y1) / (ln_x2 - ln_x1)
-
-                ln_target = (temperature_C - y1) / slope + ln_x1
-                return math.exp(ln_target)
-
-        # Clamp
-        if temperature_C < temps[0]:
-            return pressures[0]
-        else:
-            return pressures[-1]
+        Results are memoized per (refrigerant, temperature rounded to 1e-4 °C).
+        """
+        return _temp_to_pressure2(self.refrigerant_props.data_path, refrigerant, round(float(temperature_C), 4))
 
 
     # --------------------------------------------------------
@@ -0,0 +1,84 @@
+# utils/property_grid.py
+
+import json
+import numpy as np
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def load_tables(data_path):
+    # Parsed once per process and shared read-only by every instance
+    with open(data_path, 'r') as file:
+        return json.load(file)
+
+@lru_cache(maxsize=None)
+def log_grid(data_path, refrigerant):
+    # (superheat axis, sorted evap temps, log-value matrix) for one refrigerant,
+    # built once per process instead of on every lookup
+    table = load_tables(data_path).get(refrigerant)
+    if table is None:
+        raise ValueError(f"Refrigerant '{refrigerant}' not found.")
+
+    superheat_axis = np.array(table["superheat"], dtype=np.float64)
+    evap_keys = [k for k in table if k != "superheat"]
+    evap_vals = np.array(sorted([float(k) for k in evap_keys]), dtype=np.float64)
+
+    data_matrix = np.array([table[k] for k in map(str, evap_vals)], dtype=np.float64)
+    return superheat_axis, evap_vals, np.log(data_matrix)
+
+def interp_log_grid(data_path, refrigerant, evap_temp_K, superheat_K):
+    """
+    2D log-linear interpolation of one (evap temp, superheat) point.
+
+    Returns the interpolated log value; callers exponentiate.
+    """
+    superheat_axis, evap_vals, log_data = log_grid(data_path, refrigerant)
+
+    # Only the two evap-temp rows bracketing evap_temp_K feed the final
+    # interpolation, so interpolate just those along superheat (x-direction)
+    j = int(np.clip(np.searchsorted(evap_vals, evap_temp_K, side="right") - 1, 0, len(evap_vals) - 2))
+    interp_log_z = np.array([
+        np.interp(superheat_K, superheat_axis, row)
+        for row in log_data[j:j + 2]
+    ])
+
+    # Then interpolate along evap temp (y-direction)
+    return np.interp(evap_temp_K, evap_vals[j:j + 2], interp_log_z)
+
+def _bracket(axis, x):
+    # Lower cell index and clamped query per point, matching np.interp's end clamping.
+    # maximum/minimum rather than np.clip: far less call overhead on short arrays.
+    x = np.minimum(np.maximum(x, axis[0]), axis[-1])
+    i = np.minimum(np.maximum(axis.searchsorted(x, side="right") - 1, 0), len(axis) - 2)
+    return i, x
+
+def interp_log_grids(data_path, refrigerant, evap_temps_K, superheats_K):
+    """
+    Vectorized interp_log_grid: each (evap temp, superheat) pair reads only its
+    own bracketing cell of the log grid, so cost scales with the number of
+    queries rather than with the number of evap-temp rows.
+    """
+    superheat_axis, evap_vals, log_data = log_grid(data_path, refrigerant)
+
+    j, T = _bracket(evap_vals, np.asarray(evap_temps_K, dtype=np.float64))
+    k, sh = _bracket(superheat_axis, np.asarray(superheats_K, dtype=np.float64))
+
+    # Superheat interpolation on the two bracketing evap-temp rows
+    x_slope = (sh - superheat_axis[k]) / (superheat_axis[k + 1] - superheat_axis[k])
+    z_lo = log_data[j, k] + x_slope * (log_data[j, k + 1] - log_data[j, k])
+    z_hi = log_data[j + 1, k] + x_slope * (log_data[j + 1, k + 1] - log_data[j + 1, k])
+
+    # Then along evap temp
+    y_slope = (T - evap_vals[j]) / (evap_vals[j + 1] - evap_vals[j])
+    return z_lo + y_slope * (z_hi - z_lo)
+
+def grid_value(data_path, refrigerant, evap_temp_K, superheat_K):
+    """
+    exp(interp_log_grid(...)) as a float, memoized per point rounded to 0.001 K.
+    """
+    return _grid_value(data_path, refrigerant, round(float(evap_temp_K), 3), round(float(superheat_K), 3))
+
+@lru_cache(maxsize=8192)
+def _grid_value(data_path, refrigerant, evap_temp_K, superheat_K):
+    # Module-level cache keyed on the table path, so every instance shares it
+    # and none is kept alive by it
+    return float(np.exp(interp_log_grid(data_path, refrigerant, evap_temp_K, superheat_K)))
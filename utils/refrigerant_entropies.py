@@ -1,43 +1,24 @@
 # utils/refrigerant_entropies.py
 
-import json
 import numpy as np
 import os
+from utils.property_grid import load_tables, interp_log_grid, log_grid
 
 class RefrigerantEntropies:
     def __init__(self):
         base_path = os.path.dirname(os.path.dirname(__file__))
         data_path = os.path.join(base_path, 'data', 'refrigerant_entropies.json')
-        with open(data_path, 'r') as file:
-            self.tables = json.load(file)
+        self.data_path = data_path
+        self.tables = load_tables(data_path)
 
     def get_entropy(self, refrigerant, evap_temp_K, superheat_K):
         """
         2D log-linear interpolation using linear input axes and log-transformed entropies.
-        """
-        table = self.tables.get(refrigerant)
-        if table is None:
-            raise ValueError(f"Refrigerant '{refrigerant}' not found.")
-
-        # Superheat axis and evap temp axis
-        superheat_axis = np.array(table["superheat"], dtype=np.float64)
-        evap_keys = [k for k in table if k != "superheat"]
-        evap_vals = np.array(sorted([float(k) for k in evap_keys]), dtype=np.float64)
-
-        # Data matrix (entropies), log-transformed
-        data_matrix = np.array([table[k] for k in map(str, evap_vals)], dtype=np.float64)
-        log_data = np.log(data_matrix)
 
-        # First interpolate along superheat (x-direction)
-        interp_log_z = np.array([
-            np.interp(superheat_K, superheat_axis, row)
-            for row in log_data
-        ])
-
-        # Then interpolate along evap temp (y-direction)
-        final_log_entropy = np.interp(evap_temp_K, evap_vals, interp_log_z)
-
-        return float(np.exp(final_log_entropy))
+        Not memoized: the discharge isentropic chain passes computed superheats here,
+        and rounded cache keys would shift its results.
+        """
+        return float(np.exp(interp_log_grid(self.data_path, refrigerant, evap_temp_K, superheat_K)))
 
     def get_superheat_from_entropy(self, refrigerant, evap_temp_K, entropy):
         """
@@ -54,18 +35,9 @@ class RefrigerantEntropies:
         - Assumes monotonic log-entropy vs superheat along each row (typical physically).
         - Out-of-range values are clamped to the edge by np.interp, mirroring get_entropy().
         """
-        table = self.tables.get(refrigerant)
-        if table is None:
-            raise ValueError(f"Refrigerant '{refrigerant}' not found.")
-
-        # Axes
-        superheat_axis = np.array(table["superheat"], dtype=np.float64)  # x
-        evap_keys = [k for k in table if k != "superheat"]
-        evap_vals = np.array(sorted([float(k) for k in evap_keys]), dtype=np.float64)  # y
-
-        # Data (z = entropy), stored as rows per evap temp, columns per superheat
-        data_matrix = np.array([table[k] for k in map(str, evap_vals)], dtype=np.float64)
-        log_data = np.log(data_matrix)
+        # Axes (x = superheat, y = evap temp) and log(entropy) rows per evap temp,
+        # built once per refrigerant by log_grid
+        superheat_axis, evap_vals, log_data = log_grid(self.data_path, refrigerant)
 
         target_log_s = float(np.log(entropy))
 
@@ -1,83 +1,105 @@
 # utils/refrigerant_properties.py
 
-import json
 import numpy as np
 import os
+from functools import lru_cache
+from types import MappingProxyType
 from scipy.interpolate import CubicSpline
+from utils.property_grid import load_tables
 import streamlit as st
 
+def _interpolate(x_array, y_array, x):
+    """Cubic spline interpolation with out-of-bounds protection."""
+    if x <= x_array[0]:
+        return y_array[0]
+    elif x >= x_array[-1]:
+        return y_array[-1]
+    else:
+        spline = CubicSpline(x_array, y_array, extrapolate=False)
+        # st.write("spline:", spline)
+        return float(spline(x))
+
+def _interpolate_log(x_array, y_array, x):
+    """Logarithmic interpolation with out-of-bounds protection."""
+    if x <= x_array[0]:
+        return y_array[0]
+    elif x >= x_array[-1]:
+        return y_array[-1]
+    else:
+        log_y_array = np.log(y_array)
+        log_y = np.interp(x, x_array, log_y_array)
+        return np.exp(log_y)
+
+@lru_cache(maxsize=4096)
+def _saturation_properties(data_path, refrigerant, temperature_C):
+    # Memoized per (table, refrigerant, temperature) at module level, so every
+    # RefrigerantProperties instance shares one cache and none is pinned by it.
+    # The mapping is read-only because the same object is handed to every caller.
+    tables = load_tables(data_path)
+    if refrigerant not in tables:
+        raise ValueError(f"Refrigerant '{refrigerant}' not found in database.")
+
+    data = tables[refrigerant]
+
+    temp_array = np.array(data["temperature_C"])
+    bubble_array = np.array(data["bubblepoint_C"])
+    pressure_array = np.array(data["pressure_bar"])
+    density_liquid_array = np.array(data["density_liquid"])
+    density_vapor_array = np.array(data["density_vapor"])
+    enthalpy_liquid_array = np.array(data["enthalpy_liquid"])
+    enthalpy_vapor_array = np.array(data["enthalpy_vapor"])
+    enthalpy_super_array = np.array(data["enthalpy_super"])
+    viscosity_liquid_array = np.array(data["viscosity_liquid"])
+
+    pressure_bar = _interpolate_log(temp_array, pressure_array, temperature_C)
+    pressure_bar2 = _interpolate_log(bubble_array, pressure_array, temperature_C)
+    density_liquid = _interpolate(temp_array, density_liquid_array, temperature_C)
+    density_liquid2 = _interpolate(bubble_array, density_liquid_array, temperature_C)
+    density_vapor = _interpolate_log(temp_array, density_vapor_array, temperature_C)
+    enthalpy_liquid = _interpolate(temp_array, enthalpy_liquid_array, temperature_C)
+    enthalpy_liquid2 = _interpolate(bubble_array, enthalpy_liquid_array, temperature_C)
+    enthalpy_vapor = _interpolate(temp_array, enthalpy_vapor_array, temperature_C)
+    enthalpy_super = _interpolate(temp_array, enthalpy_super_array, temperature_C)
+    viscosity_liquid = _interpolate(bubble_array, viscosity_liquid_array, temperature_C)
+    viscosity_liquid3 = _interpolate(temp_array, viscosity_liquid_array, temperature_C)
+
+    # st.write("temp_array:", temp_array)
+    # st.write("enthalpy_super_array:", enthalpy_super_array)
+    # st.write("temperature_C:", temperature_C)
+
+    return MappingProxyType({
+        "pressure_bar": pressure_bar,
+        "pressure_bar2": pressure_bar2,
+        "density_liquid": density_liquid,
+        "density_liquid2": density_liquid2,
+        "density_vapor": density_vapor,
+        "enthalpy_liquid": enthalpy_liquid,
+        "enthalpy_liquid2": enthalpy_liquid2,
+        "enthalpy_vapor": enthalpy_vapor,
+        "enthalpy_super": enthalpy_super,
+        "viscosity_liquid": viscosity_liquid,
+        "viscosity_liquid3": viscosity_liquid3
+    })
+
 class RefrigerantProperties:
     def __init__(self):
         base_path = os.path.dirname(os.path.dirname(__file__))
         data_path = os.path.join(base_path, 'data', 'refrigerant_tables.json')
-        with open(data_path, 'r') as file:
-            self.tables = json.load(file)
+        self.data_path = data_path
+        self.tables = load_tables(data_path)
 
     def interpolate(self, x_array, y_array, x):
         """Cubic spline interpolation with out-of-bounds protection."""
-        if x <= x_array[0]:
-            return y_array[0]
-        elif x >= x_array[-1]:
-            return y_array[-1]
-        else:
-            spline = CubicSpline(x_array, y_array, extrapolate=False)
-            # st.write("spline:", spline)
-            return float(spline(x))
-    
+        return _interpolate(x_array, y_array, x)
+
     def interpolate_log(self, x_array, y_array, x):
         """Logarithmic interpolation with out-of-bounds protection."""
-        if x <= x_array[0]:
-            return y_array[0]
-        elif x >= x_array[-1]:
-            return y_array[-1]
-        else:
-            log_y_array = np.log(y_array)
-            log_y = np.interp(x, x_array, log_y_array)
-            return np.exp(log_y)
+        return _interpolate_log(x_array, y_array, x)
 
     def get_properties(self, refrigerant, temperature_C):
-        """Return pressure, densities, enthalpies at given temperature."""
-        if refrigerant not in self.tables:
-            raise ValueError(f"Refrigerant '{refrigerant}' not found in database.")
-
-        data = self.tables[refrigerant]
-
-        temp_array = np.array(data["temperature_C"])
-        bubble_array = np.array(data["bubblepoint_C"])
-        pressure_array = np.array(data["pressure_bar"])
-        density_liquid_array = np.array(data["density_liquid"])
-        density_vapor_array = np.array(data["density_vapor"])
-        enthalpy_liquid_array = np.array(data["enthalpy_liquid"])
-        enthalpy_vapor_array = np.array(data["enthalpy_vapor"])
-        enthalpy_super_array = np.array(data["enthalpy_super"])
-        viscosity_liquid_array = np.array(data["viscosity_liquid"])
-        
-        pressure_bar = self.interpolate_log(temp_array, pressure_array, temperature_C)
-        pressure_bar2 = self.interpolate_log(bubble_array, pressure_array, temperature_C)
-        density_liquid = self.interpolate(temp_array, density_liquid_array, temperature_C)
-        density_liquid2 = self.interpolate(bubble_array, density_liquid_array, temperature_C)
-        density_vapor = self.interpolate_log(temp_array, density_vapor_array, temperature_C)
-        enthalpy_liquid = self.interpolate(temp_array, enthalpy_liquid_array, temperature_C)
-        enthalpy_liquid2 = self.interpolate(bubble_array, enthalpy_liquid_array, temperature_C)
-        enthalpy_vapor = self.interpolate(temp_array, enthalpy_vapor_array, temperature_C)
-        enthalpy_super = self.interpolate(temp_array, enthalpy_super_array, temperature_C)
-        viscosity_liquid = self.interpolate(bubble_array, viscosity_liquid_array, temperature_C)
-        viscosity_liquid3 = self.interpolate(temp_array, viscosity_liquid_array, temperature_C)
+        """Return pressure, densities, enthalpies at given temperature.
 
-        # st.write("temp_array:", temp_array)
-        # st.write("enthalpy_super_array:", enthalpy_super_array)
-        # st.write("temperature_C:", temperature_C)
-        
-        return {
-            "pressure_bar": pressure_bar,
-            "pressure_bar2": pressure_bar2,
-            "density_liquid": density_liquid,
-            "density_liquid2": density_liquid2,
-            "density_vapor": density_vapor,
-            "enthalpy_liquid": enthalpy_liquid,
-            "enthalpy_liquid2": enthalpy_liquid2,
-            "enthalpy_vapor": enthalpy_vapor,
-            "enthalpy_super": enthalpy_super,
-            "viscosity_liquid": viscosity_liquid,
-            "viscosity_liquid3": viscosity_liquid3
-        }
+        Results are memoized per (refrigerant, temperature rounded to 0.001 °C)
+        and returned as a read-only mapping.
+        """
+        return _saturation_properties(self.data_path, refrigerant, round(float(temperature_C), 3))
@@ -0,0 +1,19 @@
+# utils/shared_props.py
+
+# One process-wide instance per property helper. app.py and the checker modules
+# all import these, so every lookup goes through the same object per class.
+from utils.refrigerant_properties import RefrigerantProperties
+from utils.refrigerant_densities import RefrigerantDensities
+from utils.refrigerant_viscosities import RefrigerantViscosities
+from utils.supercompliq_co2 import RefrigerantProps
+from utils.pressure_temp_converter import PressureTemperatureConverter
+from utils.refrigerant_entropies import RefrigerantEntropies
+from utils.refrigerant_enthalpies import RefrigerantEnthalpies
+
+PROPS = RefrigerantProperties()
+PROPS_SUP = RefrigerantProps()
+DENS = RefrigerantDensities()
+VISC = RefrigerantViscosities()
+CONV = PressureTemperatureConverter()
+ENTROPIES = RefrigerantEntropies()
+ENTHALPIES = RefrigerantEnthalpies()
@@ -54,7 +54,7 @@ def k65_copper_pipe_stress_mpa(temp_c: float) -> float:
     A5 = -2.00885764117952E-10
     A6 = 2.5573812776535E-13
 
-    return A0 + (A1 * T2) + (A2 * T2**2) + (A3 * T2**3) + (A4 * T2**4) + (A5 * T2**5) + (A6 * T2**6)
+    return A0 + T2 * (A1 + T2 * (A2 + T2 * (A3 + T2 * (A4 + T2 * (A5 + T2 * A6)))))
 
 def aluminium_pipe_stress_mpa(temp_c: float) -> float:
     T2 = (temp_c * 1.8) + 32
@@ -67,7 +67,7 @@ def aluminium_pipe_stress_mpa(temp_c: float) -> float:
     A5 = 1.12102053282222E-15
     A6 = -7.46321063659667E-19
     
-    return ((A0 + (A1 * T2) + (A2 * T2**2) + (A3 * T2**3) + (A4 * T2**4) + (A5 * T2**5) + (A6 * T2**6)) / 1000) * 6.895
+    return ((A0 + T2 * (A1 + T2 * (A2 + T2 * (A3 + T2 * (A4 + T2 * (A5 + T2 * A6)))))) / 1000) * 6.895
 
 def bsen_mpa(temp_c: float) -> float:
     T2 = temp_c
@@ -79,7 +79,7 @@ def bsen_mpa(temp_c: float) -> float:
     A4 = -7.87619048051395E-07
     A5 = 1.56190476273047E-09
     
-    return A0 + (A1 * T2) + (A2 * T2**2) + (A3 * T2**3) + (A4 * T2**4) + (A5 * T2**5)
+    return A0 + T2 * (A1 + T2 * (A2 + T2 * (A3 + T2 * (A4 + T2 * A5))))
 
 def bsen_dki_mpa(temp_c: float) -> float:
     T2 = temp_c
@@ -88,7 +88,7 @@ def bsen_dki_mpa(temp_c: float) -> float:
     A1 = 0.0999999999999837
     A2 = -0.00119999999999987
     
-    return A0 + (A1 * T2) + (A2 * T2**2)
+    return A0 + T2 * (A1 + T2 * A2)
 
 def allowable_stress(
     *,
@@ -255,7 +255,7 @@ def calc_mwp(
 
     return mwp_bar
 
-from utils.refrigerant_properties import RefrigerantProperties
+from utils.shared_props import PROPS as _PROPS
 
 def calc_design_pressure_bar_g(
     *,
@@ -271,8 +271,7 @@ def calc_design_pressure_bar_g(
             raise ValueError("R744 transcritical design pressure must be provided")
         return r744_tc_pressure_bar_g
 
-    props = RefrigerantProperties()
-    data = props.get_properties(refrigerant, design_temp_c)
+    data = _PROPS.get_properties(refrigerant, design_temp_c)
 
     # VB logic:
     # Liquid / Pumped → bubble point
@@ -532,7 +531,7 @@ def pipe_stress_psi(temp_f: float) -> float:
     A4 = 1.87333522081964E-04
     A5 = -3.14666979085113E-07
     A6 = 2.13333541253137E-10
-    return A0 + (A1 * T2) + (A2 * T2**2) + (A3 * T2**3) + (A4 * T2**4) + (A5 * T2**5) + (A6 * T2**6)
+    return A0 + T2 * (A1 + T2 * (A2 + T2 * (A3 + T2 * (A4 + T2 * (A5 + T2 * A6)))))
 
 def steel_weld_stresses_by_size(od_mm: float) -> dict[str, float]:
     """